@@ -2,41 +2,87 @@
 Tourism AI Agent - Main agent configuration using Mistral API with GPT-OSS-20B model
 """
 import os
-import json
+import asyncio
+import inspect
+import functools
+import threading
+import httpx
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Callable, Iterator, AsyncIterator
+from pydantic import Field
 from dotenv import load_dotenv
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.prompts import PromptTemplate
 from langchain_core.language_models.llms import LLM
-from langchain_core.callbacks.manager import CallbackManagerForLLMRun
-from tools import get_weather, get_tourist_places
+from langchain_core.callbacks.manager import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
+from langchain_core.outputs import GenerationChunk
+from tools import get_weather, get_tourist_places, get_place_info, turn_scope
+from agents import TourismAgent
+from llm_cache import llm_cache, make_cache_key
+from llm_batcher import LLMBatcher, BATCH_DISABLED
+from sse_parser import SSE_DONE, parse_sse_line, parse_json_completion
+from mistral_client import MISTRAL_API_URL, MISTRAL_MODEL, LoopBoundClient
 
 # Load environment variables
 load_dotenv()
 
+# One batcher per distinct LLM configuration, shared by every instance with that configuration
+_BATCHERS: Dict[tuple, LLMBatcher] = {}
+_BATCHERS_LOCK = threading.Lock()
+
+# (connect, read) timeout: fail fast when the endpoint is unreachable, cap a stalled stream at 30s
+MISTRAL_TIMEOUT = (5, 30)
+
+# Most Mistral requests in flight at once per path (sync and async); size it to the provider's rate limit
+MISTRAL_CONCURRENCY = int(os.getenv("MISTRAL_CONCURRENCY", "8"))
+_SYNC_LIMIT = threading.BoundedSemaphore(MISTRAL_CONCURRENCY)
+
+# Shared HTTP session so keep-alive reuses the TCP/TLS connection across LLM calls.
+# POST is not retried by default; a completion request has no side effects, so opt it in.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"POST"}
+        )
+    )
+)
+
+
+# Async client and concurrency limit used by the _acall/_astream path, one of each per event loop
+_ASYNC_CLIENT = LoopBoundClient(
+    lambda: httpx.AsyncClient(
+        timeout=httpx.Timeout(MISTRAL_TIMEOUT[1], connect=MISTRAL_TIMEOUT[0]),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        transport=httpx.AsyncHTTPTransport(retries=3)  # connection errors only; httpx has no status retry
+    ),
+    concurrency=MISTRAL_CONCURRENCY
+)
+
 
 class MistralGPTOSS(LLM):
     """Custom LLM wrapper for Mistral API with openai/gpt-oss-20b model"""
     
-    api_key: str = os.getenv("mistral_api_key", "")
-    model: str = "openai/gpt-oss-20b"
+    # Read when the instance is built, not frozen at import time
+    api_key: str = Field(default_factory=lambda: os.getenv("mistral_api_key", ""))
+    model: str = MISTRAL_MODEL
     temperature: float = 0.7
-    max_tokens: int = 500
+    max_tokens: int = 200  # a ReAct step is a short Thought/Action; stop sequences end it early
     
     @property
     def _llm_type(self) -> str:
         return "mistral_gpt_oss"
     
-    def _call(
-        self,
-        prompt: str,
-        stop: List[str] | None = None,
-        run_manager: CallbackManagerForLLMRun | None = None,
-        **kwargs: Any,
-    ) -> str:
-        """Call the Mistral API with GPT-OSS-20B model and handle SSE streaming"""
-        url = "https://platform.qubrid.com/api/v1/qubridai/chat/completions"
+    def _request(self, prompt: str, max_tokens: int | None = None, stop: List[str] | None = None) -> tuple:
+        """Build the headers and JSON body for one chat completion request"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -51,46 +97,204 @@ class MistralGPTOSS(LLM):
                 }
             ],
             "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-            "stream": False
+            "max_tokens": max_tokens or self.max_tokens,
+            "stream": True
         }
+        if stop:
+            data["stop"] = stop
+        return headers, data
+    
+    def _cache_key(self, prompt: str, stop: List[str] | None) -> str | None:
+        """Cache key for this prompt, or None when caching does not apply"""
+        if not llm_cache.enabled_for(self.temperature):
+            return None
+        return make_cache_key(self.model, self.temperature, self.max_tokens, prompt, stop)
+    
+    def _finish(self, full_content: str, cache_key: str | None, stop: List[str] | None) -> str:
+        """Enforce stop sequences, apply the empty-response fallback and store successful completions"""
+        # Batched answers are generated without upstream stop sequences, so cut them here
+        for sequence in stop or []:
+            full_content = full_content.split(sequence, 1)[0]
+        if not full_content:
+            return "I apologize, but I couldn't generate a response."
+        if cache_key:
+            llm_cache.set(cache_key, full_content)
+        return full_content
+    
+    def _call(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Call the Mistral API with GPT-OSS-20B model and return the full completion"""
+        cache_key = self._cache_key(prompt, stop)
+        if cache_key:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            if BATCH_DISABLED:
+                full_content = "".join(
+                    chunk.text for chunk in self._stream(prompt, stop=stop, run_manager=run_manager, **kwargs)
+                )
+            else:
+                # Concurrent prompts are coalesced into a single upstream request
+                on_token = run_manager.on_llm_new_token if run_manager else None
+                full_content = self._get_batcher().submit(prompt, stop, on_token)
+        except requests.exceptions.RequestException as e:
+            return f"Error connecting to AI service: {str(e)}"
+        except Exception as e:
+            return f"Unexpected error: {str(e)}"
+        
+        return self._finish(full_content, cache_key, stop)
+    
+    async def _acall(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Async variant of _call - awaits the API without blocking the event loop"""
+        cache_key = self._cache_key(prompt, stop)
+        if cache_key:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            if BATCH_DISABLED:
+                chunks = []
+                async for chunk in self._astream(prompt, stop=stop, run_manager=run_manager, **kwargs):
+                    chunks.append(chunk.text)
+                full_content = "".join(chunks)
+            else:
+                if run_manager:
+                    loop = asyncio.get_running_loop()
+                    
+                    def on_token(token: str):
+                        # Tokens arrive on the batcher loop; run the async callbacks back on this loop,
+                        # awaited there one by one so they stay in order without blocking the batcher
+                        return asyncio.wrap_future(
+                            asyncio.run_coroutine_threadsafe(run_manager.on_llm_new_token(token), loop)
+                        )
+                else:
+                    on_token = None
+                full_content = await self._get_batcher().asubmit(prompt, stop, on_token)
+        except (requests.exceptions.RequestException, httpx.HTTPError) as e:
+            return f"Error connecting to AI service: {str(e)}"
+        except Exception as e:
+            return f"Unexpected error: {str(e)}"
+        
+        return self._finish(full_content, cache_key, stop)
+    
+    def _get_batcher(self) -> LLMBatcher:
+        """Return the shared batcher for this model configuration"""
+        key = (self.api_key, self.model, self.temperature, self.max_tokens)
+        with _BATCHERS_LOCK:
+            batcher = _BATCHERS.get(key)
+            if batcher is None:
+                batcher = LLMBatcher(self._complete, max_tokens=self.max_tokens, acomplete=self._acomplete)
+                _BATCHERS[key] = batcher
+        return batcher
+    
+    def _complete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        stop: List[str] | None,
+        on_token: Callable[[str], None] | None
+    ) -> str:
+        """Blocking single-request completion used by the batcher, reporting each token to on_token"""
+        chunks = []
+        for chunk in self._stream(prompt, stop=stop, max_tokens=max_tokens):
+            if on_token:
+                on_token(chunk.text)
+            chunks.append(chunk.text)
+        return "".join(chunks)
+    
+    async def _acomplete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        stop: List[str] | None,
+        on_token: Callable[[str], Any] | None
+    ) -> str:
+        """Async single-request completion used by the batcher for asubmit() prompts, over _astream"""
+        chunks = []
+        async for chunk in self._astream(prompt, stop=stop, max_tokens=max_tokens):
+            if on_token:
+                result = on_token(chunk.text)
+                if inspect.isawaitable(result):
+                    await result
+            chunks.append(chunk.text)
+        return "".join(chunks)
+    
+    def _stream(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[GenerationChunk]:
+        """Call the Mistral API and yield completion tokens as the SSE events arrive"""
+        headers, data = self._request(prompt, kwargs.get("max_tokens"), stop)
+        
+        with _SYNC_LIMIT, _SESSION.post(
+            MISTRAL_API_URL, headers=headers, json=data, timeout=MISTRAL_TIMEOUT, stream=True
+        ) as response:
             response.raise_for_status()
             
             # Handle SSE streaming response (API always streams)
             if 'text/event-stream' in response.headers.get('Content-Type', ''):
-                full_content = ""
-                lines = response.text.split('\n')
-                
-                for line in lines:
-                    if line.startswith('data: '):
-                        data_str = line[6:].strip()
-                        if data_str and data_str != '[DONE]':
-                            try:
-                                chunk = json.loads(data_str)
-                                if "choices" in chunk and len(chunk["choices"]) > 0:
-                                    delta = chunk["choices"][0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    if content:
-                                        full_content += content
-                            except json.JSONDecodeError:
-                                continue
-                
-                return full_content if full_content else "I apologize, but I couldn't generate a response."
+                # iter_lines buffers partial lines itself; stay in bytes and skip the text decode
+                for line in response.iter_lines():
+                    content = parse_sse_line(line)
+                    if content is SSE_DONE:
+                        break
+                    if content:
+                        generation = GenerationChunk(text=content)
+                        if run_manager:
+                            run_manager.on_llm_new_token(content, chunk=generation)
+                        yield generation
             else:
                 # Handle regular JSON response (if ever supported)
-                result = response.json()
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    return "I apologize, but I couldn't generate a response."
-                
-        except requests.exceptions.RequestException as e:
-            return f"Error connecting to AI service: {str(e)}"
-        except Exception as e:
-            return f"Unexpected error: {str(e)}"
+                content = parse_json_completion(response.content)
+                if content:
+                    yield GenerationChunk(text=content)
+    
+    async def _astream(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationChunk]:
+        """Async variant of _stream using the shared httpx.AsyncClient"""
+        headers, data = self._request(prompt, kwargs.get("max_tokens"), stop)
+        client = await _ASYNC_CLIENT.get()
+        limit = _ASYNC_CLIENT.limit
+        
+        async with limit, client.stream("POST", MISTRAL_API_URL, headers=headers, json=data) as response:
+            response.raise_for_status()
+            
+            if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                async for line in response.aiter_lines():
+                    content = parse_sse_line(line.encode())
+                    if content is SSE_DONE:
+                        break
+                    if content:
+                        generation = GenerationChunk(text=content)
+                        if run_manager:
+                            await run_manager.on_llm_new_token(content, chunk=generation)
+                        yield generation
+            else:
+                content = parse_json_completion(await response.aread())
+                if content:
+                    yield GenerationChunk(text=content)
 
 
 # Create the agent prompt template
@@ -114,7 +318,7 @@ Final Answer: the final answer to the original input question
 IMPORTANT GUIDELINES:
 1. When a user asks about weather, use the get_weather tool
 2. When a user asks about places to visit or tourist attractions, use the get_tourist_places tool
-3. If asked about both weather AND places, use BOTH tools
+3. If asked about both weather AND places, use the get_place_info tool (one step for both)
 4. Always provide natural, friendly responses
 5. If a place doesn't exist, politely inform the user
 6. Format your final answers in a clear, easy-to-read way
@@ -124,37 +328,85 @@ Begin!
 Question: {input}
 Thought:{agent_scratchpad}"""
 
+# Print every Thought/Action step only when explicitly asked for (AGENT_VERBOSE=1)
+AGENT_VERBOSE = os.getenv("AGENT_VERBOSE", "0") == "1"
+
+# Fixed observation fed back to the model when its output cannot be parsed
+PARSING_ERROR_OBSERVATION = "Invalid format. Reply with Thought/Action/Action Input, or with Final Answer."
+
+# Sentinels that end a ReAct turn: a tool step before its Observation, the final answer before a new Question
+REACT_STOP_SEQUENCES = ["\nObservation:", "\nQuestion:"]
+
+# Tools available to the agent
+TOOLS = [get_weather, get_tourist_places, get_place_info]
+
+# Parsed once at import; create_react_agent fills in {tools} and {tool_names} itself
+_PROMPT = PromptTemplate.from_template(TOURISM_AGENT_PROMPT)
+
 
-def create_tourism_agent():
-    """Create and return the tourism agent executor"""
+@functools.lru_cache(maxsize=4)
+def create_tourism_agent(api_key: str | None = None):
+    """Create and return the tourism agent executor (built once per key, then shared)"""
     
     # Initialize the LLM
-    llm = MistralGPTOSS()
-    
-    # Define tools
-    tools = [get_weather, get_tourist_places]
-    
-    # Create prompt
-    prompt = PromptTemplate.from_template(TOURISM_AGENT_PROMPT)
+    llm = MistralGPTOSS(api_key=api_key) if api_key is not None else MistralGPTOSS()
     
     # Create agent
-    agent = create_react_agent(llm, tools, prompt)
+    # Stop as soon as the model starts inventing an Observation or a new Question
+    agent = create_react_agent(llm, TOOLS, _PROMPT, stop_sequence=REACT_STOP_SEQUENCES)
     
     # Create agent executor
     agent_executor = AgentExecutor(
         agent=agent,
-        tools=tools,
-        verbose=True,
-        handle_parsing_errors=True,
+        tools=TOOLS,
+        verbose=AGENT_VERBOSE,
+        callbacks=[],
+        return_intermediate_steps=False,
+        handle_parsing_errors=PARSING_ERROR_OBSERVATION,
         max_iterations=5
     )
     
     return agent_executor
 
 
+# Rule-based router used to spot queries that need no LLM reasoning
+_ROUTER = TourismAgent()
+
+
+def answer_single_tool_query(user_input: str) -> str | None:
+    """
+    Answer queries that clearly need exactly one tool by calling it directly.
+    
+    Returns:
+        The tool's answer, or None when the query does not name exactly one place
+        through a pattern match, or needs both (or neither) tools - those go through
+        the full ReAct loop.
+    """
+    place_name = _ROUTER.extract_single_place(user_input)
+    if not place_name:
+        return None
+    
+    needs_weather = _ROUTER.weather_agent.can_handle(user_input)
+    needs_places = _ROUTER.places_agent.can_handle(user_input)
+    if needs_weather == needs_places:
+        return None
+    
+    if needs_weather:
+        return _ROUTER.weather_agent.run(place_name)
+    
+    # The COORDS block is only meant for the map, not for the user
+    return _ROUTER.places_agent.run(place_name).split("\nCOORDS:")[0]
+
+
+@turn_scope()
 def run_agent(user_input: str) -> str:
     """Run the agent with user input and return the response"""
     try:
+        # Trivial "weather in X" / "places in X" queries skip the Mistral round-trips entirely
+        direct_answer = answer_single_tool_query(user_input)
+        if direct_answer is not None:
+            return direct_answer
+        
         agent_executor = create_tourism_agent()
         result = agent_executor.invoke({"input": user_input})
         return result.get("output", "I couldn't process your request.")
@@ -1,9 +1,31 @@
 """
 Parent Tourism Agent - Orchestrates child agents based on user intent
 """
+import asyncio
+import functools
 import re
+from typing import Optional
 from agents.weather_agent import WeatherAgent
 from agents.places_agent import PlacesAgent
+from tools import WeatherReport, PlacesReport, fetch_all, turn_scope
+
+
+# Child agents hold no per-request state, so every TourismAgent shares one of each
+_WEATHER_AGENT = WeatherAgent()
+_PLACES_AGENT = PlacesAgent()
+
+# Common patterns to extract place names, compiled once at import
+_PLACE_PATTERNS = [
+    re.compile(r"(?:go(?:ing)? to|visit(?:ing)?|in|at|for)\s+([A-Z][a-zA-Z\s]+?)(?:\s*,|\s*\?|\s*\.|\s+let|\s+what|\s+and|$)"),
+    re.compile(r"([A-Z][a-zA-Z\s]+?)(?:\s+let\'s plan|\s+what is|\s+temperature|\s+weather)"),
+]
+
+# Capitalized words that never start a place name, and words allowed inside one
+_SKIP_WORDS = frozenset({"i", "what", "and", "the"})
+_CONNECTOR_WORDS = frozenset({"and", "the"})
+
+# Trimmed from words before checking them for capitals
+_PUNCTUATION = ".,!?;:\"()"
 
 
 class TourismAgent:
@@ -14,8 +36,8 @@ class TourismAgent:
     
     def __init__(self):
         self.name = "Tourism AI Agent"
-        self.weather_agent = WeatherAgent()
-        self.places_agent = PlacesAgent()
+        self.weather_agent = _WEATHER_AGENT
+        self.places_agent = _PLACES_AGENT
     
     def extract_place_name(self, query: str) -> str:
         """
@@ -27,25 +49,19 @@ class TourismAgent:
         Returns:
             Extracted place name
         """
-        # Common patterns to extract place names
-        patterns = [
-            r"(?:go(?:ing)? to|visit(?:ing)?|in|at|for)\s+([A-Z][a-zA-Z\s]+?)(?:\s*,|\s*\?|\s*\.|\s+let|\s+what|\s+and|$)",
-            r"([A-Z][a-zA-Z\s]+?)(?:\s+let\'s plan|\s+what is|\s+temperature|\s+weather)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query)
+        for pattern in _PLACE_PATTERNS:
+            match = pattern.search(query)
             if match:
                 return match.group(1).strip()
         
         # If no pattern matches, look for capitalized words
         words = query.split()
         for i, word in enumerate(words):
-            if word[0].isupper() and word.lower() not in ['i', 'what', 'and', 'the']:
+            if word[0].isupper() and word.lower() not in _SKIP_WORDS:
                 # Get consecutive capitalized words
                 place_parts = [word]
                 for next_word in words[i+1:]:
-                    if next_word[0].isupper() or next_word.lower() in ['and', 'the']:
+                    if next_word[0].isupper() or next_word.lower() in _CONNECTOR_WORDS:
                         place_parts.append(next_word)
                     else:
                         break
@@ -53,10 +69,78 @@ class TourismAgent:
         
         return ""
     
+    def extract_single_place(self, query: str) -> str:
+        """
+        Extract the place name only when the query names exactly one place unambiguously
+        
+        Args:
+            query: User's query string
+            
+        Returns:
+            The place matched by a pattern, or "" when no pattern matches or another
+            capitalized word in the query may be a second place
+        """
+        for pattern in _PLACE_PATTERNS:
+            match = pattern.search(query)
+            if match:
+                place = match.group(1).strip()
+                break
+        else:
+            return ""
+        
+        # Past the opening word, any capitalized word outside the place could name another one
+        place_words = set(place.split())
+        for word in query.split()[1:]:
+            word = word.strip(_PUNCTUATION)
+            if word and word[0].isupper() and word not in place_words and word.split("'")[0] != "I":
+                return ""
+        return place
+    
+    @turn_scope()
     def run(self, user_query: str) -> str:
         """
         Process user query and route to appropriate child agents
         
+        Args:
+            user_query: User's input query
+            
+        Returns:
+            Response from child agent(s)
+        """
+        return asyncio.run(self.arun(user_query))
+    
+    def format_response(self, weather: Optional[WeatherReport], places: Optional[PlacesReport]) -> str:
+        """
+        Build the reply from the structured child agent results
+        
+        Args:
+            weather: Weather report, or None if weather was not requested
+            places: Places report, or None if attractions were not requested
+            
+        Returns:
+            Natural language response
+        """
+        if places is None:
+            return weather.message
+        if weather is None:
+            return places.message
+        
+        if weather.success and places.success and places.attractions:
+            attractions = "\n".join(places.attractions)
+            return (
+                f"In {weather.place} it's currently {weather.temperature}°C with a chance of "
+                f"{weather.precipitation_chance}% to rain. And these are the places you can go,\n{attractions}"
+            )
+        
+        # An unknown place fails both lookups with the same message - say it once
+        if weather.message == places.message:
+            return weather.message
+        return f"{weather.message} {places.message}"
+    
+    async def arun(self, user_query: str) -> str:
+        """
+        Async variant of run - child agents needed for the query are awaited concurrently
+        
         Args:
             user_query: User's input query
             
@@ -78,29 +162,21 @@ class TourismAgent:
             if not needs_weather and not needs_places:
                 needs_places = True
             
-            responses = []
-            
-            # Get weather information if needed
-            if needs_weather:
-                weather_response = self.weather_agent.run(place_name)
-                responses.append(weather_response)
-            
-            # Get places information if needed
-            if needs_places:
-                places_response = self.places_agent.run(place_name)
-                responses.append(places_response)
-            
-            # Combine responses naturally
-            if len(responses) == 1:
-                return responses[0]
+            # Both lookups need the same geocode: fetch it once, then run them side by side
+            if needs_weather and needs_places:
+                _, weather, places = await fetch_all(place_name)
+            elif needs_weather:
+                weather, places = await self.weather_agent.arun(place_name), None
             else:
-                # Both weather and places
-                return f"{responses[0]} And {responses[1].split(place_name)[1] if place_name in responses[1] else responses[1]}"
+                weather, places = None, await self.places_agent.arun(place_name)
+            
+            return self.format_response(weather, places)
         
         except Exception as e:
             return f"I encountered an error processing your request: {str(e)}"
 
 
+@functools.lru_cache(maxsize=1)
 def create_tourism_agent():
-    """Create and return the tourism agent"""
+    """Create and return the tourism agent (stateless between runs, so built once and shared)"""
     return TourismAgent()
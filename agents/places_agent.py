@@ -1,7 +1,9 @@
 """
 Places Agent - Specialized child agent for tourist attractions queries
 """
-from tools import get_tourist_places
+import asyncio
+import re
+from tools import get_tourist_places, lookup_places, PlacesReport
 
 
 class PlacesAgent:
@@ -10,6 +12,15 @@ class PlacesAgent:
     Uses the get_tourist_places tool to fetch popular attractions in any location.
     """
     
+    # Substring match on any keyword, scanned in one pass by a single compiled alternation
+    PLACES_KEYWORDS = [
+        "place", "places", "visit", "attraction", "attractions",
+        "tourist", "tourism", "sightseeing", "landmark", "landmarks",
+        "trip", "travel", "destination", "go", "see", "explore",
+        "tour", "palace", "museum", "park", "monument"
+    ]
+    _PLACES_RE = re.compile("|".join(map(re.escape, PLACES_KEYWORDS)), re.IGNORECASE)
+    
     def __init__(self):
         self.name = "Places Agent"
         self.description = "Handles tourist attractions and places to visit requests"
@@ -30,6 +41,21 @@ class PlacesAgent:
         except Exception as e:
             return f"Error getting tourist places: {str(e)}"
     
+    async def arun(self, place_name: str) -> PlacesReport:
+        """
+        Async variant of run - executes the blocking lookup in a worker thread
+        
+        Args:
+            place_name: Name of the place to find attractions in
+            
+        Returns:
+            PlacesReport with structured attractions
+        """
+        try:
+            return await asyncio.to_thread(lookup_places, place_name)
+        except Exception as e:
+            return PlacesReport(place=place_name, error=f"Error getting tourist places: {str(e)}")
+    
     def can_handle(self, query: str) -> bool:
         """
         Determine if this agent can handle the given query
@@ -40,11 +66,4 @@ class PlacesAgent:
         Returns:
             True if query is about places or attractions
         """
-        places_keywords = [
-            "place", "places", "visit", "attraction", "attractions",
-            "tourist", "tourism", "sightseeing", "landmark", "landmarks",
-            "trip", "travel", "destination", "go", "see", "explore",
-            "tour", "palace", "museum", "park", "monument"
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in places_keywords)
+        return bool(self._PLACES_RE.search(query))
@@ -1,7 +1,9 @@
 """
 Weather Agent - Specialized child agent for weather queries
 """
-from tools import get_weather
+import asyncio
+import re
+from tools import get_weather, lookup_weather, WeatherReport
 
 
 class WeatherAgent:
@@ -10,6 +12,14 @@ class WeatherAgent:
     Uses the get_weather tool to fetch current temperature and precipitation data.
     """
     
+    # Substring match on any keyword, scanned in one pass by a single compiled alternation
+    WEATHER_KEYWORDS = [
+        "weather", "temperature", "temp", "hot", "cold", 
+        "rain", "precipitation", "climate", "forecast",
+        "degrees", "celsius", "fahrenheit"
+    ]
+    _WEATHER_RE = re.compile("|".join(map(re.escape, WEATHER_KEYWORDS)), re.IGNORECASE)
+    
     def __init__(self):
         self.name = "Weather Agent"
         self.description = "Handles weather information requests for any location"
@@ -30,6 +40,21 @@ class WeatherAgent:
         except Exception as e:
             return f"Error getting weather information: {str(e)}"
     
+    async def arun(self, place_name: str) -> WeatherReport:
+        """
+        Async variant of run - executes the blocking lookup in a worker thread
+        
+        Args:
+            place_name: Name of the place to get weather for
+            
+        Returns:
+            WeatherReport with structured weather data
+        """
+        try:
+            return await asyncio.to_thread(lookup_weather, place_name)
+        except Exception as e:
+            return WeatherReport(place=place_name, error=f"Error getting weather information: {str(e)}")
+    
     def can_handle(self, query: str) -> bool:
         """
         Determine if this agent can handle the given query
@@ -40,10 +65,4 @@ class WeatherAgent:
         Returns:
             True if query is about weather
         """
-        weather_keywords = [
-            "weather", "temperature", "temp", "hot", "cold", 
-            "rain", "precipitation", "climate", "forecast",
-            "degrees", "celsius", "fahrenheit"
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in weather_keywords)
+        return bool(self._WEATHER_RE.search(query))
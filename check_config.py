@@ -1,8 +1,12 @@
 """
 Quick test script to verify environment configuration
 Run this to check if your deployment is properly configured
+(add --full to also probe the external APIs)
 """
 import os
+import sys
+import asyncio
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -29,36 +33,40 @@ print(f"✓ PORT: {port}")
 
 print()
 
-# Test free APIs (these don't need keys)
-print("Testing free APIs...")
+# Test free APIs (these don't need keys) - only with --full, since they hit the network
+API_PROBES = [
+    ("Open-Meteo API (weather)", "https://api.open-meteo.com/v1/forecast?latitude=12.97&longitude=77.59&current=temperature_2m"),
+    ("Nominatim API (geocoding)", "https://nominatim.openstreetmap.org/search?q=Bangalore&format=json&limit=1"),
+    ("Overpass API (places)", "https://overpass-api.de/api/status"),
+]
 
-try:
-    import requests
-    
-    # Test Open-Meteo (weather)
-    response = requests.get("https://api.open-meteo.com/v1/forecast?latitude=12.97&longitude=77.59&current=temperature_2m", timeout=5)
-    if response.status_code == 200:
-        print("✓ Open-Meteo API (weather): WORKING")
-    else:
-        print("✗ Open-Meteo API (weather): FAILED")
-    
-    # Test Nominatim (geocoding)
-    headers = {"User-Agent": "TourismAIAgent/1.0"}
-    response = requests.get("https://nominatim.openstreetmap.org/search?q=Bangalore&format=json&limit=1", headers=headers, timeout=5)
-    if response.status_code == 200:
-        print("✓ Nominatim API (geocoding): WORKING")
-    else:
-        print("✗ Nominatim API (geocoding): FAILED")
+
+async def probe(client, name, url):
+    """Return (name, ok) for a single API endpoint"""
+    try:
+        response = await client.get(url)
+        return name, response.status_code == 200
+    except Exception:
+        return name, False
+
+
+async def run_probes():
+    """Probe every API concurrently over one shared client"""
+    headers = {"User-Agent": "TourismAIAgent/1.0"}  # required by Nominatim
+    async with httpx.AsyncClient(timeout=5.0, headers=headers) as client:
+        return await asyncio.gather(*(probe(client, name, url) for name, url in API_PROBES))
+
+
+if "--full" in sys.argv:
+    print("Testing free APIs...")
     
-    # Test Overpass (places)
-    response = requests.get("https://overpass-api.de/api/status", timeout=5)
-    if response.status_code == 200:
-        print("✓ Overpass API (places): WORKING")
-    else:
-        print("✗ Overpass API (places): FAILED")
-        
-except Exception as e:
-    print(f"✗ API test failed: {e}")
+    try:
+        for name, ok in asyncio.run(run_probes()):
+            print(f"✓ {name}: WORKING" if ok else f"✗ {name}: FAILED")
+    except Exception as e:
+        print(f"✗ API test failed: {e}")
+else:
+    print("Skipping free API checks (run with --full to test Open-Meteo, Nominatim and Overpass)")
 
 print()
 print("=" * 60)
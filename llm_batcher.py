@@ -0,0 +1,188 @@
+"""
+LLM Batcher - Coalesces concurrent Mistral prompts into one marshaled chat completion
+"""
+import os
+import re
+import json
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, List, Optional, Set
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Receives each streamed token of a prompt that is answered on its own; the async path
+# awaits whatever it returns
+TokenCallback = Callable[[str], Any]
+
+# Most prompts folded into a single upstream request
+BATCH_MAX = int(os.getenv("BATCH_MAX", "8"))
+
+# How long a batch stays open once a second prompt has joined the first
+BATCH_WINDOW_MS = int(os.getenv("BATCH_WINDOW_MS", "50"))
+
+# Set BATCH_DISABLED=1 to send every prompt on its own
+BATCH_DISABLED = os.getenv("BATCH_DISABLED", "0") == "1"
+
+_BATCH_HEADER = (
+    "Answer each query below independently. Respond with ONLY a JSON array of strings, "
+    "one entry per query, in the same order as the queries.\n"
+)
+
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def build_batch_prompt(prompts: List[str]) -> str:
+    """Marshal several prompts into one numbered prompt asking for a JSON array"""
+    rows = "\n\n".join(f"{i}) {prompt}" for i, prompt in enumerate(prompts, 1))
+    return f"{_BATCH_HEADER}\n{rows}"
+
+
+def parse_batch_response(text: str, expected: int) -> Optional[List[str]]:
+    """Unmarshal a batched answer; None if it is not a JSON array of the expected size"""
+    match = _JSON_ARRAY.search(text)
+    if not match:
+        return None
+    try:
+        answers = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(answers, list) or len(answers) != expected:
+        return None
+    return [answer if isinstance(answer, str) else json.dumps(answer) for answer in answers]
+
+
+class LLMBatcher:
+    """
+    Collects prompts submitted from any thread and answers them with a single upstream call. A prompt
+    that arrives alone is sent straight away; once a second one is pending, the batch stays open for
+    BATCH_WINDOW_MS (or until BATCH_MAX prompts). A batched answer that cannot be unmarshaled falls
+    back to one call per prompt.
+    
+    complete(prompt, max_tokens, stop, on_token) is the blocking single-request function used for the
+    upstream calls of submit(), run in a worker thread. acomplete is its coroutine counterpart: when
+    given, prompts queued with asubmit() are awaited on the batcher loop instead, and a marshaled
+    batch uses it as soon as one of its prompts came from asubmit(). Stop sequences and token
+    callbacks are passed on for prompts sent on their own only - a marshaled batch must not stop
+    early and its tokens belong to no single caller, so callers enforce stop sequences on the
+    unmarshaled answers.
+    """
+    
+    def __init__(
+        self,
+        complete: Callable[[str, int, Optional[List[str]], Optional[TokenCallback]], str],
+        max_tokens: int,
+        max_batch: int = BATCH_MAX,
+        window_ms: int = BATCH_WINDOW_MS,
+        acomplete: Optional[Callable[[str, int, Optional[List[str]], Optional[TokenCallback]], Awaitable[str]]] = None,
+    ):
+        self._complete = complete
+        self._acomplete = acomplete
+        self.max_tokens = max_tokens
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._start_lock = threading.Lock()
+    
+    def submit(
+        self, prompt: str, stop: Optional[List[str]] = None, on_token: Optional[TokenCallback] = None
+    ) -> str:
+        """Queue a prompt and block until its answer is available"""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._enqueue(prompt, stop, on_token, False), loop)
+        return future.result()
+    
+    async def asubmit(
+        self, prompt: str, stop: Optional[List[str]] = None, on_token: Optional[TokenCallback] = None
+    ) -> str:
+        """Queue a prompt from a coroutine and await its answer without blocking the caller's loop"""
+        loop = self._ensure_started()
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._enqueue(prompt, stop, on_token, True), loop)
+        )
+    
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop and worker on first use"""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._queue = asyncio.Queue()
+                    loop.create_task(self._worker())
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                
+                threading.Thread(target=run_loop, name="llm-batcher", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+    
+    async def _enqueue(
+        self, prompt: str, stop: Optional[List[str]], on_token: Optional[TokenCallback], is_async: bool
+    ) -> str:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, stop, on_token, is_async, future))
+        return await future
+    
+    async def _worker(self):
+        """Drain the queue into batches; each batch is dispatched without blocking the next"""
+        while True:
+            batch = [await self._queue.get()]
+            
+            # Let prompts submitted at the same moment land, and only hold the batch open for
+            # the window when there is company - a lone prompt goes out without waiting
+            await asyncio.sleep(0)
+            if not self._queue.empty():
+                await asyncio.sleep(self.window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _call(self, is_async: bool, prompt: str, max_tokens: int, stop, on_token) -> str:
+        """One upstream request: awaited on this loop for async callers, in a worker thread otherwise"""
+        if is_async and self._acomplete is not None:
+            return await self._acomplete(prompt, max_tokens, stop, on_token)
+        return await asyncio.to_thread(self._complete, prompt, max_tokens, stop, on_token)
+    
+    async def _dispatch(self, batch):
+        prompts = [prompt for prompt, _, _, _, _ in batch]
+        stops = [stop for _, stop, _, _, _ in batch]
+        callbacks = [on_token for _, _, on_token, _, _ in batch]
+        kinds = [is_async for _, _, _, is_async, _ in batch]
+        futures = [future for _, _, _, _, future in batch]
+        
+        answers = None
+        if len(prompts) > 1:
+            try:
+                text = await self._call(
+                    any(kinds), build_batch_prompt(prompts), self.max_tokens * len(prompts), None, None
+                )
+                answers = parse_batch_response(text, len(prompts))
+            except Exception:
+                answers = None
+        
+        if answers is None:
+            # Lone prompt, or the model broke the row format - answer each prompt on its own
+            answers = await asyncio.gather(
+                *(
+                    self._call(is_async, prompt, self.max_tokens, stop, on_token)
+                    for prompt, stop, on_token, is_async in zip(prompts, stops, callbacks, kinds)
+                ),
+                return_exceptions=True
+            )
+        
+        for future, answer in zip(futures, answers):
+            if future.done():
+                continue
+            if isinstance(answer, BaseException):
+                future.set_exception(answer)
+            else:
+                future.set_result(answer)
@@ -0,0 +1,82 @@
+"""
+LLM Cache - Response cache for Mistral calls keyed by a hash of the request
+"""
+import os
+import json
+import hashlib
+from typing import List, Optional
+from dotenv import load_dotenv
+from tools.cache import TTLCache, REDIS_URL
+
+load_dotenv()
+
+# Seconds a cached completion stays valid
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+# Sampled (temperature > 0) completions are only cached when explicitly allowed
+LLM_CACHE_ALL = os.getenv("LLM_CACHE_ALL", "0") == "1"
+
+
+def make_cache_key(model: str, temperature: float, max_tokens: int, prompt: str,
+                   stop: Optional[List[str]] = None) -> str:
+    """Build a stable cache key for one completion request"""
+    payload = json.dumps(
+        {"model": model, "temperature": temperature, "max_tokens": max_tokens, "prompt": prompt, "stop": stop},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    Two-level completion cache: an in-process LRU in front of an optional Redis.
+    Redis failures never break a request - the cache silently degrades to memory only.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: int = LLM_CACHE_TTL, redis_url: str = REDIS_URL):
+        self.ttl = ttl
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis = None
+        
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+            except ImportError:
+                print("⚠️  WARNING: REDIS_URL is set but the redis package is not installed")
+    
+    def enabled_for(self, temperature: float) -> bool:
+        """Deterministic calls are always cacheable; sampled ones only when opted in"""
+        return temperature == 0 or LLM_CACHE_ALL
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached completion or None"""
+        value = self._memory.get(key)
+        if value is not None or self._redis is None:
+            return value
+        
+        try:
+            value = self._redis.get(f"llm:{key}")
+        except Exception:
+            return None
+        
+        if value is not None:
+            self._memory.set(key, value)
+        return value
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a completion in every available layer"""
+        self._memory.set(key, value)
+        if self._redis is not None:
+            try:
+                self._redis.setex(f"llm:{key}", self.ttl, value)
+            except Exception:
+                pass
+    
+    def stats(self) -> dict:
+        """Return in-process hit/miss counters"""
+        return {**self._memory.stats(), "redis": self._redis is not None}
+
+
+# Process-wide cache instance
+llm_cache = LLMCache()
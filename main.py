@@ -2,34 +2,44 @@
 FastAPI Backend for Tourism AI Agent
 """
 import os
+import asyncio
+import hashlib
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from tourism_agent import create_tourism_agent_with_tools
-from schemas import TourismResponse
+from schemas import TourismResponse, AttractionWithCoords
+from tools.cache import cache_stats
+from llm_cache import llm_cache
 
 # Create FastAPI app
 app = FastAPI(
     title="Tourism AI Agent API",
     description="Multi-agent tourism system with weather and places information",
-    version="1.0.0"
+    version="1.0.0",
+    # Encode every JSON response with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 # Startup validation
 @app.on_event("startup")
 async def startup_event():
     """Validate required environment variables on startup"""
-    mistral_key = os.getenv("mistral_api_key")
-    if not mistral_key or mistral_key.strip() == "":
+    # Read once here so request handlers never touch os.environ
+    app.state.mistral_key = (os.getenv("mistral_api_key") or "").strip()
+    if not app.state.mistral_key:
         print("⚠️  WARNING: mistral_api_key environment variable is not set!")
         print("⚠️  The API will not work properly without this key.")
         print("⚠️  Please set mistral_api_key in your Railway environment variables.")
     else:
         print("✓ mistral_api_key is configured")
         print(f"✓ API starting on port {os.environ.get('PORT', '8000')}")
+    
+    # Build the agent once and share it across requests
+    app.state.agent = create_tourism_agent_with_tools(api_key=app.state.mistral_key)
     print("✓ Tourism AI Agent is starting...")
 
 # Configure CORS
@@ -58,12 +68,6 @@ class TripRequest(BaseModel):
         }
 
 
-class AttractionWithCoords(BaseModel):
-    name: str
-    latitude: float
-    longitude: float
-
-
 class ChatResponse(BaseModel):
     response: str
     success: bool
@@ -87,6 +91,48 @@ class ChatResponse(BaseModel):
     attractions_with_coords: Optional[List[AttractionWithCoords]] = None
 
 
+# In-flight /plan-trip work keyed by the stripped query; duplicate requests await the same result
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def run_coalesced(query: str) -> TourismResponse:
+    """
+    Run the shared agent once per distinct in-flight query
+    
+    Args:
+        query: User's query
+        
+    Returns:
+        TourismResponse, shared by every concurrent caller with the same query
+    """
+    # Only whitespace is normalized: the agent reads case (e.g. "Paris" vs "paris"), so the key
+    # must not merge queries it could answer differently, and the agent gets the keyed text
+    query = query.strip()
+    key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    
+    pending = _inflight.get(key)
+    if pending is not None:
+        # shield: a disconnecting duplicate must not cancel the work others are awaiting
+        return await asyncio.shield(pending)
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        # The lookups are async end to end, so the agent runs on the event loop itself
+        result = await app.state.agent.arun(query)
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved so a request without duplicates logs nothing
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
 # Routes
 @app.get("/")
 async def read_root():
@@ -104,7 +150,7 @@ async def favicon():
 @app.get("/health")
 async def health_check():
     """Health check endpoint with configuration status"""
-    mistral_configured = bool(os.getenv("mistral_api_key") and os.getenv("mistral_api_key").strip())
+    mistral_configured = bool(app.state.mistral_key)
     
     return {
         "status": "healthy" if mistral_configured else "degraded",
@@ -114,11 +160,12 @@ async def health_check():
             "mistral_api_key": "configured" if mistral_configured else "missing",
             "port": os.environ.get("PORT", "8000")
         },
+        "cache": {**cache_stats(), "llm": llm_cache.stats()},
         "message": "All systems operational" if mistral_configured else "API key not configured - service will not work"
     }
 
 
-@app.post("/plan-trip", response_model=ChatResponse)
+@app.post("/plan-trip", response_model=ChatResponse, response_class=ORJSONResponse)
 async def plan_trip(request: TripRequest):
     """
     Plan trip endpoint - accepts natural language query or place name
@@ -131,7 +178,7 @@ async def plan_trip(request: TripRequest):
     """
     try:
         # Validate API key is configured
-        if not os.getenv("mistral_api_key") or os.getenv("mistral_api_key").strip() == "":
+        if not app.state.mistral_key:
             return ChatResponse(
                 response="The API is not properly configured. Please contact the administrator.",
                 success=False,
@@ -141,9 +188,8 @@ async def plan_trip(request: TripRequest):
         if not request.query or not request.query.strip():
             raise HTTPException(status_code=400, detail="Query cannot be empty")
         
-        # Create tourism agent and get trip information
-        tourism_agent = create_tourism_agent_with_tools()
-        result = tourism_agent.run(request.query)
+        # Get trip information from the shared agent built at startup
+        result = await run_coalesced(request.query)
         
         return ChatResponse(
             response=result.message,
@@ -157,13 +203,8 @@ async def plan_trip(request: TripRequest):
             temperature=result.temperature,
             precipitation_chance=result.precipitation_chance,
             attractions=result.attractions,
-            attractions_with_coords=[
-                AttractionWithCoords(
-                    name=attr.name,
-                    latitude=attr.latitude,
-                    longitude=attr.longitude
-                ) for attr in result.attractions_with_coords
-            ] if result.attractions_with_coords else None
+            # Same model as TourismResponse uses, so pydantic reuses the instances as-is
+            attractions_with_coords=result.attractions_with_coords or None
         )
         
     except Exception as e:
@@ -0,0 +1,61 @@
+"""
+Mistral Client - Endpoint, model and the per-event-loop async HTTP client shared by the Mistral LLM wrappers
+"""
+import os
+import asyncio
+import httpx
+from typing import Callable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+MISTRAL_API_URL = "https://platform.qubrid.com/api/v1/qubridai/chat/completions"
+
+# Model served behind MISTRAL_API_URL, read once at import
+MISTRAL_MODEL = os.getenv("MISTRAL_MODEL", "openai/gpt-oss-20b")
+
+
+async def _hold_open(client: httpx.AsyncClient):
+    """Async generator that closes client when it is finalized"""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class LoopBoundClient:
+    """
+    One keep-alive httpx.AsyncClient per event loop, built lazily by make_client and replaced
+    when the running loop changes (run() style callers start a new loop with asyncio.run).
+    
+    Each client is held by a _hold_open generator started on its loop. asyncio finalizes such
+    generators on their own loop - at loop shutdown (asyncio.run, uvicorn), or once a replaced
+    one is dropped - so the connection pool is closed before the loop that owns it goes away.
+    With a concurrency limit, a matching asyncio.Semaphore is kept per loop as well.
+    """
+    
+    def __init__(self, make_client: Callable[[], httpx.AsyncClient], concurrency: Optional[int] = None):
+        self._make_client = make_client
+        self._concurrency = concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owner = None
+    
+    async def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, building it on first use in that loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = self._make_client()
+            if self._concurrency is not None:
+                self._limit = asyncio.Semaphore(self._concurrency)
+            self._loop = loop
+            self._owner = _hold_open(self._client)
+            await self._owner.asend(None)
+        return self._client
+    
+    @property
+    def limit(self) -> Optional[asyncio.Semaphore]:
+        """Concurrency limit for the running loop's client (set by get())"""
+        return self._limit
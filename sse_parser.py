@@ -0,0 +1,43 @@
+"""
+SSE Parser - Decodes streamed chat completion events shared by the Mistral LLM wrappers
+
+Plain Python rather than a compiled (Cython) extension: the per-line work is a prefix check and
+one orjson call, which is already native code, so there is little left for a C extension to win.
+"""
+from typing import Optional
+from tools._http import json_loads
+
+
+# Returned by parse_sse_line for the end-of-stream marker
+SSE_DONE = object()
+
+_DATA_PREFIX = b'data: '
+_DONE_MARKER = b'[DONE]'
+
+
+def parse_sse_line(line: bytes):
+    """Return the delta text carried by one SSE line, SSE_DONE at end of stream, or None"""
+    if not line.startswith(_DATA_PREFIX):
+        return None
+    data_bytes = line[len(_DATA_PREFIX):].strip()
+    if data_bytes == _DONE_MARKER:
+        return SSE_DONE
+    if not data_bytes:
+        return None
+    try:
+        chunk = json_loads(data_bytes)
+    except ValueError:
+        return None
+    if "choices" in chunk and len(chunk["choices"]) > 0:
+        # Some providers send "delta": null on the final frame
+        delta = chunk["choices"][0].get("delta") or {}
+        return delta.get("content") or None
+    return None
+
+
+def parse_json_completion(body: bytes) -> Optional[str]:
+    """Extract the message text from a regular (non-SSE) JSON completion"""
+    result = json_loads(body)
+    if "choices" in result and len(result["choices"]) > 0:
+        return result["choices"][0]["message"]["content"]
+    return None
@@ -6,6 +6,12 @@ import requests
 import json
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -46,7 +52,8 @@ def test_mistral_api():
     }
     
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        # stream=True returns as soon as headers arrive, so SSE tokens can be parsed as they come in
+        response = requests.post(url, headers=headers, json=data, timeout=30, stream=True)
         
         print(f"\nStatus Code: {response.status_code}")
         print(f"Content-Type: {response.headers.get('Content-Type')}")
@@ -56,25 +63,30 @@ def test_mistral_api():
         # Handle SSE stream response
         if 'text/event-stream' in response.headers.get('Content-Type', ''):
             print("\n📡 Handling SSE stream...")
-            full_content = ""
+            tokens = []
             
-            # Split response by lines and process SSE format
-            lines = response.text.split('\n')
-            for line in lines:
-                if line.startswith('data: '):
+            # Process SSE lines as they arrive instead of waiting for the whole body
+            response.encoding = "utf-8"  # SSE is always UTF-8; requests would assume Latin-1 for text/*
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith('data: '):
                     data_str = line[6:].strip()
-                    if data_str and data_str != '[DONE]':
+                    if data_str == '[DONE]':
+                        break
+                    if data_str:
                         try:
-                            chunk = json.loads(data_str)
+                            chunk = _json_loads(data_str)
                             if "choices" in chunk and len(chunk["choices"]) > 0:
                                 delta = chunk["choices"][0].get("delta", {})
                                 content = delta.get("content", "")
                                 if content:
-                                    full_content += content
+                                    tokens.append(content)
+                                    print(content, end="", flush=True)
                         except json.JSONDecodeError:
                             continue
+            response.close()
+            full_content = "".join(tokens)
             
-            print("-" * 80)
+            print("\n" + "-" * 80)
             if full_content:
                 print(f"\n💬 Model Response:\n{full_content}")
                 print("\n✅ Mistral API is working correctly!")
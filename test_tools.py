@@ -3,7 +3,8 @@ Test Script - Tests all tools individually to ensure they work correctly
 """
 import sys
 import json
-from tools import get_coordinates, get_weather, get_tourist_places
+from tools import get_coordinates, get_weather, get_weather_batch, get_tourist_places
+from tools.gazetteer import CITIES
 
 
 def print_separator():
@@ -36,6 +37,20 @@ def test_geocoding_tool():
     print_separator()
 
 
+def test_gazetteer_ambiguous_names():
+    """Test that names shared by similarly sized cities are left to Nominatim"""
+    print("📖 TESTING GAZETTEER AMBIGUITY FILTER")
+    print_separator()
+    
+    # Each has a namesake within 4x of its population (e.g. Valencia, Venezuela; Hamilton, Ontario)
+    ambiguous = ["barcelona", "hyderabad", "valencia", "cambridge", "hamilton", "kochi", "york"]
+    present = [name for name in ambiguous if name in CITIES]
+    assert not present, f"Ambiguous names in the gazetteer: {present}"
+    print(f"✅ Success! None of {len(ambiguous)} ambiguous names is answered from the gazetteer")
+    
+    print_separator()
+
+
 def test_weather_tool():
     """Test the weather tool"""
     print("🌤️  TESTING WEATHER TOOL")
@@ -63,6 +78,28 @@ def test_weather_tool():
     print_separator()
 
 
+def test_weather_batch():
+    """Test fetching weather for several places with one Open-Meteo request"""
+    print("🌦️  TESTING BATCHED WEATHER")
+    print_separator()
+    
+    test_places = ["Paris", "Tokyo", "London", "InvalidPlaceXYZ123"]
+    
+    try:
+        results = get_weather_batch(test_places)
+        for place, result in zip(test_places, results):
+            print(f"{place}: {result}")
+        
+        if len(results) == len(test_places) and all("it's currently" in r for r in results[:3]):
+            print(f"✅ Success! Weather for {len(test_places) - 1} places retrieved in one batch")
+        else:
+            print("⚠️  Unexpected batch response")
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+    
+    print_separator()
+
+
 def test_places_tool():
     """Test the tourist places tool"""
     print("🏛️  TESTING TOURIST PLACES TOOL")
@@ -101,17 +138,25 @@ def run_all_tests():
         # Test 1: Geocoding Tool
         test_geocoding_tool()
         
-        # Test 2: Weather Tool
+        # Test 2: Gazetteer
+        test_gazetteer_ambiguous_names()
+        
+        # Test 3: Weather Tool
         test_weather_tool()
         
-        # Test 3: Places Tool
+        # Test 4: Batched Weather
+        test_weather_batch()
+        
+        # Test 5: Places Tool
         test_places_tool()
         
         print("\n✅ ALL TESTS COMPLETED!")
         print("="*80)
         print("\nSummary:")
         print("- Geocoding Tool: Tests location resolution")
+        print("- Gazetteer: Tests that ambiguous names are left out")
         print("- Weather Tool: Tests weather API integration")
+        print("- Batched Weather: Tests one multi-location weather request")
         print("- Places Tool: Tests tourist attraction finding")
         print("\nIf all tools show ✅ for valid places, they are working correctly!")
         
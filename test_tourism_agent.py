@@ -1,19 +1,21 @@
 """
 Test Tourism Agent with Tools and Structured Output
 """
+from concurrent.futures import ThreadPoolExecutor
 from tourism_agent import create_tourism_agent_with_tools
 
 
-def test_scenario(num, place_name):
-    """Test a single scenario"""
+def test_scenario(num, place_name, result=None):
+    """Test a single scenario (result is fetched here unless already computed)"""
     print(f"\n{'='*80}")
     print(f"TEST {num}")
     print(f"{'='*80}")
     print(f"Place: {place_name}")
     print("-"*80)
     
-    agent = create_tourism_agent_with_tools()
-    result = agent.run(place_name)
+    if result is None:
+        agent = create_tourism_agent_with_tools()
+        result = agent.run(place_name)
     
     print(f"\n✅ Structured Response:")
     print(f"  Place: {result.place}")
@@ -62,16 +64,17 @@ def run_all_tests():
     print("\n🚀 TESTING TOURISM AGENT - PLACE NAME INPUT ONLY\n")
     print("Agent automatically fetches both weather and attractions\n")
     
-    results = []
-    
-    # Test 1: Bangalore
-    results.append(test_scenario(1, "Bangalore"))
+    places = ["Bangalore", "Paris", "Tokyo"]
     
-    # Test 2: Paris
-    results.append(test_scenario(2, "Paris"))
+    # Fetch every place concurrently, then validate and print in order
+    agent = create_tourism_agent_with_tools()
+    with ThreadPoolExecutor(max_workers=len(places)) as pool:
+        responses = list(pool.map(agent.run, places))
     
-    # Test 3: Tokyo
-    results.append(test_scenario(3, "Tokyo"))
+    results = [
+        test_scenario(num, place_name, result)
+        for num, (place_name, result) in enumerate(zip(places, responses), 1)
+    ]
     
     # Summary
     print(f"\n{'='*80}")
@@ -1,12 +1,29 @@
 """
 Tools Module - Exports all tourism agent tools
 """
-from .geocoding_tool import get_coordinates
-from .weather_tool import get_weather
-from .places_tool import get_tourist_places
+from .geocoding_tool import get_coordinates, aget_coordinates, GeoResult
+from .weather_tool import (
+    get_weather, get_weather_batch, lookup_weather, alookup_weather, alookup_weather_batch, WeatherReport
+)
+from .places_tool import get_tourist_places, lookup_places, alookup_places, PlacesReport
+from .fused import fetch_all, get_place_info
+from .cache import turn_scope
 
 __all__ = [
     "get_coordinates",
     "get_weather", 
-    "get_tourist_places"
+    "get_weather_batch",
+    "get_tourist_places",
+    "get_place_info",
+    "lookup_weather",
+    "lookup_places",
+    "aget_coordinates",
+    "alookup_weather",
+    "alookup_weather_batch",
+    "alookup_places",
+    "fetch_all",
+    "turn_scope",
+    "GeoResult",
+    "WeatherReport",
+    "PlacesReport"
 ]
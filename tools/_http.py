@@ -0,0 +1,52 @@
+"""
+HTTP Client - Pooled keep-alive client and JSON decoder shared by the geocoding, weather and places tools
+"""
+import json
+import time
+import httpx
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # stdlib json also accepts bytes
+    json_loads = json.loads
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2 = True
+except ImportError:  # without the http2 extra httpx speaks HTTP/1.1 only
+    HTTP2 = False
+
+
+# Identifies the app to the public APIs (required by Nominatim)
+USER_AGENT = "TourismAIAgent/1.0"
+
+# Connection pool sizing shared by the sync client and the per-lookup async clients
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# Gateway errors worth retrying, with exponential backoff between attempts
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRIES = 2
+BACKOFF = 0.3
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTPTransport that also retries gateway errors (connection failures are retried by httpx)"""
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRIES):
+            response = super().handle_request(request)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            response.close()
+            time.sleep(BACKOFF * (2 ** attempt))
+        return super().handle_request(request)
+
+
+# One client for every sync tool call, so repeat requests to a host reuse the TCP/TLS connection,
+# and concurrent calls from several threads are multiplexed over it when the server speaks HTTP/2
+SESSION = httpx.Client(
+    headers={"User-Agent": USER_AGENT},
+    follow_redirects=True,
+    transport=_RetryTransport(http2=HTTP2, limits=LIMITS, retries=RETRIES)
+)
@@ -0,0 +1,234 @@
+"""
+Cache Module - Small in-process TTL caches shared by the tools and the LLM wrappers
+"""
+import os
+import json
+import sqlite3
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+_MISSING = object()
+
+# Directory used by the persistent (diskcache-backed) caches
+CACHE_DIR = os.getenv("TOURISM_CACHE_DIR", "/tmp/tourism_cache")
+
+# Optional shared backend, e.g. redis://localhost:6379/0 (requires the redis package)
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+# Every named cache, reported by cache_stats()
+_REGISTRY: Dict[str, "TTLCache"] = {}
+
+
+# Per-turn memo of geocoding results; None outside a turn_scope()
+_TURN_CACHE: ContextVar[Optional[Dict[str, Any]]] = ContextVar("turn_cache", default=None)
+
+
+@contextmanager
+def turn_scope():
+    """
+    Give one agent turn a fresh memo (usable as a decorator). Worker threads started with
+    asyncio.to_thread and tasks created inside the turn copy the context, so they share it.
+    """
+    token = _TURN_CACHE.set({})
+    try:
+        yield
+    finally:
+        _TURN_CACHE.reset(token)
+
+
+def turn_cache() -> Optional[Dict[str, Any]]:
+    """Return the current turn's memo, or None when not inside a turn"""
+    return _TURN_CACHE.get()
+
+
+def normalize_place(place_name: str) -> str:
+    """Normalize a place name into a cache key ("  Paris " and "paris" share an entry)"""
+    return place_name.strip().casefold()
+
+
+def coords_key(latitude: float, longitude: float) -> str:
+    """Round coordinates to ~1km so lookups for nearby points share an entry"""
+    return f"{latitude:.2f},{longitude:.2f}"
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    The least recently used entry is evicted once maxsize is reached.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600, name: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        if name:
+            _REGISTRY[name] = self
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl seconds"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters"""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+class PersistentTTLCache(TTLCache):
+    """
+    TTLCache that also writes entries to a diskcache directory (unless directory is None),
+    so they survive restarts. With a redis_prefix and REDIS_URL set, entries are shared
+    through Redis as JSON too (lookup order: memory, Redis, disk). Missing packages or
+    unreachable backends are skipped, down to a plain TTLCache.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600, name: Optional[str] = None,
+                 directory: Optional[str] = CACHE_DIR, redis_prefix: Optional[str] = None):
+        super().__init__(maxsize=maxsize, ttl=ttl, name=name)
+        self.disk_hits = 0
+        self.redis_hits = 0
+        self._disk = None
+        self._redis = None
+        self._redis_prefix = redis_prefix
+        if directory is not None:
+            try:
+                import diskcache
+                self._disk = diskcache.Cache(os.path.join(directory, name or "default"))
+            except ImportError:
+                pass
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  WARNING: persistent cache disabled ({e})")
+        
+        if redis_prefix and REDIS_URL:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+            except ImportError:
+                print("⚠️  WARNING: REDIS_URL is set but the redis package is not installed")
+    
+    def _redis_get(self, key: Hashable) -> Any:
+        try:
+            raw = self._redis.get(f"{self._redis_prefix}:{key}")
+            return _MISSING if raw is None else json.loads(raw)
+        except Exception:  # unreachable Redis or a corrupt entry reads as a miss
+            return _MISSING
+    
+    def _disk_get(self, key: Hashable) -> Any:
+        try:
+            return self._disk.get(key, default=_MISSING)
+        except Exception:  # sqlite errors, diskcache.Timeout, unreadable entries
+            return _MISSING
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value from memory, then Redis, then disk, or default"""
+        value = super().get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return self._backend_get(key, default)
+    
+    async def aget(self, key: Hashable, default: Any = None) -> Any:
+        """Async get: memory hits return at once, Redis and disk are read in a worker thread"""
+        value = super().get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self._redis is None and self._disk is None:
+            return default
+        return await asyncio.to_thread(self._backend_get, key, default)
+    
+    def _backend_get(self, key: Hashable, default: Any) -> Any:
+        """Look key up in Redis, then on disk, copying a hit into memory"""
+        if self._redis is not None:
+            value = self._redis_get(key)
+            if value is not _MISSING:
+                self.redis_hits += 1
+                super().set(key, value)
+                return value
+        if self._disk is not None:
+            value = self._disk_get(key)
+            if value is not _MISSING:
+                self.disk_hits += 1
+                super().set(key, value)
+                return value
+        return default
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value in memory, Redis and on disk for ttl seconds"""
+        super().set(key, value)
+        self._backend_set(key, value)
+    
+    async def aset(self, key: Hashable, value: Any) -> None:
+        """Async set: memory is updated at once, Redis and disk are written in a worker thread"""
+        super().set(key, value)
+        if self._redis is not None or self._disk is not None:
+            await asyncio.to_thread(self._backend_set, key, value)
+    
+    def _backend_set(self, key: Hashable, value: Any) -> None:
+        """Write value to Redis and disk"""
+        if self._redis is not None:
+            try:
+                self._redis.setex(f"{self._redis_prefix}:{key}", int(self.ttl), json.dumps(value))
+            except Exception:
+                pass
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, expire=self.ttl)
+            except Exception:  # a full or locked disk leaves the entry in memory (and Redis) only
+                pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return memory counters plus Redis and disk hits"""
+        return {
+            **super().stats(),
+            "redis_hits": self.redis_hits,
+            "disk_hits": self.disk_hits,
+            "redis": self._redis is not None,
+            "persistent": self._disk is not None
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the stats of every named cache"""
+    return {name: cache.stats() for name, cache in _REGISTRY.items()}
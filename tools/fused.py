@@ -0,0 +1,61 @@
+"""
+Fused Lookup - One geocode, then weather and places fetched concurrently on a shared client
+"""
+import asyncio
+import httpx
+from langchain.tools import tool
+from typing import Dict, Tuple
+from .geocoding_tool import aget_coordinates
+from .weather_tool import alookup_weather, WeatherReport
+from .places_tool import alookup_places, PlacesReport
+from ._http import HTTP2, LIMITS
+
+
+async def fetch_all(place_name: str) -> Tuple[Dict, WeatherReport, PlacesReport]:
+    """
+    Geocode a place once and gather its weather and tourist attractions. All three requests
+    share one AsyncClient, so connections are pooled (and multiplexed over HTTP/2 where the
+    server supports it) for the duration of the lookup.
+    
+    Args:
+        place_name: The name of the place/city to look up
+    
+    Returns:
+        (get_coordinates result, WeatherReport, PlacesReport)
+    """
+    async with httpx.AsyncClient(timeout=15, limits=LIMITS, http2=HTTP2) as client:
+        geo_result = await aget_coordinates(place_name, client)
+        weather, places = await asyncio.gather(
+            alookup_weather(place_name, geo_result, client),
+            alookup_places(place_name, geo_result, client)
+        )
+    return geo_result, weather, places
+
+
+@tool
+def get_place_info(place_name: str) -> str:
+    """
+    Get current weather AND up to 5 tourist attractions for a place in a single step.
+    
+    Use this instead of calling get_weather and get_tourist_places separately whenever the
+    user asks about both the weather and places to visit.
+    
+    Args:
+        place_name: The name of the place/city to look up (e.g., "Bangalore", "Paris", "Tokyo")
+    
+    Returns:
+        The weather sentence followed by the list of attractions, or an error message.
+    
+    Example:
+        get_place_info("Bangalore")
+        Returns: "In Bangalore it's currently 24°C with a chance of 35% to rain.
+        In Bangalore these are the places you can go,
+        Lalbagh
+        ..."
+    """
+    _, weather, places = asyncio.run(fetch_all(place_name))
+    
+    # An unknown place fails both lookups with the same message - say it once
+    if weather.message == places.message:
+        return weather.message
+    return f"{weather.message}\n{places.message}"
@@ -0,0 +1,1199 @@
+"""
+Gazetteer - Precomputed coordinates for major and popular tourist cities
+
+Generated from the GeoNames cities15000/cities1000 dumps (CC BY 4.0): the 1000 most populous
+cities, every national capital and a hand-picked list of tourist destinations, plus common
+alternate names (Bombay, Cochin, ...). The finished table is then checked against every city in
+cities1000: a name is kept only if its entry is the most populous city of that name and at least
+4x the size of the next one, so ambiguous names (Barcelona, Cambridge, Hyderabad, ...) still go
+through Nominatim. Keys are normalize_place()d names.
+"""
+from typing import Dict, Tuple
+
+
+# place name -> (display name, latitude, longitude)
+CITIES: Dict[str, Tuple[str, float, float]] = {
+    "aba": ("Aba, Nigeria", 5.1066, 7.3667),
+    "abeokuta": ("Abeokuta, Nigeria", 7.1557, 3.3451),
+    "abidjan": ("Abidjan, Ivory Coast", 5.3544, -4.0017),
+    "abobo": ("Abobo, Ivory Coast", 5.4161, -4.0159),
+    "abu dhabi": ("Abu Dhabi, United Arab Emirates", 24.4512, 54.397),
+    "abuja": ("Abuja, Nigeria", 9.0579, 7.4951),
+    "abū ghurayb": ("Abū Ghurayb, Iraq", 33.3056, 44.1848),
+    "acapulco de juárez": ("Acapulco de Juárez, Mexico", 16.8494, -99.9089),
+    "accra": ("Accra, Ghana", 5.556, -0.1969),
+    "adachi": ("Adachi, Japan", 35.7632, 139.8076),
+    "adana": ("Adana, Turkey", 36.9862, 35.3253),
+    "addis ababa": ("Addis Ababa, Ethiopia", 9.025, 38.7469),
+    "adelaide": ("Adelaide, Australia", -34.9287, 138.5986),
+    "aden": ("Aden, Yemen", 12.7796, 45.0385),
+    "agadir": ("Agadir, Morocco", 30.4202, -9.5982),
+    "agege": ("Agege, Nigeria", 6.6156, 3.3334),
+    "agra": ("Agra, India", 27.1833, 78.0167),
+    "aguascalientes": ("Aguascalientes, Mexico", 21.8826, -102.2843),
+    "ahmedabad": ("Ahmedabad, India", 23.0258, 72.5873),
+    "ahvaz": ("Ahvaz, Iran", 31.319, 48.6842),
+    "aihara": ("Aihara, Japan", 35.6, 139.3167),
+    "akure": ("Akure, Nigeria", 7.2526, 5.1931),
+    "al ain city": ("Al Ain City, United Arab Emirates", 24.1917, 55.7606),
+    "al aḩmadī": ("Al Aḩmadī, Kuwait", 29.0769, 48.0839),
+    "al başrah al qadīmah": ("Al Başrah al Qadīmah, Iraq", 30.5032, 47.8151),
+    "al mansurah": ("Al Mansurah, Egypt", 31.0364, 31.3807),
+    "al mawşil al jadīdah": ("Al Mawşil al Jadīdah, Iraq", 36.3327, 43.1056),
+    "al maḩallah al kubrá": ("Al Maḩallah al Kubrá, Egypt", 30.9706, 31.1669),
+    "al ḩudaydah": ("Al Ḩudaydah, Yemen", 14.7978, 42.9545),
+    "alappuzha": ("Alappuzha, India", 9.49, 76.3264),
+    "aleppo": ("Aleppo, Syria", 36.2012, 37.1612),
+    "alexandria": ("Alexandria, Egypt", 31.2018, 29.9158),
+    "algiers": ("Algiers, Algeria", 36.7323, 3.0875),
+    "alleppey": ("Alappuzha, India", 9.49, 76.3264),
+    "almaty": ("Almaty, Kazakhstan", 43.2525, 76.9115),
+    "alofi": ("Alofi, Niue", -19.0529, -169.9196),
+    "alīgarh": ("Alīgarh, India", 27.8815, 78.0746),
+    "amman": ("Amman, Jordan", 31.9552, 35.945),
+    "amravati": ("Amravati, India", 20.9333, 77.75),
+    "amritsar": ("Amritsar, India", 31.6223, 74.8753),
+    "amsterdam": ("Amsterdam, The Netherlands", 52.374, 4.8897),
+    "andijon": ("Andijon, Uzbekistan", 40.7834, 72.3507),
+    "andorra la vella": ("Andorra la Vella, Andorra", 42.5078, 1.5211),
+    "ankang": ("Ankang, China", 32.68, 109.0172),
+    "ankara": ("Ankara, Turkey", 39.9199, 32.8543),
+    "anqing": ("Anqing, China", 30.5136, 117.0472),
+    "ansan-si": ("Ansan-si, South Korea", 37.3236, 126.8219),
+    "anshan": ("Anshan, China", 41.1236, 122.99),
+    "anshun": ("Anshun, China", 26.25, 105.9333),
+    "antalya": ("Antalya, Turkey", 36.9081, 30.6956),
+    "antananarivo": ("Antananarivo, Madagascar", -18.9137, 47.5361),
+    "antipolo": ("Antipolo, Philippines", 14.6258, 121.1225),
+    "anyang": ("Anyang, China", 36.096, 114.3828),
+    "anyang-si": ("Anyang-si, South Korea", 37.3925, 126.9269),
+    "apia": ("Apia, Samoa", -13.8333, -171.7667),
+    "aracaju": ("Aracaju, Brazil", -10.9111, -37.0717),
+    "arequipa": ("Arequipa, Peru", -16.399, -71.5375),
+    "arifwala": ("Arifwala, Pakistan", 30.2906, 73.0657),
+    "arusha": ("Arusha, Tanzania", -3.3667, 36.6833),
+    "ashgabat": ("Ashgabat, Turkmenistan", 37.95, 58.3833),
+    "asmara": ("Asmara, Eritrea", 15.3381, 38.9318),
+    "astana": ("Astana, Kazakhstan", 51.1801, 71.446),
+    "asunción": ("Asunción, Paraguay", -25.2865, -57.647),
+    "aswān": ("Aswān, Egypt", 24.0908, 32.8994),
+    "athens": ("Athens, Greece", 37.9838, 23.7278),
+    "auckland": ("Auckland, New Zealand", -36.8485, 174.7635),
+    "aurangabad": ("Aurangabad, India", 19.8776, 75.3423),
+    "austin": ("Austin, United States", 30.2672, -97.7431),
+    "avarua": ("Avarua, Cook Islands", -21.2075, -159.7755),
+    "baghdad": ("Baghdad, Iraq", 33.3406, 44.4009),
+    "bahawalpur": ("Bahawalpur, Pakistan", 29.3978, 71.6752),
+    "bahçelievler": ("Bahçelievler, Turkey", 41.0023, 28.8598),
+    "baise": ("Baise, China", 23.8901, 106.6268),
+    "baku": ("Baku, Azerbaijan", 40.3777, 49.892),
+    "balikpapan": ("Balikpapan, Indonesia", -1.2675, 116.8289),
+    "baltimore": ("Baltimore, United States", 39.2904, -76.6122),
+    "bamako": ("Bamako, Mali", 12.6091, -7.9752),
+    "banaras": ("Varanasi, India", 25.3167, 83.0104),
+    "bandar lampung": ("Bandar Lampung, Indonesia", -5.4292, 105.2611),
+    "bandar seri begawan": ("Bandar Seri Begawan, Brunei", 4.8903, 114.9401),
+    "bandung": ("Bandung, Indonesia", -6.9222, 107.6069),
+    "bangalore": ("Bengaluru, India", 12.9719, 77.5937),
+    "bangkok": ("Bangkok, Thailand", 13.754, 100.5014),
+    "bangui": ("Bangui, Central African Republic", 4.3612, 18.555),
+    "banjarmasin": ("Banjarmasin, Indonesia", -3.3199, 114.5907),
+    "banjul": ("Banjul, Gambia", 13.4527, -16.578),
+    "bannu": ("Bannu, Pakistan", 32.9853, 70.604),
+    "bao'an": ("Bao'an, China", 22.5521, 113.8829),
+    "baoding": ("Baoding, China", 38.8729, 115.4625),
+    "baoji": ("Baoji, China", 34.3678, 107.237),
+    "baotou": ("Baotou, China", 40.6516, 109.8439),
+    "bareilly": ("Bareilly, India", 28.3668, 79.4317),
+    "barnaul": ("Barnaul, Russia", 53.362, 83.7279),
+    "baroda": ("Vadodara, India", 22.2994, 73.2081),
+    "barquisimeto": ("Barquisimeto, Venezuela", 10.0647, -69.357),
+    "barranquilla": ("Barranquilla, Colombia", 10.9685, -74.7813),
+    "basrah": ("Basrah, Iraq", 30.5085, 47.7804),
+    "basse-terre": ("Basse-Terre, Guadeloupe", 15.9971, -61.7321),
+    "basseterre": ("Basseterre, Saint Kitts and Nevis", 17.2955, -62.725),
+    "batam": ("Batam, Indonesia", 1.1494, 104.0249),
+    "bath": ("Bath, United Kingdom", 51.3751, -2.3617),
+    "battagram": ("Battagram, Pakistan", 34.6772, 73.0233),
+    "bauchi": ("Bauchi, Nigeria", 10.3103, 9.8439),
+    "bayan nur": ("Bayan Nur, China", 40.7414, 107.386),
+    "bazhong": ("Bazhong, China", 31.8694, 106.7443),
+    "bağcılar": ("Bağcılar, Turkey", 41.039, 28.8567),
+    "beijing": ("Beijing, China", 39.9075, 116.3972),
+    "beira": ("Beira, Mozambique", -19.8436, 34.8389),
+    "beirut": ("Beirut, Lebanon", 33.8933, 35.5016),
+    "bekasi": ("Bekasi, Indonesia", -6.2349, 106.9896),
+    "belgrade": ("Belgrade, Serbia", 44.804, 20.4651),
+    "belmopan": ("Belmopan, Belize", 17.2538, -88.764),
+    "belo horizonte": ("Belo Horizonte, Brazil", -19.9208, -43.9378),
+    "belém": ("Belém, Brazil", -1.4558, -48.5044),
+    "benares": ("Varanasi, India", 25.3167, 83.0104),
+    "bengaluru": ("Bengaluru, India", 12.9719, 77.5937),
+    "bengbu": ("Bengbu, China", 32.9408, 117.3608),
+    "benghazi": ("Benghazi, Libya", 32.1149, 20.0686),
+    "benin city": ("Benin City, Nigeria", 6.3381, 5.6258),
+    "benoni": ("Benoni, South Africa", -26.1885, 28.3208),
+    "benxi": ("Benxi, China", 41.2886, 123.765),
+    "bergen": ("Bergen, Norway", 60.393, 5.3242),
+    "berlin": ("Berlin, Germany", 52.5244, 13.4105),
+    "bern": ("Bern, Switzerland", 46.9481, 7.4474),
+    "bhavnagar": ("Bhavnagar, India", 21.7629, 72.1533),
+    "bhayandar": ("Bhayandar, India", 19.3016, 72.8511),
+    "bhilai": ("Bhilai, India", 21.2092, 81.4285),
+    "bhiwandi": ("Bhiwandi, India", 19.3002, 73.0588),
+    "bhopal": ("Bhopal, India", 23.2547, 77.4029),
+    "bhubaneswar": ("Bhubaneswar, India", 20.2724, 85.8338),
+    "bijie": ("Bijie, China", 27.3019, 105.2863),
+    "bikaner": ("Bikaner, India", 28.0176, 73.3149),
+    "binzhou": ("Binzhou, China", 37.3667, 118.0167),
+    "birmingham": ("Birmingham, United Kingdom", 52.4814, -1.8998),
+    "bishkek": ("Bishkek, Kyrgyzstan", 42.87, 74.59),
+    "bissau": ("Bissau, Guinea-Bissau", 11.8636, -15.5977),
+    "biên hòa": ("Biên Hòa, Vietnam", 10.9447, 106.8243),
+    "blantyre": ("Blantyre, Malawi", -15.785, 35.0085),
+    "bobo-dioulasso": ("Bobo-Dioulasso, Burkina Faso", 11.1806, -4.2949),
+    "bodh gaya": ("Bodh Gaya, India", 24.6981, 84.9869),
+    "bogor": ("Bogor, Indonesia", -6.5944, 106.7892),
+    "bogota": ("Bogotá, Colombia", 4.6097, -74.0817),
+    "bogotá": ("Bogotá, Colombia", 4.6097, -74.0817),
+    "bombay": ("Mumbai, India", 19.0728, 72.8826),
+    "borama": ("Borama, Somalia", 9.9361, 43.1828),
+    "borivli": ("Borivli, India", 19.235, 72.8598),
+    "boston": ("Boston, United States", 42.3584, -71.0598),
+    "bouaké": ("Bouaké, Ivory Coast", 7.6939, -5.0303),
+    "bozhou": ("Bozhou, China", 33.8772, 115.7703),
+    "brampton": ("Brampton, Canada", 43.6834, -79.7663),
+    "brasília": ("Brasília, Brazil", -15.7797, -47.9297),
+    "bratislava": ("Bratislava, Slovakia", 48.1482, 17.1067),
+    "brazzaville": ("Brazzaville, Republic of the Congo", -4.2661, 15.2832),
+    "bridgetown": ("Bridgetown, Barbados", 13.1073, -59.6202),
+    "brisbane": ("Brisbane, Australia", -27.4679, 153.0281),
+    "brooklyn": ("Brooklyn, United States", 40.6501, -73.9496),
+    "brugge": ("Brugge, Belgium", 51.2089, 3.2242),
+    "brussels": ("Brussels, Belgium", 50.8505, 4.3488),
+    "bucaramanga": ("Bucaramanga, Colombia", 7.125, -73.1189),
+    "bucharest": ("Bucharest, Romania", 44.4323, 26.1063),
+    "bucheon-si": ("Bucheon-si, South Korea", 37.4989, 126.7831),
+    "budapest": ("Budapest, Hungary", 47.4984, 19.0404),
+    "budta": ("Budta, Philippines", 7.2042, 124.4397),
+    "buenos aires": ("Buenos Aires, Argentina", -34.6131, -58.3772),
+    "bujumbura": ("Bujumbura, Burundi", -3.3819, 29.3614),
+    "bukavu": ("Bukavu, Democratic Republic of the Congo", -2.4908, 28.8428),
+    "bukit rahman putra": ("Bukit Rahman Putra, Malaysia", 3.2173, 101.5608),
+    "bulawayo": ("Bulawayo, Zimbabwe", -20.15, 28.5833),
+    "buraydah": ("Buraydah, Saudi Arabia", 26.326, 43.975),
+    "bursa": ("Bursa, Turkey", 40.1956, 29.0601),
+    "busan": ("Busan, South Korea", 35.1017, 129.03),
+    "cagayan de oro": ("Cagayan de Oro, Philippines", 8.4822, 124.6472),
+    "cairns": ("Cairns, Australia", -16.9237, 145.7661),
+    "cairo": ("Cairo, Egypt", 30.0626, 31.2497),
+    "calamba": ("Calamba, Philippines", 14.2117, 121.1653),
+    "calcutta": ("Kolkata, India", 22.5626, 88.363),
+    "calgary": ("Calgary, Canada", 51.0501, -114.0853),
+    "cali": ("Cali, Colombia", 3.4305, -76.5199),
+    "callao": ("Callao, Peru", -12.0516, -77.1345),
+    "caloocan": ("Caloocan, Philippines", 14.6495, 120.9679),
+    "calumbo": ("Calumbo, Angola", -9.1469, 13.4194),
+    "camama": ("Camama, Angola", -8.9361, 13.2652),
+    "camayenne": ("Camayenne, Guinea", 9.535, -13.6878),
+    "campinas": ("Campinas, Brazil", -22.9056, -47.0608),
+    "campo grande": ("Campo Grande, Brazil", -20.4428, -54.6464),
+    "canberra": ("Canberra, Australia", -35.2835, 149.1281),
+    "cancún": ("Cancún, Mexico", 21.1743, -86.8466),
+    "canton": ("Guangzhou, China", 23.1167, 113.25),
+    "cape town": ("Cape Town, South Africa", -33.9258, 18.4232),
+    "cappadocia": ("Göreme, Turkey", 38.64284, 34.82885),
+    "caracas": ("Caracas, Venezuela", 10.488, -66.8792),
+    "cartagena": ("Cartagena, Colombia", 10.3982, -75.4933),
+    "casablanca": ("Casablanca, Morocco", 33.5883, -7.6114),
+    "cayenne": ("Cayenne, French Guiana", 4.9381, -52.3346),
+    "cebu city": ("Cebu City, Philippines", 10.3167, 123.8907),
+    "chandigarh": ("Chandigarh, India", 30.7363, 76.7884),
+    "changchun": ("Changchun, China", 43.88, 125.3228),
+    "changde": ("Changde, China", 29.0321, 111.6984),
+    "changning": ("Changning, China", 31.2174, 121.421),
+    "changsha": ("Changsha, China", 28.1987, 112.9709),
+    "changshu": ("Changshu, China", 31.6461, 120.7422),
+    "changwon": ("Changwon, South Korea", 35.2281, 128.6811),
+    "changzhou": ("Changzhou, China", 31.7736, 119.954),
+    "chaozhou": ("Chaozhou, China", 23.654, 116.6226),
+    "charlotte": ("Charlotte, United States", 35.2271, -80.8431),
+    "charlotte amalie": ("Charlotte Amalie, U.S. Virgin Islands", 18.3419, -64.9307),
+    "chattogram": ("Chattogram, Bangladesh", 22.3384, 91.8317),
+    "chelyabinsk": ("Chelyabinsk, Russia", 55.1611, 61.4288),
+    "chengdu": ("Chengdu, China", 30.6667, 104.0667),
+    "chennai": ("Chennai, India", 13.0878, 80.2785),
+    "chenzhou": ("Chenzhou, China", 25.8, 113.0333),
+    "cheonan": ("Cheonan, South Korea", 36.8065, 127.1522),
+    "cheongju-si": ("Cheongju-si, South Korea", 36.6372, 127.4897),
+    "chiang mai": ("Chiang Mai, Thailand", 18.7904, 98.9847),
+    "chiba": ("Chiba, Japan", 35.6, 140.1167),
+    "chicago": ("Chicago, United States", 41.85, -87.65),
+    "chiclayo": ("Chiclayo, Peru", -6.7701, -79.855),
+    "chihuahua": ("Chihuahua, Mexico", 28.6353, -106.0889),
+    "chisinau": ("Chisinau, Moldova", 47.009, 28.8594),
+    "chizhou": ("Chizhou, China", 30.6613, 117.4778),
+    "chongming": ("Chongming, China", 31.6185, 121.6962),
+    "chongqing": ("Chongqing, China", 29.5603, 106.5577),
+    "chunian": ("Chunian, Pakistan", 30.9662, 73.9791),
+    "chuzhou": ("Chuzhou, China", 32.3219, 118.2978),
+    "cimahi": ("Cimahi, Indonesia", -6.8722, 107.5425),
+    "ciudad de la paz": ("Ciudad de la Paz, Equatorial Guinea", 1.5925, 10.8236),
+    "ciudad guayana": ("Ciudad Guayana, Venezuela", 8.3512, -62.641),
+    "ciudad juárez": ("Ciudad Juárez, Mexico", 31.7202, -106.4608),
+    "ciudad nezahualcoyotl": ("Ciudad Nezahualcoyotl, Mexico", 19.4006, -99.0148),
+    "cixi": ("Cixi, China", 30.1764, 121.2457),
+    "cochabamba": ("Cochabamba, Bolivia", -17.3819, -66.1599),
+    "cochin": ("Kochi, India", 9.9399, 76.2602),
+    "cockburn town": ("Cockburn Town, Turks and Caicos Islands", 21.4612, -71.1419),
+    "coimbatore": ("Coimbatore, India", 11.0055, 76.9661),
+    "cologne": ("Köln, Germany", 50.9333, 6.95),
+    "columbus": ("Columbus, United States", 39.9612, -82.9988),
+    "comilla": ("Comilla, Bangladesh", 23.4619, 91.185),
+    "conakry": ("Conakry, Guinea", 9.538, -13.6773),
+    "contagem": ("Contagem, Brazil", -19.9317, -44.0536),
+    "coorg": ("Kodagu, India", 12.4208, 75.7397),
+    "copenhagen": ("Copenhagen, Denmark", 55.6759, 12.5655),
+    "cotonou": ("Cotonou, Benin", 6.3654, 2.4183),
+    "coyoacán": ("Coyoacán, Mexico", 19.3467, -99.1617),
+    "cracow": ("Kraków, Poland", 50.0614, 19.9366),
+    "cuenca": ("Cuenca, Ecuador", -2.8953, -78.9963),
+    "cuiabá": ("Cuiabá, Brazil", -15.5961, -56.0967),
+    "culiacán": ("Culiacán, Mexico", 24.8021, -107.3942),
+    "curitiba": ("Curitiba, Brazil", -25.4278, -49.2731),
+    "cusco": ("Cusco, Peru", -13.5319, -71.967),
+    "cuttack": ("Cuttack, India", 20.465, 85.8793),
+    "cuzco": ("Cusco, Peru", -13.5319, -71.967),
+    "córdoba": ("Córdoba, Argentina", -31.4065, -64.1885),
+    "cúcuta": ("Cúcuta, Colombia", 7.9074, -72.5049),
+    "cần thơ": ("Cần Thơ, Vietnam", 10.0371, 105.7883),
+    "da nang": ("Da Nang, Vietnam", 16.0678, 108.2208),
+    "daegu": ("Daegu, South Korea", 35.8703, 128.5911),
+    "daejeon": ("Daejeon, South Korea", 36.3491, 127.3849),
+    "dakar": ("Dakar, Senegal", 14.6937, -17.4441),
+    "dalian": ("Dalian, China", 38.9122, 121.6022),
+    "dallas": ("Dallas, United States", 32.7831, -96.8067),
+    "damascus": ("Damascus, Syria", 33.5102, 36.2913),
+    "dammam": ("Dammam, Saudi Arabia", 26.4344, 50.1033),
+    "dandong": ("Dandong, China", 40.1292, 124.3947),
+    "daqing": ("Daqing, China", 46.5833, 125.0),
+    "dar es salaam": ("Dar es Salaam, Tanzania", -6.8235, 39.2695),
+    "datong": ("Datong, China", 40.0936, 113.2914),
+    "davao": ("Davao, Philippines", 7.0731, 125.6128),
+    "dazhou": ("Dazhou, China", 31.2106, 107.4631),
+    "delhi": ("Delhi, India", 28.6519, 77.2315),
+    "denpasar": ("Denpasar, Indonesia", -8.65, 115.2167),
+    "denver": ("Denver, United States", 39.7392, -104.9847),
+    "depok": ("Depok, Indonesia", -6.4, 106.8186),
+    "dera ismail khan": ("Dera Ismail Khan, Pakistan", 31.8313, 70.9017),
+    "detroit": ("Detroit, United States", 42.3314, -83.0457),
+    "deyang": ("Deyang, China", 31.1302, 104.382),
+    "dezhou": ("Dezhou, China", 37.4466, 116.3671),
+    "dhaka": ("Dhaka, Bangladesh", 23.7104, 90.4074),
+    "dhanbad": ("Dhanbad, India", 23.7976, 86.4299),
+    "dharamsala": ("Dharamsala, India", 32.2201, 76.3201),
+    "dhārāvi": ("Dhārāvi, India", 19.05, 72.8667),
+    "dili": ("Dili, Timor Leste", -8.5586, 125.5736),
+    "diyarbakır": ("Diyarbakır, Turkey", 37.9136, 40.2172),
+    "djibouti": ("Djibouti, Djibouti", 11.589, 43.145),
+    "dnipro": ("Dnipro, Ukraine", 48.4666, 35.0407),
+    "dodoma": ("Dodoma, Tanzania", -6.1722, 35.7395),
+    "doha": ("Doha, Qatar", 25.2855, 51.531),
+    "dombivali": ("Dombivali, India", 19.2167, 73.0833),
+    "donetsk": ("Donetsk, Ukraine", 48.023, 37.8022),
+    "dongguan": ("Dongguan, China", 23.018, 113.7487),
+    "dongying": ("Dongying, China", 37.4627, 118.4917),
+    "dortmund": ("Dortmund, Germany", 51.5149, 7.466),
+    "douala": ("Douala, Cameroon", 4.0483, 9.7043),
+    "dubai": ("Dubai, United Arab Emirates", 25.0772, 55.3093),
+    "dublin": ("Dublin, Ireland", 53.3331, -6.2489),
+    "dubrovnik": ("Dubrovnik, Croatia", 42.6412, 18.1091),
+    "duque de caxias": ("Duque de Caxias, Brazil", -22.7856, -43.3117),
+    "durban": ("Durban, South Africa", -29.8579, 31.0292),
+    "dushanbe": ("Dushanbe, Tajikistan", 38.5358, 68.779),
+    "düsseldorf": ("Düsseldorf, Germany", 51.2232, 6.7793),
+    "dārjiling": ("Dārjiling, India", 27.0333, 88.2667),
+    "east jerusalem": ("East Jerusalem, Palestinian Territory", 31.7834, 35.2339),
+    "ecatepec de morelos": ("Ecatepec de Morelos, Mexico", 19.6049, -99.0606),
+    "edinburgh": ("Edinburgh, United Kingdom", 55.9521, -3.1965),
+    "edmonton": ("Edmonton, Canada", 53.5501, -113.4687),
+    "edogawe": ("Edogawe, Japan", 35.6923, 139.8731),
+    "el paso": ("El Paso, United States", 31.7587, -106.4869),
+    "enugu": ("Enugu, Nigeria", 6.4413, 7.4988),
+    "erbil": ("Erbil, Iraq", 36.1912, 44.0094),
+    "erzurum": ("Erzurum, Turkey", 39.9086, 41.2769),
+    "esenyurt": ("Esenyurt, Turkey", 41.027, 28.6773),
+    "eskişehir": ("Eskişehir, Turkey", 39.7767, 30.5206),
+    "essen": ("Essen, Germany", 51.4566, 7.0123),
+    "evaton": ("Evaton, South Africa", -26.5333, 27.85),
+    "e’zhou": ("E’zhou, China", 30.3961, 114.8865),
+    "faisalabad": ("Faisalabad, Pakistan", 31.4155, 73.0897),
+    "faridabad": ("Faridabad, India", 28.4112, 77.3132),
+    "feira de santana": ("Feira de Santana, Brazil", -12.2667, -38.9667),
+    "fengxiang": ("Fengxiang, China", 30.8584, 121.4678),
+    "fes": ("Fes, Morocco", 34.0331, -5.0003),
+    "florence": ("Florence, Italy", 43.7792, 11.2463),
+    "flying fish cove": ("Flying Fish Cove, Christmas Island", -10.4217, 105.6791),
+    "fort worth": ("Fort Worth, United States", 32.7254, -97.3208),
+    "fort-de-france": ("Fort-de-France, Martinique", 14.6037, -61.0742),
+    "fortaleza": ("Fortaleza, Brazil", -3.7172, -38.5431),
+    "foshan": ("Foshan, China", 23.0268, 113.1315),
+    "frankfurt am main": ("Frankfurt am Main, Germany", 50.1155, 8.6842),
+    "freetown": ("Freetown, Sierra Leone", 8.4871, -13.2356),
+    "fukuoka": ("Fukuoka, Japan", 33.6, 130.4167),
+    "funafuti": ("Funafuti, Tuvalu", -8.5243, 179.1942),
+    "fushun": ("Fushun, China", 41.8867, 123.9436),
+    "fuxin": ("Fuxin, China", 42.0156, 121.6589),
+    "fuyang": ("Fuyang, China", 32.9, 115.8167),
+    "gaborone": ("Gaborone, Botswana", -24.6545, 25.9086),
+    "galle": ("Galle, Sri Lanka", 6.0461, 80.2103),
+    "gangtok": ("Gangtok, India", 27.3257, 88.6122),
+    "ganzhou": ("Ganzhou, China", 25.8466, 114.9326),
+    "gaziantep": ("Gaziantep, Turkey", 37.0594, 37.3825),
+    "gazipur": ("Gazipur, Bangladesh", 23.9984, 90.4223),
+    "general santos": ("General Santos, Philippines", 6.1128, 125.1717),
+    "geneva": ("Geneva, Switzerland", 46.2022, 6.1457),
+    "genoa": ("Genoa, Italy", 44.4048, 8.9444),
+    "ghāziābād": ("Ghāziābād, India", 28.6654, 77.4391),
+    "gibraltar": ("Gibraltar, Gibraltar", 36.1447, -5.3526),
+    "gitega": ("Gitega, Burundi", -3.4271, 29.9246),
+    "giza": ("Giza, Egypt", 30.0094, 31.2086),
+    "glasgow": ("Glasgow, United Kingdom", 55.8651, -4.2576),
+    "goa": ("Goa, India", 15.3004, 74.0855),
+    "goiânia": ("Goiânia, Brazil", -16.6786, -49.2539),
+    "gold coast": ("Gold Coast, Australia", -28.0003, 153.4309),
+    "golfe": ("Golfe, Angola", -8.8664, 13.2617),
+    "gothenburg": ("Gothenburg, Sweden", 57.7072, 11.9668),
+    "goyang-si": ("Goyang-si, South Korea", 37.6564, 126.835),
+    "gqeberha": ("Gqeberha, South Africa", -33.9611, 25.6149),
+    "grytviken": ("Grytviken, South Georgia and the South Sandwich Islands", -54.2811, -36.5092),
+    "guadalajara": ("Guadalajara, Mexico", 20.6774, -103.3475),
+    "guangzhou": ("Guangzhou, China", 23.1167, 113.25),
+    "guang’an": ("Guang’an, China", 30.4741, 106.637),
+    "guankou": ("Guankou, China", 28.1586, 113.6271),
+    "guarulhos": ("Guarulhos, Brazil", -23.4628, -46.5333),
+    "guatemala city": ("Guatemala City, Guatemala", 14.6407, -90.5133),
+    "guayaquil": ("Guayaquil, Ecuador", -2.1962, -79.8862),
+    "guigang": ("Guigang, China", 23.116, 109.5947),
+    "guilin": ("Guilin, China", 25.2802, 110.2964),
+    "guiyang": ("Guiyang, China", 26.5833, 106.7167),
+    "gujranwala": ("Gujranwala, Pakistan", 32.1557, 74.187),
+    "guntur": ("Guntur, India", 16.2997, 80.4573),
+    "gurgaon": ("Gurugram, India", 28.4601, 77.0263),
+    "gurugram": ("Gurugram, India", 28.4601, 77.0263),
+    "gustavia": ("Gustavia, Saint Barthelemy", 17.8962, -62.8498),
+    "gustavo adolfo madero": ("Gustavo Adolfo Madero, Mexico", 19.4939, -99.1107),
+    "guwahati": ("Guwahati, India", 26.1844, 91.7458),
+    "gwalior": ("Gwalior, India", 26.2298, 78.1734),
+    "gwangju": ("Gwangju, South Korea", 35.1547, 126.9156),
+    "göreme": ("Göreme, Turkey", 38.6428, 34.8289),
+    "ha'il": ("Ha'il, Saudi Arabia", 27.5219, 41.6907),
+    "hachiōji": ("Hachiōji, Japan", 35.6558, 139.3239),
+    "haikou": ("Haikou, China", 20.0342, 110.3465),
+    "haiphong": ("Haiphong, Vietnam", 20.8648, 106.6834),
+    "hakone": ("Hakone, Japan", 35.1895, 139.0265),
+    "hamamatsu": ("Hamamatsu, Japan", 34.7, 137.7333),
+    "hamburg": ("Hamburg, Germany", 53.5507, 9.993),
+    "hampi": ("Hampi, India", 15.3352, 76.4603),
+    "handan": ("Handan, China", 36.61, 114.4876),
+    "hangzhou": ("Hangzhou, China", 30.2936, 120.1614),
+    "hanoi": ("Hanoi, Vietnam", 21.0245, 105.8412),
+    "hanzhong": ("Hanzhong, China", 33.0751, 107.0221),
+    "harare": ("Harare, Zimbabwe", -17.8277, 31.0534),
+    "harbin": ("Harbin, China", 45.75, 126.65),
+    "haridwar": ("Haridwar, India", 29.9479, 78.1603),
+    "havana": ("Havana, Cuba", 23.133, -82.383),
+    "hebi": ("Hebi, China", 35.7323, 114.2862),
+    "hefei": ("Hefei, China", 31.8639, 117.2808),
+    "hegang": ("Hegang, China", 47.3473, 130.2903),
+    "helsinki": ("Helsinki, Finland", 60.1695, 24.9354),
+    "hengyang": ("Hengyang, China", 26.8895, 112.6189),
+    "hermosillo": ("Hermosillo, Mexico", 29.0887, -110.9668),
+    "heshan": ("Heshan, China", 28.5694, 112.3473),
+    "heze": ("Heze, China", 35.2393, 115.4736),
+    "hezhou": ("Hezhou, China", 24.4036, 111.5667),
+    "hiroshima": ("Hiroshima, Japan", 34.4, 132.45),
+    "hlaingthaya": ("Hlaingthaya, Myanmar", 16.85, 96.0667),
+    "ho chi minh": ("Ho Chi Minh City, Vietnam", 10.823, 106.6296),
+    "ho chi minh city": ("Ho Chi Minh City, Vietnam", 10.823, 106.6296),
+    "hobart": ("Hobart, Australia", -42.8794, 147.3294),
+    "hohhot": ("Hohhot, China", 40.8106, 111.6522),
+    "hoi an": ("Hoi An, Vietnam", 15.8794, 108.335),
+    "hoji ya henda": ("Hoji ya Henda, Angola", -8.8052, 13.2897),
+    "homs": ("Homs, Syria", 34.724, 36.7256),
+    "honchō": ("Honchō, Japan", 35.7013, 139.9865),
+    "hong kong": ("Hong Kong, Hong Kong", 22.2783, 114.1747),
+    "hong kong island": ("Hong Kong Island, Hong Kong", 22.263, 114.1842),
+    "hongkou": ("Hongkou, China", 31.25, 121.4892),
+    "honiara": ("Honiara, Solomon Islands", -9.4333, 159.95),
+    "honolulu": ("Honolulu, United States", 21.3069, -157.8583),
+    "houston": ("Houston, United States", 29.7633, -95.3633),
+    "howrah": ("Howrah, India", 22.5769, 88.3186),
+    "huai'an": ("Huai'an, China", 33.5886, 119.0192),
+    "huaibei": ("Huaibei, China", 33.9744, 116.7917),
+    "huainan": ("Huainan, China", 32.6264, 116.9969),
+    "huambo": ("Huambo, Angola", -12.7761, 15.7392),
+    "huangshi": ("Huangshi, China", 30.2471, 115.0481),
+    "hubballi": ("Hubballi, India", 15.3478, 75.1338),
+    "huizhou": ("Huizhou, China", 23.1115, 114.4152),
+    "huludao": ("Huludao, China", 40.7524, 120.8355),
+    "huzhou": ("Huzhou, China", 30.8703, 120.0933),
+    "huế": ("Huế, Vietnam", 16.4619, 107.5955),
+    "hwaseong-si": ("Hwaseong-si, South Korea", 37.2068, 126.8169),
+    "ibadan": ("Ibadan, Nigeria", 7.3776, 3.9059),
+    "ibb": ("Ibb, Yemen", 13.9667, 44.1833),
+    "ilorin": ("Ilorin, Nigeria", 8.4966, 4.5421),
+    "incheon": ("Incheon, South Korea", 37.4565, 126.7052),
+    "indianapolis": ("Indianapolis, United States", 39.7684, -86.158),
+    "indore": ("Indore, India", 22.7179, 75.8333),
+    "innsbruck": ("Innsbruck, Austria", 47.2627, 11.3945),
+    "ipoh": ("Ipoh, Malaysia", 4.5841, 101.0829),
+    "irkutsk": ("Irkutsk, Russia", 52.2957, 104.2908),
+    "irákleion": ("Irákleion, Greece", 35.3279, 25.1434),
+    "isfahan": ("Isfahan, Iran", 32.6525, 51.6746),
+    "iskandar puteri": ("Iskandar Puteri, Malaysia", 1.3932, 103.6232),
+    "islamabad": ("Islamabad, Pakistan", 33.7215, 73.0433),
+    "istanbul": ("Istanbul, Turkey", 41.0138, 28.9497),
+    "itabashi": ("Itabashi, Japan", 35.7489, 139.715),
+    "izhevsk": ("Izhevsk, Russia", 56.8522, 53.1986),
+    "iztapalapa": ("Iztapalapa, Mexico", 19.3553, -99.0622),
+    "i̇zmir": ("İzmir, Turkey", 38.4127, 27.1384),
+    "jabalpur": ("Jabalpur, India", 23.167, 79.9501),
+    "jaboatão dos guararapes": ("Jaboatão dos Guararapes, Brazil", -8.1128, -35.0147),
+    "jacksonville": ("Jacksonville, United States", 30.3322, -81.6556),
+    "jaipur": ("Jaipur, India", 26.9196, 75.7878),
+    "jaisalmer": ("Jaisalmer, India", 26.9176, 70.9039),
+    "jakarta": ("Jakarta, Indonesia", -6.2146, 106.8451),
+    "jalandhar": ("Jalandhar, India", 31.3256, 75.5792),
+    "jambi city": ("Jambi City, Indonesia", -1.6, 103.6167),
+    "jammu": ("Jammu, India", 32.7353, 74.8617),
+    "jamnagar": ("Jamnagar, India", 22.4729, 70.0667),
+    "jamshedpur": ("Jamshedpur, India", 22.8028, 86.1855),
+    "jeddah": ("Jeddah, Saudi Arabia", 21.4901, 39.1862),
+    "jeonju": ("Jeonju, South Korea", 35.8219, 127.1489),
+    "jepara": ("Jepara, Indonesia", -6.5924, 110.671),
+    "jerusalem": ("Jerusalem, Israel", 31.769, 35.2163),
+    "jhang sadr": ("Jhang Sadr, Pakistan", 31.2698, 72.3169),
+    "jiading": ("Jiading, China", 31.3858, 121.2446),
+    "jiangmen": ("Jiangmen, China", 22.5833, 113.0833),
+    "jiangyin": ("Jiangyin, China", 31.911, 120.263),
+    "jiaozhou": ("Jiaozhou, China", 36.2839, 120.0033),
+    "jiaozuo": ("Jiaozuo, China", 35.2392, 113.2391),
+    "jiaxing": ("Jiaxing, China", 30.7522, 120.75),
+    "jieyang": ("Jieyang, China", 23.5418, 116.3658),
+    "jilin": ("Jilin, China", 43.8465, 126.5608),
+    "jinan": ("Jinan, China", 36.6683, 116.9972),
+    "jingmen": ("Jingmen, China", 31.0336, 112.2047),
+    "jingzhou": ("Jingzhou, China", 30.3503, 112.1903),
+    "jing’an": ("Jing’an, China", 31.22, 121.4158),
+    "jinhua": ("Jinhua, China", 29.1068, 119.6442),
+    "jining": ("Jining, China", 35.405, 116.5814),
+    "jinjiang": ("Jinjiang, China", 24.8198, 118.5742),
+    "jinshan": ("Jinshan, China", 30.8356, 121.2937),
+    "jinzhong": ("Jinzhong, China", 37.684, 112.7547),
+    "jiujiang": ("Jiujiang, China", 29.7048, 116.0021),
+    "jodhpur": ("Jodhpur, India", 26.2684, 73.0059),
+    "johannesburg": ("Johannesburg, South Africa", -26.2023, 28.0436),
+    "johor bahru": ("Johor Bahru, Malaysia", 1.4655, 103.7578),
+    "jos": ("Jos, Nigeria", 9.9285, 8.8921),
+    "joão pessoa": ("João Pessoa, Brazil", -7.115, -34.8631),
+    "juba": ("Juba, South Sudan", 4.8517, 31.5825),
+    "jājmau": ("Jājmau, India", 26.4304, 80.4095),
+    "kabul": ("Kabul, Afghanistan", 34.5281, 69.1723),
+    "kaduna": ("Kaduna, Nigeria", 10.5264, 7.4388),
+    "kagoshima": ("Kagoshima, Japan", 31.5667, 130.55),
+    "kaifeng": ("Kaifeng, China", 34.7986, 114.3074),
+    "kakamega": ("Kakamega, Kenya", 0.2842, 34.7523),
+    "kallakurichi": ("Kallakurichi, India", 11.7338, 78.9592),
+    "kalyān": ("Kalyān, India", 19.2437, 73.1355),
+    "kampala": ("Kampala, Uganda", 0.3163, 32.5822),
+    "kampung baru subang": ("Kampung Baru Subang, Malaysia", 3.15, 101.5333),
+    "kananga": ("Kananga, Democratic Republic of the Congo", -5.8962, 22.4166),
+    "kanayannur": ("Kanayannur, India", 9.9667, 76.2667),
+    "kandy": ("Kandy, Sri Lanka", 7.2906, 80.6336),
+    "kano": ("Kano, Nigeria", 12.0001, 8.5167),
+    "kanpur": ("Kanpur, India", 26.4652, 80.3498),
+    "kaohsiung": ("Kaohsiung, Taiwan", 22.6163, 120.3133),
+    "karachi": ("Karachi, Pakistan", 24.8608, 67.0104),
+    "karaj": ("Karaj, Iran", 35.8327, 50.9915),
+    "karbala": ("Karbala, Iraq", 32.616, 44.0249),
+    "kathmandu": ("Kathmandu, Nepal", 27.7017, 85.3206),
+    "katsina": ("Katsina, Nigeria", 12.9908, 7.6018),
+    "kawaguchi": ("Kawaguchi, Japan", 35.8052, 139.7107),
+    "kawasaki": ("Kawasaki, Japan", 35.5206, 139.7172),
+    "kayseri": ("Kayseri, Turkey", 38.7322, 35.4853),
+    "kazan": ("Kazan, Russia", 55.7887, 49.1221),
+    "kennedy": ("Kennedy, Colombia", 4.6165, -74.146),
+    "kerman": ("Kerman, Iran", 30.2832, 57.0788),
+    "kermanshah": ("Kermanshah, Iran", 34.3142, 47.065),
+    "khabarovsk": ("Khabarovsk, Russia", 48.462, 135.0971),
+    "khajuraho group of monuments": ("Khajuraho Group of Monuments, India", 24.8481, 79.9335),
+    "kharkiv": ("Kharkiv, Ukraine", 49.9818, 36.2548),
+    "khartoum": ("Khartoum, Sudan", 15.5518, 32.5324),
+    "khartoum north": ("Khartoum North, Sudan", 15.6493, 32.5346),
+    "khulna": ("Khulna, Bangladesh", 22.8098, 89.5644),
+    "kiev": ("Kyiv, Ukraine", 50.4547, 30.5238),
+    "kigali": ("Kigali, Rwanda", -1.95, 30.0588),
+    "kikolo": ("Kikolo, Angola", -8.7815, 13.3338),
+    "kingston": ("Kingston, Jamaica", 17.997, -76.7936),
+    "kingstown": ("Kingstown, Saint Vincent and the Grenadines", 13.1553, -61.2274),
+    "kinshasa": ("Kinshasa, Democratic Republic of the Congo", -4.3276, 15.3136),
+    "kirkuk": ("Kirkuk, Iraq", 35.4681, 44.3922),
+    "kisangani": ("Kisangani, Democratic Republic of the Congo", 0.5153, 25.191),
+    "kitakyushu": ("Kitakyushu, Japan", 33.8518, 130.8503),
+    "kitwe": ("Kitwe, Zambia", -12.8024, 28.2132),
+    "kobe": ("Kobe, Japan", 34.6913, 135.183),
+    "kodaikānāl": ("Kodaikānāl, India", 10.2393, 77.4893),
+    "kolkata": ("Kolkata, India", 22.5626, 88.363),
+    "kolwezi": ("Kolwezi, Democratic Republic of the Congo", -10.7148, 25.4667),
+    "konya": ("Konya, Turkey", 37.8713, 32.4846),
+    "kota": ("Kota, India", 25.1825, 75.8391),
+    "kowloon": ("Kowloon, Hong Kong", 22.3167, 114.1833),
+    "krakow": ("Kraków, Poland", 50.0614, 19.9366),
+    "kraków": ("Kraków, Poland", 50.0614, 19.9366),
+    "krasnodar": ("Krasnodar, Russia", 45.0453, 38.9818),
+    "krasnoyarsk": ("Krasnoyarsk, Russia", 56.0374, 92.9314),
+    "kryvyy rih": ("Kryvyy Rih, Ukraine", 47.9057, 33.394),
+    "kuala lumpur": ("Kuala Lumpur, Malaysia", 3.1412, 101.6865),
+    "kumamoto": ("Kumamoto, Japan", 32.8059, 130.6918),
+    "kumasi": ("Kumasi, Ghana", 6.6885, -1.6244),
+    "kunming": ("Kunming, China", 25.0389, 102.7183),
+    "kunshan": ("Kunshan, China", 31.3776, 120.9543),
+    "kuwait city": ("Kuwait City, Kuwait", 29.367, 47.9743),
+    "kyiv": ("Kyiv, Ukraine", 50.4547, 30.5238),
+    "kyoto": ("Kyoto, Japan", 35.0211, 135.7538),
+    "köln": ("Köln, Germany", 50.9333, 6.95),
+    "küçükçekmece": ("Küçükçekmece, Turkey", 40.991, 28.7712),
+    "la paz": ("La Paz, Bolivia", -16.5, -68.15),
+    "lagos": ("Lagos, Nigeria", 6.4541, 3.3947),
+    "lahore": ("Lahore, Pakistan", 31.558, 74.3507),
+    "laibin": ("Laibin, China", 23.7474, 109.2222),
+    "laiwu": ("Laiwu, China", 36.1928, 117.6569),
+    "langfang": ("Langfang, China", 39.5208, 116.7147),
+    "lanzhou": ("Lanzhou, China", 36.057, 103.8399),
+    "las piñas": ("Las Piñas, Philippines", 14.4506, 120.9828),
+    "las vegas": ("Las Vegas, United States", 36.175, -115.1372),
+    "latakia": ("Latakia, Syria", 35.5312, 35.7909),
+    "leh": ("Leh, India", 34.165, 77.584),
+    "leshan": ("Leshan, China", 29.5623, 103.7639),
+    "león de los aldama": ("León de los Aldama, Mexico", 21.1218, -101.6825),
+    "lianyungang": ("Lianyungang, China", 34.5984, 119.2156),
+    "liaocheng": ("Liaocheng, China", 36.4506, 116.0025),
+    "liaoyang": ("Liaoyang, China", 41.2719, 123.1731),
+    "libreville": ("Libreville, Gabon", 0.3924, 9.4536),
+    "likasi": ("Likasi, Democratic Republic of the Congo", -10.983, 26.7384),
+    "lilongwe": ("Lilongwe, Malawi", -13.9669, 33.7873),
+    "lima": ("Lima, Peru", -12.0432, -77.0282),
+    "linfen": ("Linfen, China", 36.0889, 111.5189),
+    "linyi": ("Linyi, China", 35.0631, 118.3428),
+    "lisbon": ("Lisbon, Portugal", 38.7251, -9.1498),
+    "liupanshui": ("Liupanshui, China", 26.5944, 104.8333),
+    "liuzhou": ("Liuzhou, China", 24.324, 109.407),
+    "liverpool": ("Liverpool, United Kingdom", 53.4106, -2.9779),
+    "ljubljana": ("Ljubljana, Slovenia", 46.0511, 14.5051),
+    "lomé": ("Lomé, Togo", 6.1287, 1.2215),
+    "lonavla": ("Lonavla, India", 18.7527, 73.4057),
+    "london": ("London, United Kingdom", 51.5085, -0.1257),
+    "londrina": ("Londrina, Brazil", -23.3103, -51.1628),
+    "longyan": ("Longyan, China", 25.0749, 117.0178),
+    "longyearbyen": ("Longyearbyen, Svalbard and Jan Mayen", 78.2233, 15.6469),
+    "los angeles": ("Los Angeles, United States", 34.0522, -118.2437),
+    "louisville": ("Louisville, United States", 38.2542, -85.7594),
+    "luancheng": ("Luancheng, China", 37.8845, 114.6463),
+    "luanda": ("Luanda, Angola", -8.8368, 13.2343),
+    "luang prabang": ("Luang Prabang, Laos", 19.8933, 102.1525),
+    "lubango": ("Lubango, Angola", -14.9172, 13.4925),
+    "lubumbashi": ("Lubumbashi, Democratic Republic of the Congo", -11.6609, 27.4794),
+    "lucerne": ("Luzern, Switzerland", 47.0505, 8.3064),
+    "lucknow": ("Lucknow, India", 26.8393, 80.9231),
+    "ludhiana": ("Ludhiana, India", 30.912, 75.8538),
+    "luohe": ("Luohe, China", 33.5742, 114.0326),
+    "luohu district": ("Luohu District, China", 22.5472, 114.1315),
+    "luoyang": ("Luoyang, China", 34.6735, 112.4368),
+    "lusaka": ("Lusaka, Zambia", -15.4067, 28.2871),
+    "luxembourg": ("Luxembourg, Luxembourg", 49.6098, 6.1327),
+    "luxor": ("Luxor, Egypt", 25.6989, 32.6421),
+    "luzern": ("Luzern, Switzerland", 47.0505, 8.3064),
+    "luzhou": ("Luzhou, China", 28.8903, 105.4257),
+    "lu’an": ("Lu’an, China", 31.7356, 116.5169),
+    "lviv": ("Lviv, Ukraine", 49.8383, 24.0232),
+    "lüliang": ("Lüliang, China", 37.5192, 111.1444),
+    "macau": ("Macau, Macao", 22.2006, 113.5461),
+    "maceió": ("Maceió, Brazil", -9.6658, -35.7353),
+    "madikeri": ("Madikeri, India", 12.426, 75.7382),
+    "madinah": ("Madinah, Saudi Arabia", 24.4686, 39.6142),
+    "madras": ("Chennai, India", 13.0878, 80.2785),
+    "madrid": ("Madrid, Spain", 40.4165, -3.7026),
+    "madurai": ("Madurai, India", 9.919, 78.1195),
+    "madīnat an naşr": ("Madīnat an Naşr, Egypt", 30.0667, 31.3),
+    "mahabaleshwar": ("Mahabaleshwar, India", 17.9232, 73.6586),
+    "maianga": ("Maianga, Angola", -8.8469, 13.237),
+    "maiduguri": ("Maiduguri, Nigeria", 11.8469, 13.1571),
+    "majuro": ("Majuro, Marshall Islands", 7.0897, 171.3803),
+    "makassar": ("Makassar, Indonesia", -5.1486, 119.4319),
+    "makhachkala": ("Makhachkala, Russia", 42.9778, 47.5003),
+    "makkah": ("Makkah, Saudi Arabia", 21.4266, 39.8256),
+    "malacca": ("Malacca, Malaysia", 2.196, 102.2405),
+    "malang": ("Malang, Indonesia", -7.9797, 112.6304),
+    "malatya": ("Malatya, Turkey", 38.3502, 38.3167),
+    "male": ("Male, Maldives", 4.1752, 73.5092),
+    "malingao": ("Malingao, Philippines", 7.1608, 124.475),
+    "mamoudzou": ("Mamoudzou, Mayotte", -12.7823, 45.2288),
+    "managua": ("Managua, Nicaragua", 12.1328, -86.2504),
+    "manama": ("Manama, Bahrain", 26.2279, 50.5857),
+    "manaus": ("Manaus, Brazil", -3.1019, -60.025),
+    "mandalay": ("Mandalay, Myanmar", 21.9747, 96.0836),
+    "mangalore": ("Mangaluru, India", 12.9172, 74.856),
+    "mangaluru": ("Mangaluru, India", 12.9172, 74.856),
+    "manhattan": ("Manhattan, United States", 40.7834, -73.9663),
+    "manila": ("Manila, Philippines", 14.6042, 120.9822),
+    "maoming": ("Maoming, China", 21.6663, 110.9136),
+    "maputo": ("Maputo, Mozambique", -25.9655, 32.5832),
+    "mar del plata": ("Mar del Plata, Argentina", -38.0004, -57.5562),
+    "maracaibo": ("Maracaibo, Venezuela", 10.6423, -71.6109),
+    "mariehamn": ("Mariehamn, Aland Islands", 60.0973, 19.9348),
+    "marrakech": ("Marrakesh, Morocco", 31.6342, -7.9999),
+    "marrakesh": ("Marrakesh, Morocco", 31.6342, -7.9999),
+    "marseille": ("Marseille, France", 43.297, 5.3811),
+    "maseru": ("Maseru, Lesotho", -29.3167, 27.4833),
+    "mashhad": ("Mashhad, Iran", 36.2981, 59.6057),
+    "matola": ("Matola, Mozambique", -25.9622, 32.4589),
+    "maturín": ("Maturín, Venezuela", 9.7457, -63.1832),
+    "ma’anshan": ("Ma’anshan, China", 31.6858, 118.5101),
+    "mbabane": ("Mbabane, Eswatini", -26.3167, 31.1333),
+    "mbuji-mayi": ("Mbuji-Mayi, Democratic Republic of the Congo", -6.136, 23.5898),
+    "mecca": ("Makkah, Saudi Arabia", 21.4266, 39.8256),
+    "medan": ("Medan, Indonesia", 3.5833, 98.6667),
+    "medellín": ("Medellín, Colombia", 6.245, -75.5715),
+    "meerut": ("Meerut, India", 28.98, 77.7064),
+    "meishan": ("Meishan, China", 30.0439, 103.837),
+    "meizhou": ("Meizhou, China", 24.2886, 116.1177),
+    "melbourne": ("Melbourne, Australia", -37.814, 144.9633),
+    "memphis": ("Memphis, United States", 35.1495, -90.049),
+    "mengzi": ("Mengzi, China", 23.3678, 103.3821),
+    "mexicali": ("Mexicali, Mexico", 32.6278, -115.4545),
+    "mexico city": ("Mexico City, Mexico", 19.4285, -99.1277),
+    "miami": ("Miami, United States", 25.7743, -80.1937),
+    "mianyang": ("Mianyang, China", 31.4678, 104.6817),
+    "milan": ("Milan, Italy", 45.4643, 9.1895),
+    "minhang": ("Minhang, China", 31.1088, 121.3747),
+    "minsk": ("Minsk, Belarus", 53.9002, 27.5665),
+    "mississauga": ("Mississauga, Canada", 43.5789, -79.6583),
+    "mogadishu": ("Mogadishu, Somalia", 2.0371, 45.3438),
+    "mombasa": ("Mombasa, Kenya", -4.0547, 39.6636),
+    "monaco": ("Monaco, Monaco", 43.7372, 7.4215),
+    "monrovia": ("Monrovia, Liberia", 6.3005, -10.7969),
+    "monterrey": ("Monterrey, Mexico", 25.6843, -100.3172),
+    "montevideo": ("Montevideo, Uruguay", -34.9033, -56.1882),
+    "montreal": ("Montréal, Canada", 45.5088, -73.5878),
+    "montréal": ("Montréal, Canada", 45.5088, -73.5878),
+    "morelia": ("Morelia, Mexico", 19.7008, -101.1844),
+    "moroni": ("Moroni, Comoros", -11.7022, 43.2551),
+    "morādābād": ("Morādābād, India", 28.8389, 78.7768),
+    "moscow": ("Moscow, Russia", 55.752, 37.6178),
+    "mosul": ("Mosul, Iraq", 36.335, 43.1189),
+    "mudanjiang": ("Mudanjiang, China", 44.548, 129.6259),
+    "mukalla": ("Mukalla, Yemen", 14.5425, 49.1242),
+    "mulenvos": ("Mulenvos, Angola", -8.8669, 13.3344),
+    "multan": ("Multan, Pakistan", 30.1968, 71.4782),
+    "mumbai": ("Mumbai, India", 19.0728, 72.8826),
+    "munich": ("Munich, Germany", 48.1374, 11.5755),
+    "munnar": ("Munnar, India", 10.0882, 77.0624),
+    "muscat": ("Muscat, Oman", 23.5841, 58.4078),
+    "mussoorie": ("Mussoorie, India", 30.455, 78.0707),
+    "muzaffarābād": ("Muzaffarābād, Pakistan", 34.37, 73.4708),
+    "mwanza": ("Mwanza, Tanzania", -2.5167, 32.9),
+    "mykonos": ("Mykonos, Greece", 37.4453, 25.3287),
+    "mysore": ("Mysuru, India", 12.2979, 76.6393),
+    "mysuru": ("Mysuru, India", 12.2979, 76.6393),
+    "málaga": ("Málaga, Spain", 36.7202, -4.4203),
+    "mérida": ("Mérida, Mexico", 20.967, -89.6232),
+    "n'djamena": ("N'Djamena, Chad", 12.1067, 15.0444),
+    "nagoya": ("Nagoya, Japan", 35.1815, 136.9064),
+    "nagpur": ("Nagpur, India", 21.1463, 79.0849),
+    "naini tāl": ("Naini Tāl, India", 29.3974, 79.4469),
+    "nairobi": ("Nairobi, Kenya", -1.2833, 36.8167),
+    "najafgarh": ("Najafgarh, India", 28.6092, 76.9798),
+    "namangan": ("Namangan, Uzbekistan", 40.9983, 71.6726),
+    "nampula": ("Nampula, Mozambique", -15.1165, 39.2666),
+    "nanchang": ("Nanchang, China", 28.684, 115.8531),
+    "nanchong": ("Nanchong, China", 30.7951, 106.0847),
+    "nanjing": ("Nanjing, China", 32.0617, 118.7778),
+    "nanning": ("Nanning, China", 22.8167, 108.3167),
+    "nantong": ("Nantong, China", 32.0303, 120.8747),
+    "nanyang": ("Nanyang, China", 33.0052, 112.5466),
+    "naples": ("Naples, Italy", 40.8522, 14.2681),
+    "nara-shi": ("Nara-shi, Japan", 34.685, 135.8048),
+    "narela": ("Narela, India", 28.8527, 77.0929),
+    "nashik": ("Nashik, India", 19.9973, 73.791),
+    "nashville": ("Nashville, United States", 36.1659, -86.7844),
+    "nassau": ("Nassau, Bahamas", 25.0582, -77.3431),
+    "natal": ("Natal, Brazil", -5.795, -35.2094),
+    "naucalpan de juárez": ("Naucalpan de Juárez, Mexico", 19.4785, -99.2396),
+    "navi mumbai": ("Navi Mumbai, India", 19.0368, 73.0158),
+    "nay pyi taw": ("Nay Pyi Taw, Myanmar", 19.745, 96.1297),
+    "ndola": ("Ndola, Zambia", -12.9587, 28.6366),
+    "neijiang": ("Neijiang, China", 29.5835, 105.0622),
+    "new delhi": ("New Delhi, India", 28.6214, 77.2148),
+    "new kingston": ("New Kingston, Jamaica", 18.0075, -76.7832),
+    "new orleans": ("New Orleans, United States", 29.9547, -90.0751),
+    "new south memphis": ("New South Memphis, United States", 35.0868, -90.0568),
+    "new taipei city": ("New Taipei City, Taiwan", 25.062, 121.457),
+    "new territories": ("New Territories, Hong Kong", 22.4244, 114.111),
+    "new york": ("New York City, United States", 40.7143, -74.006),
+    "new york city": ("New York City, United States", 40.7143, -74.006),
+    "nha trang": ("Nha Trang, Vietnam", 12.2451, 109.1943),
+    "niamey": ("Niamey, Niger", 13.5137, 2.1098),
+    "nice": ("Nice, France", 43.7031, 7.2661),
+    "nicosia": ("Nicosia, Cyprus", 35.1728, 33.354),
+    "niigata": ("Niigata, Japan", 37.9226, 139.0412),
+    "ningbo": ("Ningbo, China", 29.8782, 121.5494),
+    "nizhniy novgorod": ("Nizhniy Novgorod, Russia", 56.3287, 44.002),
+    "nouakchott": ("Nouakchott, Mauritania", 18.0858, -15.9785),
+    "nova iguaçu": ("Nova Iguaçu, Brazil", -22.7592, -43.4511),
+    "novosibirsk": ("Novosibirsk, Russia", 55.0226, 82.9317),
+    "nowrangapur": ("Nowrangapur, India", 19.2311, 82.5483),
+    "nuuk": ("Nuuk, Greenland", 64.1835, -51.7216),
+    "nyc": ("New York City, United States", 40.7143, -74.006),
+    "oaxaca": ("Oaxaca, Mexico", 17.0602, -96.7254),
+    "odesa": ("Odesa, Ukraine", 46.4857, 30.7438),
+    "okayama": ("Okayama, Japan", 34.65, 133.9333),
+    "oklahoma city": ("Oklahoma City, United States", 35.4676, -97.5164),
+    "omdurman": ("Omdurman, Sudan", 15.6445, 32.4777),
+    "omsk": ("Omsk, Russia", 54.9924, 73.3686),
+    "onitsha": ("Onitsha, Nigeria", 6.1498, 6.7857),
+    "ooty": ("Ooty, India", 11.4134, 76.6952),
+    "oran": ("Oran, Algeria", 35.6991, -0.6359),
+    "oranjestad": ("Oranjestad, Aruba", 12.524, -70.027),
+    "ordos": ("Ordos, China", 39.6086, 109.7816),
+    "orlando": ("Orlando, United States", 28.5383, -81.3792),
+    "orūmīyeh": ("Orūmīyeh, Iran", 37.5527, 45.0761),
+    "osaka": ("Osaka, Japan", 34.6938, 135.5011),
+    "osasco": ("Osasco, Brazil", -23.5325, -46.7917),
+    "oslo": ("Oslo, Norway", 59.9127, 10.7461),
+    "osogbo": ("Osogbo, Nigeria", 7.771, 4.557),
+    "ottawa": ("Ottawa, Canada", 45.4112, -75.6981),
+    "ouagadougou": ("Ouagadougou, Burkina Faso", 12.3657, -1.5339),
+    "oxford": ("Oxford, United Kingdom", 51.7522, -1.256),
+    "oyo": ("Oyo, Nigeria", 7.8537, 3.9324),
+    "padang": ("Padang, Indonesia", -0.9492, 100.3543),
+    "pago pago": ("Pago Pago, American Samoa", -14.2781, -170.7025),
+    "palembang": ("Palembang, Indonesia", -2.9167, 104.7458),
+    "palermo": ("Palermo, Italy", 38.1166, 13.3636),
+    "palikir": ("Palikir, Micronesia", 6.9248, 158.1611),
+    "pallabi": ("Pallabi, Bangladesh", 23.825, 90.37),
+    "panaji": ("Panaji, India", 15.4909, 73.8278),
+    "panama city": ("Panama City, Panama", 8.9936, -79.5197),
+    "panjim": ("Panaji, India", 15.4909, 73.8278),
+    "panjin": ("Panjin, China", 41.121, 122.0739),
+    "panshan": ("Panshan, China", 41.1881, 122.0494),
+    "panzhihua": ("Panzhihua, China", 26.5851, 101.7128),
+    "papeete": ("Papeete, French Polynesia", -17.5347, -149.5684),
+    "paramaribo": ("Paramaribo, Suriname", 5.8664, -55.1668),
+    "paranaque city": ("Paranaque City, Philippines", 14.4816, 121.0175),
+    "paris": ("Paris, France", 48.8534, 2.3488),
+    "paro": ("Paro, Bhutan", 27.4305, 89.4133),
+    "pasig city": ("Pasig City, Philippines", 14.5869, 121.0614),
+    "patna": ("Patna, India", 25.5941, 85.1356),
+    "pattaya": ("Pattaya, Thailand", 12.9333, 100.8833),
+    "pekanbaru": ("Pekanbaru, Indonesia", 0.5167, 101.4417),
+    "peking": ("Beijing, China", 39.9075, 116.3972),
+    "pelentong": ("Pelentong, Malaysia", 1.5243, 103.824),
+    "perm": ("Perm, Russia", 58.0105, 56.2502),
+    "perth": ("Perth, Australia", -31.9522, 115.8614),
+    "peshawar": ("Peshawar, Pakistan", 34.008, 71.5785),
+    "pest": ("Pest, Hungary", 47.5, 19.0833),
+    "petaling jaya": ("Petaling Jaya, Malaysia", 3.1073, 101.6067),
+    "philadelphia": ("Philadelphia, United States", 39.9524, -75.1636),
+    "phnom penh": ("Phnom Penh, Cambodia", 11.5625, 104.916),
+    "phoenix": ("Phoenix, United States", 33.4484, -112.074),
+    "phuket": ("Phuket, Thailand", 7.8906, 98.3981),
+    "pietermaritzburg": ("Pietermaritzburg, South Africa", -29.6168, 30.3928),
+    "pikine": ("Pikine, Senegal", 14.7646, -17.3907),
+    "pimpri": ("Pimpri, India", 18.6229, 73.807),
+    "pimpri-chinchwad": ("Pimpri-Chinchwad, India", 18.6187, 73.8037),
+    "pingdingshan": ("Pingdingshan, China", 33.7309, 113.3155),
+    "pingxiang": ("Pingxiang, China", 27.6167, 113.8535),
+    "pisa": ("Pisa, Italy", 43.7085, 10.4036),
+    "piura": ("Piura, Peru", -5.1819, -80.6572),
+    "podgorica": ("Podgorica, Montenegro", 42.4412, 19.2631),
+    "pointe-noire": ("Pointe-Noire, Republic of the Congo", -4.7761, 11.8635),
+    "pokhara": ("Pokhara, Nepal", 28.2669, 83.9685),
+    "pondicherry": ("Puducherry, India", 11.9338, 79.8298),
+    "pontianak": ("Pontianak, Indonesia", -0.0319, 109.325),
+    "poona": ("Pune, India", 18.5196, 73.8554),
+    "port harcourt": ("Port Harcourt, Nigeria", 4.7774, 7.0134),
+    "port louis": ("Port Louis, Mauritius", -20.1619, 57.4989),
+    "port moresby": ("Port Moresby, Papua New Guinea", -9.4772, 147.1509),
+    "port of spain": ("Port of Spain, Trinidad and Tobago", 10.6667, -61.5189),
+    "port said": ("Port Said, Egypt", 31.2653, 32.3019),
+    "port-au-prince": ("Port-au-Prince, Haiti", 18.5435, -72.3388),
+    "portland": ("Portland, United States", 45.5234, -122.6762),
+    "porto": ("Porto, Portugal", 41.1485, -8.611),
+    "porto alegre": ("Porto Alegre, Brazil", -30.0328, -51.2302),
+    "porto-novo": ("Porto-Novo, Benin", 6.4965, 2.6036),
+    "prague": ("Prague, Czechia", 50.088, 14.4208),
+    "praia": ("Praia, Cabo Verde", 14.9315, -23.5125),
+    "prayagraj": ("Prayagraj, India", 25.4448, 81.8432),
+    "pretoria": ("Pretoria, South Africa", -25.7449, 28.1878),
+    "pristina": ("Pristina, Kosovo", 42.6727, 21.1669),
+    "pudong": ("Pudong, China", 31.24, 121.5009),
+    "puducherry": ("Puducherry, India", 11.9338, 79.8298),
+    "puebla": ("Puebla, Mexico", 19.0478, -98.2072),
+    "pune": ("Pune, India", 18.5196, 73.8554),
+    "puning": ("Puning, China", 23.3107, 116.1687),
+    "pushkar": ("Pushkar, India", 26.4902, 74.5521),
+    "putian": ("Putian, China", 25.4394, 119.0103),
+    "putuo": ("Putuo, China", 31.251, 121.3897),
+    "puxi": ("Puxi, China", 31.2441, 121.4659),
+    "puyang": ("Puyang, China", 29.4568, 119.8887),
+    "pyongyang": ("Pyongyang, North Korea", 39.0339, 125.7543),
+    "qingdao": ("Qingdao, China", 36.0649, 120.3804),
+    "qingpu": ("Qingpu, China", 31.1539, 121.1141),
+    "qingyang": ("Qingyang, China", 35.7098, 107.6445),
+    "qingyuan": ("Qingyuan, China", 23.7, 113.0333),
+    "qinhuangdao": ("Qinhuangdao, China", 39.941, 119.5894),
+    "qinzhou": ("Qinzhou, China", 21.9825, 108.6506),
+    "qiqihar": ("Qiqihar, China", 47.3392, 123.9615),
+    "qom": ("Qom, Iran", 34.6401, 50.8764),
+    "quanzhou": ("Quanzhou, China", 24.9139, 118.5858),
+    "quebec city": ("Québec, Canada", 46.8123, -71.2145),
+    "queens": ("Queens, United States", 40.6815, -73.8365),
+    "quetta": ("Quetta, Pakistan", 30.1841, 67.0014),
+    "quezon city": ("Quezon City, Philippines", 14.6488, 121.0509),
+    "quito": ("Quito, Ecuador", -0.2298, -78.525),
+    "qujing": ("Qujing, China", 25.4833, 103.7833),
+    "quzhou": ("Quzhou, China", 28.9594, 118.8686),
+    "québec": ("Québec, Canada", 46.8123, -71.2145),
+    "rabat": ("Rabat, Morocco", 34.0132, -6.8326),
+    "raipur": ("Raipur, India", 21.2333, 81.6333),
+    "rajshahi": ("Rajshahi, Bangladesh", 24.374, 88.6011),
+    "ranchi": ("Ranchi, India", 23.3432, 85.3094),
+    "rangpur": ("Rangpur, Bangladesh", 25.7466, 89.2517),
+    "rasapūdipalem": ("Rasapūdipalem, India", 17.7331, 83.3162),
+    "rasht": ("Rasht, Iran", 37.2761, 49.5886),
+    "rawalpindi": ("Rawalpindi, Pakistan", 33.5973, 73.0479),
+    "ra’s bayrūt": ("Ra’s Bayrūt, Lebanon", 33.9, 35.4833),
+    "recife": ("Recife, Brazil", -8.0539, -34.8811),
+    "reykjavík": ("Reykjavík, Iceland", 64.1355, -21.8954),
+    "reynosa": ("Reynosa, Mexico", 26.08, -98.2846),
+    "ribeirão preto": ("Ribeirão Preto, Brazil", -21.1775, -47.8103),
+    "riga": ("Riga, Latvia", 56.946, 24.1059),
+    "rio": ("Rio de Janeiro, Brazil", -22.9064, -43.1822),
+    "rio de janeiro": ("Rio de Janeiro, Brazil", -22.9064, -43.1822),
+    "rishīkesh": ("Rishīkesh, India", 30.1078, 78.2926),
+    "riyadh": ("Riyadh, Saudi Arabia", 24.6877, 46.7219),
+    "rizhao": ("Rizhao, China", 35.4141, 119.5291),
+    "road town": ("Road Town, British Virgin Islands", 18.4269, -64.6208),
+    "rohini": ("Rohini, India", 28.7432, 77.0678),
+    "rome": ("Rome, Italy", 41.8919, 12.5113),
+    "rosario": ("Rosario, Argentina", -32.9468, -60.6393),
+    "roseau": ("Roseau, Dominica", 15.3017, -61.3881),
+    "rostov-on-don": ("Rostov-on-Don, Russia", 47.22, 39.7077),
+    "rotterdam": ("Rotterdam, The Netherlands", 51.9225, 4.4792),
+    "rui’an": ("Rui’an, China", 27.7761, 120.6586),
+    "rājkot": ("Rājkot, India", 22.2916, 70.7932),
+    "sadr city": ("Sadr City, Iraq", 33.3889, 44.4583),
+    "sagamihara": ("Sagamihara, Japan", 35.5671, 139.2417),
+    "saigon": ("Ho Chi Minh City, Vietnam", 10.823, 106.6296),
+    "saint helier": ("Saint Helier, Jersey", 49.188, -2.1049),
+    "saint petersburg": ("Saint Petersburg, Russia", 59.9386, 30.3141),
+    "saipan": ("Saipan, Northern Mariana Islands", 15.2123, 145.7545),
+    "saitama": ("Saitama, Japan", 35.9081, 139.6566),
+    "sakai": ("Sakai, Japan", 34.5822, 135.4665),
+    "salem": ("Salem, India", 11.6538, 78.1554),
+    "saltillo": ("Saltillo, Mexico", 25.426, -100.9796),
+    "salvador": ("Salvador, Brazil", -12.9756, -38.491),
+    "salzburg": ("Salzburg, Austria", 47.7994, 13.044),
+    "salé": ("Salé, Morocco", 34.0531, -6.7985),
+    "samara": ("Samara, Russia", 53.2077, 50.1355),
+    "samarinda": ("Samarinda, Indonesia", -0.4917, 117.1458),
+    "samarkand": ("Samarkand, Uzbekistan", 39.6546, 66.9644),
+    "san antonio": ("San Antonio, United States", 29.4241, -98.4936),
+    "san diego": ("San Diego, United States", 32.7157, -117.1647),
+    "san francisco": ("San Francisco, United States", 37.7749, -122.4194),
+    "san jose": ("San Jose, United States", 37.3394, -121.895),
+    "san luis potosí": ("San Luis Potosí, Mexico", 22.1523, -100.9714),
+    "san pedro sula": ("San Pedro Sula, Honduras", 15.5059, -88.0259),
+    "san salvador": ("San Salvador, El Salvador", 13.6893, -89.1872),
+    "sanaa": ("Sanaa, Yemen", 15.3545, 44.2065),
+    "sanhe": ("Sanhe, China", 39.9805, 117.0689),
+    "sanmenxia": ("Sanmenxia, China", 34.7808, 111.1929),
+    "sanming": ("Sanming, China", 26.2486, 117.6186),
+    "santa cruz de la sierra": ("Santa Cruz de la Sierra, Bolivia", -17.7863, -63.1812),
+    "santiago": ("Santiago, Chile", -33.4569, -70.6483),
+    "santiago de los caballeros": ("Santiago de los Caballeros, Dominican Republic", 19.4504, -70.6908),
+    "santiago de querétaro": ("Santiago de Querétaro, Mexico", 20.5881, -100.3881),
+    "santo andré": ("Santo André, Brazil", -23.6639, -46.5383),
+    "santo domingo": ("Santo Domingo, Dominican Republic", 18.4719, -69.8923),
+    "santo domingo este": ("Santo Domingo Este, Dominican Republic", 18.4851, -69.8476),
+    "santo domingo oeste": ("Santo Domingo Oeste, Dominican Republic", 18.5, -70.0),
+    "santorini": ("Santorini, Greece", 36.3932, 25.4615),
+    "sanya": ("Sanya, China", 18.2543, 109.5095),
+    "sao paulo": ("São Paulo, Brazil", -23.5475, -46.6361),
+    "sapporo": ("Sapporo, Japan", 43.0667, 141.35),
+    "sarajevo": ("Sarajevo, Bosnia and Herzegovina", 43.8486, 18.3564),
+    "saratov": ("Saratov, Russia", 51.5405, 45.9901),
+    "sargodha": ("Sargodha, Pakistan", 32.0859, 72.6742),
+    "seattle": ("Seattle, United States", 47.6062, -122.3321),
+    "semarang": ("Semarang, Indonesia", -6.9931, 110.4208),
+    "sendai": ("Sendai, Japan", 38.2667, 140.8667),
+    "seongnam-si": ("Seongnam-si, South Korea", 37.4386, 127.1378),
+    "seoul": ("Seoul, South Korea", 37.566, 126.9784),
+    "serang": ("Serang, Indonesia", -6.1153, 106.1542),
+    "setagaya": ("Setagaya, Japan", 35.6419, 139.6472),
+    "sevilla": ("Sevilla, Spain", 37.3828, -5.9732),
+    "seville": ("Sevilla, Spain", 37.3828, -5.9732),
+    "shah alam": ("Shah Alam, Malaysia", 3.0851, 101.5328),
+    "shanghai": ("Shanghai, China", 31.2222, 121.4581),
+    "shangqiu": ("Shangqiu, China", 34.4143, 115.6561),
+    "shangrao": ("Shangrao, China", 28.4518, 117.9429),
+    "shangyu": ("Shangyu, China", 30.0156, 120.8711),
+    "shantou": ("Shantou, China", 23.3549, 116.6788),
+    "shaoguan": ("Shaoguan, China", 24.8, 113.5833),
+    "shaoxing": ("Shaoxing, China", 30.0024, 120.5786),
+    "shaoyang": ("Shaoyang, China", 27.2382, 111.4621),
+    "sharjah": ("Sharjah, United Arab Emirates", 25.3342, 55.4122),
+    "shekhupura": ("Shekhupura, Pakistan", 31.7129, 73.9856),
+    "shenyang": ("Shenyang, China", 41.7922, 123.4328),
+    "shenzhen": ("Shenzhen, China", 22.5455, 114.0683),
+    "shijiazhuang": ("Shijiazhuang, China", 38.0414, 114.4786),
+    "shillong": ("Shillong, India", 25.5689, 91.8831),
+    "shimla": ("Shimla, India", 31.1044, 77.1666),
+    "shiraz": ("Shiraz, Iran", 29.6103, 52.5311),
+    "shivaji nagar": ("Shivaji Nagar, India", 18.5302, 73.8526),
+    "shiyan": ("Shiyan, China", 32.6475, 110.7781),
+    "shizuishan": ("Shizuishan, China", 38.9808, 106.3892),
+    "shizuoka": ("Shizuoka, Japan", 34.9833, 138.3833),
+    "sholapur": ("Sholapur, India", 17.6715, 75.9104),
+    "shuangyashan": ("Shuangyashan, China", 46.6769, 131.1327),
+    "shubrā al khaymah": ("Shubrā al Khaymah, Egypt", 30.1251, 31.2505),
+    "shymkent": ("Shymkent, Kazakhstan", 42.3099, 69.6004),
+    "sialkot": ("Sialkot, Pakistan", 32.4927, 74.5313),
+    "siem reap": ("Siem Reap, Cambodia", 13.3618, 103.8606),
+    "siena": ("Siena, Italy", 43.3182, 11.3306),
+    "singapore": ("Singapore, Singapore", 1.2897, 103.8501),
+    "situbondo": ("Situbondo, Indonesia", -7.7062, 114.0098),
+    "skopje": ("Skopje, North Macedonia", 41.9965, 21.4314),
+    "soacha": ("Soacha, Colombia", 4.5794, -74.2168),
+    "sofia": ("Sofia, Bulgaria", 42.6975, 23.3241),
+    "sokoto": ("Sokoto, Nigeria", 13.0627, 5.2432),
+    "songjiang": ("Songjiang, China", 31.0344, 121.2233),
+    "sorocaba": ("Sorocaba, Brazil", -23.5017, -47.4581),
+    "soshanguve": ("Soshanguve, South Africa", -25.4729, 28.0992),
+    "south tangerang": ("South Tangerang, Indonesia", -6.2886, 106.7179),
+    "soweto": ("Soweto, South Africa", -26.2678, 27.8585),
+    "split": ("Split, Croatia", 43.5089, 16.4392),
+    "srinagar": ("Srinagar, India", 34.0857, 74.8055),
+    "st petersburg": ("Saint Petersburg, Russia", 59.9386, 30.3141),
+    "stockholm": ("Stockholm, Sweden", 59.3294, 18.0687),
+    "stuttgart": ("Stuttgart, Germany", 48.7823, 9.177),
+    "subang jaya": ("Subang Jaya, Malaysia", 3.0438, 101.5806),
+    "sucre": ("Sucre, Bolivia", -19.0333, -65.2627),
+    "suez": ("Suez, Egypt", 29.9737, 32.5263),
+    "suginami": ("Suginami, Japan", 36.2013, 140.2841),
+    "suining": ("Suining, China", 30.508, 105.5733),
+    "suizhou": ("Suizhou, China", 31.7111, 113.3631),
+    "sulaymaniyah": ("Sulaymaniyah, Iraq", 35.565, 45.4329),
+    "sulţānah": ("Sulţānah, Saudi Arabia", 24.4926, 39.5857),
+    "suqian": ("Suqian, China", 33.9492, 118.2958),
+    "surabaya": ("Surabaya, Indonesia", -7.2492, 112.7508),
+    "surat": ("Surat, India", 21.1959, 72.8302),
+    "suva": ("Suva, Fiji", -18.1368, 178.4253),
+    "suwon": ("Suwon, South Korea", 37.2911, 127.0089),
+    "suzhou": ("Suzhou, China", 31.3041, 120.5954),
+    "sydney": ("Sydney, Australia", -33.8678, 151.2073),
+    "são bernardo do campo": ("São Bernardo do Campo, Brazil", -23.6939, -46.565),
+    "são josé dos campos": ("São José dos Campos, Brazil", -23.1794, -45.8869),
+    "são luís": ("São Luís, Brazil", -2.5297, -44.3028),
+    "são paulo": ("São Paulo, Brazil", -23.5475, -46.6361),
+    "sāngli": ("Sāngli, India", 16.8544, 74.5642),
+    "tabriz": ("Tabriz, Iran", 38.08, 46.2919),
+    "tabuk": ("Tabuk, Saudi Arabia", 28.3998, 36.5715),
+    "taguig": ("Taguig, Philippines", 14.5243, 121.0792),
+    "taicang": ("Taicang, China", 31.4478, 121.0939),
+    "taichung": ("Taichung, Taiwan", 24.1469, 120.6839),
+    "tainan": ("Tainan, Taiwan", 22.9908, 120.2133),
+    "taipei": ("Taipei, Taiwan", 25.0531, 121.5264),
+    "taiyuan": ("Taiyuan, China", 37.8694, 112.5603),
+    "taiz": ("Taiz, Yemen", 13.5795, 44.0209),
+    "tai’an": ("Tai’an, China", 36.1853, 117.12),
+    "takeo": ("Takeo, Cambodia", 10.9908, 104.785),
+    "tallinn": ("Tallinn, Estonia", 59.437, 24.7535),
+    "tangerang": ("Tangerang, Indonesia", -6.1781, 106.63),
+    "tangier": ("Tangier, Morocco", 35.7673, -5.7998),
+    "tangshan": ("Tangshan, China", 39.6438, 118.1832),
+    "tanta": ("Tanta, Egypt", 30.7885, 31.0019),
+    "tarawa": ("Tarawa, Kiribati", 1.3278, 172.977),
+    "tashkent": ("Tashkent, Uzbekistan", 41.2647, 69.2163),
+    "tasikmalaya": ("Tasikmalaya, Indonesia", -7.3274, 108.2207),
+    "ta’if": ("Ta’if, Saudi Arabia", 21.2703, 40.4158),
+    "tbilisi": ("Tbilisi, Georgia", 41.6914, 44.8341),
+    "tegucigalpa": ("Tegucigalpa, Honduras", 14.0818, -87.2068),
+    "tehran": ("Tehran, Iran", 35.6944, 51.4215),
+    "teni": ("Teni, India", 10.0112, 77.4777),
+    "teresina": ("Teresina, Brazil", -5.0892, -42.8019),
+    "thanh hóa": ("Thanh Hóa, Vietnam", 19.8, 105.7667),
+    "the bronx": ("The Bronx, United States", 40.8499, -73.8664),
+    "the valley": ("The Valley, Anguilla", 18.217, -63.0578),
+    "thimphu": ("Thimphu, Bhutan", 27.4661, 89.6419),
+    "thiruvananthapuram": ("Thiruvananthapuram, India", 8.4855, 76.9492),
+    "thuận an": ("Thuận An, Vietnam", 10.9239, 106.7143),
+    "thāne": ("Thāne, India", 19.197, 72.9635),
+    "tianjin": ("Tianjin, China", 39.1422, 117.1767),
+    "tianshui": ("Tianshui, China", 34.5795, 105.7424),
+    "tijuana": ("Tijuana, Mexico", 32.5027, -117.0037),
+    "tirana": ("Tirana, Albania", 41.3274, 19.8187),
+    "tiruchirappalli": ("Tiruchirappalli, India", 10.8155, 78.6965),
+    "tirunelveli": ("Tirunelveli, India", 8.7274, 77.6838),
+    "tirupati": ("Tirupati, India", 13.6355, 79.4199),
+    "tiruppur": ("Tiruppur, India", 11.1154, 77.3546),
+    "tlalnepantla": ("Tlalnepantla, Mexico", 19.5401, -99.1954),
+    "tlalpan": ("Tlalpan, Mexico", 19.2951, -99.1621),
+    "tlaquepaque": ("Tlaquepaque, Mexico", 20.6412, -103.2934),
+    "tokyo": ("Tokyo, Japan", 35.6895, 139.6917),
+    "tolyatti": ("Tolyatti, Russia", 53.5303, 49.3461),
+    "toronto": ("Toronto, Canada", 43.7064, -79.3986),
+    "torreón": ("Torreón, Mexico", 25.5439, -103.419),
+    "touba": ("Touba, Senegal", 14.8623, -15.8753),
+    "tripoli": ("Tripoli, Libya", 32.8874, 13.1873),
+    "trivandrum": ("Thiruvananthapuram, India", 8.4855, 76.9492),
+    "trujillo": ("Trujillo, Peru", -8.116, -79.03),
+    "tshikapa": ("Tshikapa, Democratic Republic of the Congo", -6.4162, 20.7999),
+    "tunis": ("Tunis, Tunisia", 36.819, 10.1658),
+    "turin": ("Turin, Italy", 45.0705, 7.6868),
+    "tuxtla": ("Tuxtla, Mexico", 16.7536, -93.1158),
+    "tyumen": ("Tyumen, Russia", 57.1522, 65.5272),
+    "ubud": ("Ubud, Indonesia", -8.5098, 115.2654),
+    "udaipur": ("Udaipur, India", 24.5858, 73.7135),
+    "udhagamandalam": ("Ooty, India", 11.4134, 76.6952),
+    "ufa": ("Ufa, Russia", 54.7431, 55.9678),
+    "ulan bator": ("Ulan Bator, Mongolia", 47.9077, 106.8832),
+    "ulsan": ("Ulsan, South Korea", 35.5372, 129.3167),
+    "ulyanovsk": ("Ulyanovsk, Russia", 54.3282, 48.3866),
+    "ushuaia": ("Ushuaia, Argentina", -54.8108, -68.3159),
+    "vadodara": ("Vadodara, India", 22.2994, 73.2081),
+    "vaduz": ("Vaduz, Liechtenstein", 47.1415, 9.5215),
+    "valenzuela": ("Valenzuela, Philippines", 14.7, 120.9667),
+    "valletta": ("Valletta, Malta", 35.8997, 14.5148),
+    "varanasi": ("Varanasi, India", 25.3167, 83.0104),
+    "vatican city": ("Vatican City, Vatican", 41.9027, 12.4541),
+    "verona": ("Verona, Italy", 45.4385, 10.9938),
+    "viana": ("Viana, Angola", -8.9055, 13.375),
+    "victoria falls": ("Victoria Falls, Zimbabwe", -17.9328, 25.8307),
+    "vienna": ("Vienna, Austria", 48.2085, 16.3721),
+    "vientiane": ("Vientiane, Laos", 17.9667, 102.6),
+    "vijayawada": ("Vijayawada, India", 16.5074, 80.6466),
+    "villa nueva": ("Villa Nueva, Guatemala", 14.5251, -90.5854),
+    "vilnius": ("Vilnius, Lithuania", 54.6892, 25.2798),
+    "vinh": ("Vinh, Vietnam", 18.6734, 105.6923),
+    "virār": ("Virār, India", 19.4559, 72.8114),
+    "visakhapatnam": ("Visakhapatnam, India", 17.6801, 83.2016),
+    "vizag": ("Visakhapatnam, India", 17.6801, 83.2016),
+    "vladivostok": ("Vladivostok, Russia", 43.1056, 131.8735),
+    "volgograd": ("Volgograd, Russia", 48.7138, 44.4976),
+    "voronezh": ("Voronezh, Russia", 51.6683, 39.192),
+    "wanxian": ("Wanxian, China", 30.816, 108.3741),
+    "wanzhou": ("Wanzhou, China", 30.7645, 108.3959),
+    "warangal": ("Warangal, India", 18.0, 79.5833),
+    "warri": ("Warri, Nigeria", 5.5174, 5.7501),
+    "warsaw": ("Warsaw, Poland", 52.2298, 21.0118),
+    "washington": ("Washington, United States", 38.8951, -77.0364),
+    "washington dc": ("Washington, United States", 38.8951, -77.0364),
+    "weifang": ("Weifang, China", 36.71, 119.1019),
+    "weihai": ("Weihai, China", 37.5091, 122.1136),
+    "weinan": ("Weinan, China", 34.5035, 109.5089),
+    "wellington": ("Wellington, New Zealand", -41.2866, 174.7756),
+    "wenzhou": ("Wenzhou, China", 27.9994, 120.6668),
+    "west island": ("West Island, Cocos Islands", -12.1568, 96.8225),
+    "windhoek": ("Windhoek, Namibia", -22.5594, 17.0832),
+    "winnipeg": ("Winnipeg, Canada", 49.8844, -97.147),
+    "wrocław": ("Wrocław, Poland", 51.1029, 17.0301),
+    "wuhan": ("Wuhan, China", 30.5833, 114.2667),
+    "wuhu": ("Wuhu, China", 31.3526, 118.4295),
+    "wuwei": ("Wuwei, China", 37.9267, 102.632),
+    "wuxi": ("Wuxi, China", 31.5689, 120.2886),
+    "wuzhong": ("Wuzhong, China", 37.9867, 106.201),
+    "wuzhou": ("Wuzhou, China", 23.4805, 111.2885),
+    "wādī mūsá": ("Wādī Mūsá, Jordan", 30.321, 35.4789),
+    "xiamen": ("Xiamen, China", 24.4798, 118.0819),
+    "xiangtan": ("Xiangtan, China", 27.85, 112.9),
+    "xiangyang": ("Xiangyang, China", 32.0422, 112.1448),
+    "xianyang": ("Xianyang, China", 34.3378, 108.7026),
+    "xiaogan": ("Xiaogan, China", 30.9269, 113.9222),
+    "xingtai": ("Xingtai, China", 37.0622, 114.4927),
+    "xining": ("Xining, China", 36.6255, 101.7574),
+    "xinxiang": ("Xinxiang, China", 35.1903, 113.8015),
+    "xinyang": ("Xinyang, China", 32.1228, 114.0656),
+    "xinyu": ("Xinyu, China", 27.8043, 114.9334),
+    "xi’an": ("Xi’an, China", 34.2583, 108.9286),
+    "xuancheng": ("Xuancheng, China", 30.9525, 118.7553),
+    "xuchang": ("Xuchang, China", 34.0319, 113.863),
+    "xuhui": ("Xuhui, China", 31.1959, 121.4471),
+    "xuzhou": ("Xuzhou, China", 34.2044, 117.2839),
+    "ya'an": ("Ya'an, China", 29.9852, 102.999),
+    "yamoussoukro": ("Yamoussoukro, Ivory Coast", 6.8205, -5.2767),
+    "yancheng": ("Yancheng, China", 33.3575, 120.1573),
+    "yangjiang": ("Yangjiang, China", 21.8556, 111.9627),
+    "yangon": ("Yangon, Myanmar", 16.8053, 96.1561),
+    "yangpu": ("Yangpu, China", 31.2619, 121.519),
+    "yangquan": ("Yangquan, China", 37.8575, 113.5633),
+    "yangzhou": ("Yangzhou, China", 32.3972, 119.4358),
+    "yantai": ("Yantai, China", 37.4765, 121.4408),
+    "yaoundé": ("Yaoundé, Cameroon", 3.8667, 11.5167),
+    "yaren": ("Yaren, Nauru", -0.5508, 166.9252),
+    "yaroslavl": ("Yaroslavl, Russia", 57.6299, 39.8737),
+    "yekaterinburg": ("Yekaterinburg, Russia", 56.8573, 60.6153),
+    "yerevan": ("Yerevan, Armenia", 40.1776, 44.5126),
+    "yibin": ("Yibin, China", 28.7593, 104.6399),
+    "yichang": ("Yichang, China", 30.7144, 111.2847),
+    "yichun": ("Yichun, China", 27.8333, 114.4),
+    "yinchuan": ("Yinchuan, China", 38.4681, 106.2731),
+    "yingkou": ("Yingkou, China", 40.6647, 122.2318),
+    "yiwu": ("Yiwu, China", 29.3151, 120.0768),
+    "yixing": ("Yixing, China", 31.3606, 119.8202),
+    "yogyakarta": ("Yogyakarta, Indonesia", -7.8014, 110.3647),
+    "yokohama": ("Yokohama, Japan", 35.4333, 139.65),
+    "yongzhou": ("Yongzhou, China", 26.4239, 111.6131),
+    "yueyang": ("Yueyang, China", 29.3745, 113.0948),
+    "yulin": ("Yulin, China", 22.6305, 110.1469),
+    "yuncheng": ("Yuncheng, China", 35.0231, 110.9928),
+    "yunfu": ("Yunfu, China", 22.9279, 112.0381),
+    "zagreb": ("Zagreb, Croatia", 45.8144, 15.978),
+    "zamboanga": ("Zamboanga, Philippines", 6.9103, 122.0739),
+    "zanzibar": ("Zanzibar, Tanzania", -6.1639, 39.1979),
+    "zaozhuang": ("Zaozhuang, China", 34.8647, 117.5542),
+    "zapopan": ("Zapopan, Mexico", 20.7211, -103.3874),
+    "zaporizhzhya": ("Zaporizhzhya, Ukraine", 47.8517, 35.1171),
+    "zaragoza": ("Zaragoza, Spain", 41.6561, -0.8773),
+    "zaria": ("Zaria, Nigeria", 11.1113, 7.7227),
+    "zarqa": ("Zarqa, Jordan", 32.0727, 36.088),
+    "zermatt": ("Zermatt, Switzerland", 46.02, 7.7486),
+    "zhabei": ("Zhabei, China", 31.2586, 121.4597),
+    "zhangjiagang": ("Zhangjiagang, China", 31.865, 120.5389),
+    "zhangjiakou": ("Zhangjiakou, China", 40.7834, 114.8714),
+    "zhangzhou": ("Zhangzhou, China", 24.5133, 117.6556),
+    "zhanjiang": ("Zhanjiang, China", 21.2339, 110.3875),
+    "zhaoqing": ("Zhaoqing, China", 23.0489, 112.4609),
+    "zhaotong": ("Zhaotong, China", 27.3167, 103.7167),
+    "zhengzhou": ("Zhengzhou, China", 34.7578, 113.6486),
+    "zhenjiang": ("Zhenjiang, China", 32.2109, 119.4551),
+    "zhongshan": ("Zhongshan, China", 22.5231, 113.3791),
+    "zhongwei": ("Zhongwei, China", 37.5113, 105.1907),
+    "zhoushan": ("Zhoushan, China", 29.9887, 122.2049),
+    "zhu cheng city": ("Zhu Cheng City, China", 35.995, 119.4026),
+    "zhuhai": ("Zhuhai, China", 22.2769, 113.5678),
+    "zhumadian": ("Zhumadian, China", 32.9838, 114.0259),
+    "zhuzhou": ("Zhuzhou, China", 27.8333, 113.15),
+    "zibo": ("Zibo, China", 36.7906, 118.0633),
+    "zigong": ("Zigong, China", 29.3416, 104.7769),
+    "ziyang": ("Ziyang, China", 30.1211, 104.6481),
+    "zunyi": ("Zunyi, China", 27.6867, 106.9072),
+    "zurich": ("Zürich, Switzerland", 47.3667, 8.55),
+    "zürich": ("Zürich, Switzerland", 47.3667, 8.55),
+    "álvaro obregón": ("Álvaro Obregón, Mexico", 19.3587, -99.2033),
+    "çankaya": ("Çankaya, Turkey", 39.9179, 32.8627),
+    "ürümqi": ("Ürümqi, China", 43.801, 87.6005),
+    "ābu": ("Ābu, India", 24.5937, 72.7176),
+    "łódź": ("Łódź, Poland", 51.7706, 19.4739),
+}
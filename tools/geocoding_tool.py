@@ -1,13 +1,125 @@
 """
 Geocoding Tool - Converts place names to geographic coordinates using Nominatim API
 """
-import requests
+import asyncio
+import threading
+import httpx
+from concurrent.futures import Future
 from langchain.tools import tool
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, TypedDict
+from ._http import SESSION, USER_AGENT, json_loads
+from .cache import PersistentTTLCache, normalize_place, turn_cache
+from .gazetteer import CITIES
+
+
+# Place -> coordinates is effectively static; keep it for 30 days, across restarts and
+# (with REDIS_URL) across workers - Nominatim's usage policy asks clients to cache
+_geocode_cache = PersistentTTLCache(maxsize=4096, ttl=30 * 86400, name="geocoding", redis_prefix="geo")
+
+# Bumped whenever the cached result shape changes, so older entries are never read back
+_CACHE_VERSION = 2
+
+# Nominatim API endpoint
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+
+# Headers with user agent (required by Nominatim; the shared session already sends it)
+NOMINATIM_HEADERS = {"User-Agent": USER_AGENT}
+
+
+class GeoResult(TypedDict):
+    """Result of a geocoding lookup"""
+    success: bool
+    place: Optional[str]
+    short_name: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    error: Optional[str]
+
+
+def _stored_key(cache_key: str) -> str:
+    """Versioned key under which a result is kept in the geocoding cache"""
+    return f"v{_CACHE_VERSION}:{cache_key}"
+
+
+def _short_name(display_name: str) -> str:
+    """Just the city name from a full display name ("Paris, Ile-de-France, France" -> "Paris")"""
+    return display_name.split(",")[0].strip()
+
+
+def _failure(error: str) -> GeoResult:
+    """Result dict for a place that could not be geocoded"""
+    return {
+        "success": False,
+        "error": error,
+        "place": None,
+        "short_name": None,
+        "latitude": None,
+        "longitude": None
+    }
+
+
+# Geocodes in flight keyed by normalized place name. A thread-safe concurrent Future rather than an
+# asyncio one, because concurrent callers may be threads or coroutines on different event loops.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _join_inflight(key: str) -> Tuple[Future, bool]:
+    """Return the in-flight future for key and whether the caller must perform the lookup"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        future.set_running_or_notify_cancel()  # a running future cannot be cancelled by a waiter
+        _inflight[key] = future
+        return future, True
+
+
+def _finish_inflight(key: str, future: Future, result: GeoResult) -> None:
+    """Publish the leader's result to every waiter and drop the in-flight entry"""
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    future.set_result(result)
+
+
+def _from_gazetteer(cache_key: str) -> Optional[GeoResult]:
+    """Result dict for a well-known city, answered without any network call"""
+    city = CITIES.get(cache_key)
+    if city is None:
+        return None
+    display_name, latitude, longitude = city
+    return {
+        "success": True,
+        "place": display_name,
+        "short_name": _short_name(display_name),
+        "latitude": latitude,
+        "longitude": longitude,
+        "error": None
+    }
+
+
+def _parse_search(place_name: str, data: list) -> GeoResult:
+    """Turn a Nominatim search response into the result dict"""
+    # Check if place was found
+    if not data or len(data) == 0:
+        return _failure(f"Place '{place_name}' not found. Please check the spelling or try a different name.")
+    
+    # Extract coordinates
+    place_data = data[0]
+    result = {
+        "success": True,
+        "place": place_data["display_name"],
+        "short_name": _short_name(place_data["display_name"]),
+        "latitude": float(place_data["lat"]),
+        "longitude": float(place_data["lon"]),
+        "error": None
+    }
+    return result
 
 
 @tool
-def get_coordinates(place_name: str) -> Dict[str, any]:
+def get_coordinates(place_name: str) -> GeoResult:
     """
     Get geographic coordinates (latitude, longitude) for a given place name.
     
@@ -22,81 +134,124 @@ def get_coordinates(place_name: str) -> Dict[str, any]:
         Dictionary containing:
         - success: Boolean indicating if the place was found
         - place: The full display name of the place
+        - short_name: Just the city name, for display
         - latitude: Latitude coordinate
         - longitude: Longitude coordinate
         - error: Error message if place not found
     
     Example:
         get_coordinates("Bangalore") 
-        Returns: {"success": True, "place": "Bangalore, Karnataka, India", "latitude": 12.9716, "longitude": 77.5946}
+        Returns: {"success": True, "place": "Bangalore, Karnataka, India", "short_name": "Bangalore", "latitude": 12.9716, "longitude": 77.5946}
     """
+    cache_key = normalize_place(place_name)
+    known = _from_gazetteer(cache_key)
+    if known is not None:
+        return known
+    
+    # Within one agent turn, reuse any earlier answer - failures included, which are never cached
+    turn = turn_cache()
+    if turn is not None and cache_key in turn:
+        return dict(turn[cache_key])
+    
+    cached = _geocode_cache.get(_stored_key(cache_key))
+    if cached is not None:
+        return dict(cached)
+    
+    # Concurrent lookups of the same place share one request
+    future, leader = _join_inflight(cache_key)
+    if not leader:
+        return dict(future.result())
+    
+    result = _failure("Geocoding was interrupted. Please try again.")
+    try:
+        result = _search(place_name)
+        if result["success"]:
+            _geocode_cache.set(_stored_key(cache_key), dict(result))
+    finally:
+        _finish_inflight(cache_key, future, result)
+    if turn is not None:
+        turn[cache_key] = result
+    return result
+
+
+async def aget_coordinates(place_name: str, client: httpx.AsyncClient) -> GeoResult:
+    """
+    Async variant of get_coordinates that issues the request on the given httpx client
+    
+    Args:
+        place_name: The name of the place/city/location to geocode
+        client: Shared AsyncClient for the current request
+    
+    Returns:
+        The same result dictionary as get_coordinates
+    """
+    cache_key = normalize_place(place_name)
+    known = _from_gazetteer(cache_key)
+    if known is not None:
+        return known
+    
+    # Within one agent turn, reuse any earlier answer - failures included, which are never cached
+    turn = turn_cache()
+    if turn is not None and cache_key in turn:
+        return dict(turn[cache_key])
+    
+    # Memory hits return at once; a Redis or disk lookup runs off the event loop
+    cached = await _geocode_cache.aget(_stored_key(cache_key))
+    if cached is not None:
+        return dict(cached)
+    
+    future, leader = _join_inflight(cache_key)
+    if not leader:
+        return dict(await asyncio.wrap_future(future))
+    
+    result = _failure("Geocoding was interrupted. Please try again.")
+    try:
+        result = await _asearch(place_name, client)
+        if result["success"]:
+            await _geocode_cache.aset(_stored_key(cache_key), dict(result))
+    finally:
+        _finish_inflight(cache_key, future, result)
+    if turn is not None:
+        turn[cache_key] = result
+    return result
+
+
+def _search(place_name: str) -> GeoResult:
+    """Query Nominatim through the shared client"""
     try:
-        # Nominatim API endpoint
-        url = "https://nominatim.openstreetmap.org/search"
-        
-        # Headers with user agent (required by Nominatim)
-        headers = {
-            "User-Agent": "TourismAIAgent/1.0"
-        }
-        
-        # Query parameters
-        params = {
-            "q": place_name,
-            "format": "json",
-            "limit": 1
-        }
-        
         # Make request
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = SESSION.get(
+            NOMINATIM_URL,
+            params={"q": place_name, "format": "json", "limit": 1},
+            headers=NOMINATIM_HEADERS,
+            timeout=10
+        )
         response.raise_for_status()
+        return _parse_search(place_name, json_loads(response.content))
         
-        data = response.json()
-        
-        # Check if place was found
-        if not data or len(data) == 0:
-            return {
-                "success": False,
-                "error": f"Place '{place_name}' not found. Please check the spelling or try a different name.",
-                "place": None,
-                "latitude": None,
-                "longitude": None
-            }
-        
-        # Extract coordinates
-        place_data = data[0]
-        latitude = float(place_data["lat"])
-        longitude = float(place_data["lon"])
-        display_name = place_data["display_name"]
-        
-        return {
-            "success": True,
-            "place": display_name,
-            "latitude": latitude,
-            "longitude": longitude,
-            "error": None
-        }
+    except httpx.TimeoutException:
+        return _failure("Geocoding service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return _failure(f"Error connecting to geocoding service: {str(e)}")
+    except Exception as e:
+        return _failure(f"Unexpected error during geocoding: {str(e)}")
+
+
+async def _asearch(place_name: str, client: httpx.AsyncClient) -> GeoResult:
+    """Query Nominatim on the given httpx client"""
+    try:
+        response = await client.get(
+            NOMINATIM_URL,
+            params={"q": place_name, "format": "json", "limit": 1},
+            headers=NOMINATIM_HEADERS,
+            timeout=10
+        )
+        response.raise_for_status()
+        return _parse_search(place_name, json_loads(response.content))
         
-    except requests.exceptions.Timeout:
-        return {
-            "success": False,
-            "error": "Geocoding service timed out. Please try again.",
-            "place": None,
-            "latitude": None,
-            "longitude": None
-        }
-    except requests.exceptions.RequestException as e:
-        return {
-            "success": False,
-            "error": f"Error connecting to geocoding service: {str(e)}",
-            "place": None,
-            "latitude": None,
-            "longitude": None
-        }
+    except httpx.TimeoutException:
+        return _failure("Geocoding service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return _failure(f"Error connecting to geocoding service: {str(e)}")
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Unexpected error during geocoding: {str(e)}",
-            "place": None,
-            "latitude": None,
-            "longitude": None
-        }
+        return _failure(f"Unexpected error during geocoding: {str(e)}")
@@ -1,10 +1,302 @@
 """
 Places/Tourism Tool - Finds tourist attractions using Overpass API (OpenStreetMap)
 """
-import requests
+import itertools
+import httpx
+from dataclasses import dataclass, field
 from langchain.tools import tool
-from typing import List, Dict
-from .geocoding_tool import get_coordinates
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from .geocoding_tool import get_coordinates, GeoResult
+from ._http import SESSION, json_loads
+from .cache import PersistentTTLCache, coords_key
+
+try:
+    import ijson
+except ImportError:  # without ijson the whole response is parsed at once
+    ijson = None
+
+
+# Attractions rarely change, so results are kept for 7 days, on disk as well as in memory.
+# Keyed by rounded coordinates and radius (shared through Redis as poi:<lat>,<lon>:r<km>k when configured).
+_places_cache = PersistentTTLCache(maxsize=4096, ttl=7 * 86400, name="places", redis_prefix="poi")
+
+# Overpass API endpoint
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# Search radius in meters (approximately 10km)
+SEARCH_RADIUS = 10000
+
+# Distinct attractions reported per place
+MAX_PLACES = 5
+
+# Elements requested from Overpass; MAX_PLACES distinct names are kept
+MAX_ELEMENTS = 20
+
+# Key Overpass adds to a 200 response cut short by a server-side timeout or memory limit
+_REMARK_KEY = b'"remark"'
+
+
+@dataclass
+class PlacesReport:
+    """Structured result of a tourist attractions lookup"""
+    place: str
+    attractions: List[str] = field(default_factory=list)
+    coordinates: List[Tuple[str, float, float]] = field(default_factory=list)
+    error: Optional[str] = None
+    
+    @property
+    def success(self) -> bool:
+        return self.error is None
+    
+    @property
+    def message(self) -> str:
+        """Human readable list of attractions, or the error message"""
+        if self.error:
+            return self.error
+        if not self.attractions:
+            return f"I couldn't find specific tourist attractions in {self.place} in the database, but it may still be a great place to visit!"
+        places_list = "\n".join(self.attractions)
+        return f"In {self.place} these are the places you can go,\n{places_list}"
+    
+    @property
+    def tool_output(self) -> str:
+        """message followed by the COORDS block (one name|lat|lon line per attraction) used for the map"""
+        if self.error or not self.attractions:
+            return self.message
+        coords_list = "\n".join(f"{name}|{lat}|{lon}" for name, lat, lon in self.coordinates)
+        return f"{self.message}\nCOORDS:\n{coords_list}"
+
+
+def _unknown_place(place_name: str, geo_result: GeoResult) -> PlacesReport:
+    return PlacesReport(
+        place=place_name,
+        error=f"I don't know if the place '{place_name}' exists. {geo_result['error']}"
+    )
+
+
+# Overpass QL for named tourist attractions around a point; nwr covers nodes, ways and relations.
+# Searches for tourism=* tags (attractions, museums, viewpoints, etc.), parks and historic sites.
+# Only one center per element is read, so member nodes are not expanded, and at most
+# MAX_ELEMENTS elements come back (headroom for duplicate names).
+_QUERY_TPL = (
+    '[out:json][timeout:25];'
+    '(nwr["tourism"]["name"](around:{r},{lat},{lon});'
+    'nwr["leisure"="park"]["name"](around:{r},{lat},{lon});'
+    'nwr["historic"]["name"](around:{r},{lat},{lon}););'
+    'out center {limit};'
+)
+
+
+def _overpass_query(latitude: float, longitude: float) -> str:
+    return _QUERY_TPL.format(r=SEARCH_RADIUS, lat=latitude, lon=longitude, limit=MAX_ELEMENTS)
+
+
+def _cache_key(geo_result: GeoResult) -> str:
+    return f"{coords_key(geo_result['latitude'], geo_result['longitude'])}:r{SEARCH_RADIUS // 1000}k"
+
+
+def _cached_report(place_display: str, cached: Optional[Dict]) -> Optional[PlacesReport]:
+    """Rebuild a report from cached attractions and coordinates, if there are any"""
+    if cached is None:
+        return None
+    return PlacesReport(
+        place=place_display,
+        attractions=list(cached["attractions"]),
+        coordinates=[tuple(row) for row in cached["coordinates"]]
+    )
+
+
+def _cache_entry(report: PlacesReport) -> Dict:
+    """The attractions of a report as plain JSON-friendly data"""
+    return {
+        "attractions": report.attractions,
+        "coordinates": [list(row) for row in report.coordinates]
+    }
+
+
+def _cacheable(report: PlacesReport, parser: "_ElementParser") -> bool:
+    """
+    Whether a report may be kept for the cache TTL. Overpass answers server-side timeouts and
+    out-of-memory errors with HTTP 200, a "remark" and few or no elements, so empty results and
+    remarked bodies are not cached - otherwise one bad moment would stick to a city for a week.
+    """
+    return bool(report.attractions) and not parser.remark
+
+
+def _store_report(cache_key: str, report: PlacesReport, parser: "_ElementParser") -> PlacesReport:
+    """Cache the attractions of a complete report"""
+    if _cacheable(report, parser):
+        _places_cache.set(cache_key, _cache_entry(report))
+    return report
+
+
+async def _astore_report(cache_key: str, report: PlacesReport, parser: "_ElementParser") -> PlacesReport:
+    """Async variant of _store_report; the Redis and disk writes run off the event loop"""
+    if _cacheable(report, parser):
+        await _places_cache.aset(cache_key, _cache_entry(report))
+    return report
+
+
+class _ElementParser:
+    """
+    Incremental parser for the "elements" array of an Overpass response.
+    feed() returns the elements completed by each chunk, so callers can stop reading
+    early; without ijson the body is buffered and parsed by close(). remark is set once
+    the body read so far carries an Overpass "remark" (a runtime error or timeout).
+    """
+    
+    def __init__(self):
+        self.remark = False
+        self._tail = b""
+        if ijson is not None:
+            self._elements = ijson.sendable_list()
+            self._parser = ijson.items_coro(self._elements, "elements.item", use_float=True)
+        else:
+            self._buffer = bytearray()
+    
+    def feed(self, chunk: bytes) -> List[Dict]:
+        if ijson is None:
+            self._buffer += chunk
+            return []
+        # Keep the end of the previous chunk so a key split across chunks is still seen
+        self.remark = self.remark or _REMARK_KEY in self._tail + chunk
+        self._tail = chunk[-len(_REMARK_KEY):]
+        self._parser.send(chunk)
+        elements = list(self._elements)
+        del self._elements[:]
+        return elements
+    
+    def close(self) -> List[Dict]:
+        if ijson is None:
+            data = json_loads(bytes(self._buffer))
+            self.remark = "remark" in data
+            return data.get("elements", [])
+        return []
+
+
+def _iter_elements(parser: _ElementParser, chunks: Iterable[bytes]) -> Iterator[Dict]:
+    """Yield Overpass elements as the response body arrives"""
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def _distinct_names(elements: List[Dict]) -> int:
+    return len({element.get("tags", {}).get("name") for element in elements} - {None})
+
+
+def _distinct_places(elements: Iterable[Dict]) -> Iterator[Tuple[str, Optional[float], Optional[float]]]:
+    """Yield (name, lat, lon) for each element whose name has not been seen yet"""
+    seen_names = set()
+    for element in elements:
+        name = element.get("tags", {}).get("name")
+        if not name or name in seen_names:
+            continue
+        seen_names.add(name)
+        
+        # Nodes carry their own coordinates; ways and relations use the center point
+        center = element.get("center", {})
+        lat = element.get("lat", center.get("lat"))
+        lon = element.get("lon", center.get("lon"))
+        yield name, lat, lon
+
+
+def _report_from_elements(place_display: str, elements: Iterable[Dict]) -> PlacesReport:
+    """Extract up to MAX_PLACES distinct named places (with coordinates) from Overpass elements (consumed lazily)"""
+    found = list(itertools.islice(_distinct_places(elements), MAX_PLACES))
+    return PlacesReport(
+        place=place_display,
+        attractions=[name for name, _, _ in found],
+        coordinates=[(name, lat, lon) for name, lat, lon in found if lat and lon]
+    )
+
+
+def lookup_places(place_name: str) -> PlacesReport:
+    """
+    Get up to 5 tourist attractions (with coordinates where known) for a place
+    
+    Args:
+        place_name: The name of the place/city to find attractions in
+    
+    Returns:
+        PlacesReport with the attractions, or with error set if the lookup failed
+    """
+    try:
+        # First, get coordinates for the place
+        geo_result = get_coordinates.invoke({"place_name": place_name})
+        
+        if not geo_result["success"]:
+            return _unknown_place(place_name, geo_result)
+        
+        place_display = geo_result["short_name"]
+        cache_key = _cache_key(geo_result)
+        cached = _cached_report(place_display, _places_cache.get(cache_key))
+        if cached is not None:
+            return cached
+        
+        query = _overpass_query(geo_result["latitude"], geo_result["longitude"])
+        
+        # Make request; the body is parsed as it streams in and closed after 5 places
+        parser = _ElementParser()
+        with SESSION.stream("POST", OVERPASS_URL, data={"data": query}, timeout=30) as response:
+            response.raise_for_status()
+            report = _report_from_elements(place_display, _iter_elements(parser, response.iter_bytes(8192)))
+            
+    except httpx.TimeoutException:
+        return PlacesReport(place=place_name, error="Tourist places service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return PlacesReport(place=place_name, error=f"Error fetching tourist places: {str(e)}")
+    except Exception as e:
+        return PlacesReport(place=place_name, error=f"Unexpected error getting tourist places: {str(e)}")
+    
+    return _store_report(cache_key, report, parser)
+
+
+async def alookup_places(place_name: str, geo_result: GeoResult, client: httpx.AsyncClient) -> PlacesReport:
+    """
+    Async variant of lookup_places for callers that already geocoded the place
+    
+    Args:
+        place_name: The name of the place/city to find attractions in
+        geo_result: get_coordinates result for place_name
+        client: Shared AsyncClient for the current request
+    
+    Returns:
+        PlacesReport with the attractions, or with error set if the lookup failed
+    """
+    if not geo_result["success"]:
+        return _unknown_place(place_name, geo_result)
+    
+    place_display = geo_result["short_name"]
+    cache_key = _cache_key(geo_result)
+    cached = _cached_report(place_display, await _places_cache.aget(cache_key))
+    if cached is not None:
+        return cached
+    
+    query = _overpass_query(geo_result["latitude"], geo_result["longitude"])
+    
+    try:
+        parser = _ElementParser()
+        elements = []
+        async with client.stream("POST", OVERPASS_URL, data={"data": query}, timeout=30) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                elements.extend(parser.feed(chunk))
+                if _distinct_names(elements) >= MAX_PLACES:
+                    break
+            else:
+                elements.extend(parser.close())
+        
+        report = _report_from_elements(place_display, elements)
+    
+    except httpx.TimeoutException:
+        return PlacesReport(place=place_name, error="Tourist places service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return PlacesReport(place=place_name, error=f"Error fetching tourist places: {str(e)}")
+    except Exception as e:
+        return PlacesReport(place=place_name, error=f"Unexpected error getting tourist places: {str(e)}")
+    
+    return await _astore_report(cache_key, report, parser)
 
 
 @tool
@@ -31,88 +323,4 @@ def get_tourist_places(place_name: str) -> str:
         Bannerghatta National Park
         Jawaharlal Nehru Planetarium"
     """
-    try:
-        # First, get coordinates for the place
-        geo_result = get_coordinates.invoke({"place_name": place_name})
-        
-        if not geo_result["success"]:
-            return f"I don't know if the place '{place_name}' exists. {geo_result['error']}"
-        
-        latitude = geo_result["latitude"]
-        longitude = geo_result["longitude"]
-        place_display = geo_result["place"].split(",")[0]  # Get just the city name
-        
-        # Overpass API endpoint
-        url = "https://overpass-api.de/api/interpreter"
-        
-        # Search radius in meters (approximately 10km)
-        radius = 10000
-        
-        # Overpass QL query to find tourist attractions with center points for ways
-        # Searches for tourism=* tags (attractions, museums, viewpoints, etc.)
-        query = f"""
-        [out:json][timeout:25];
-        (
-          node["tourism"](around:{radius},{latitude},{longitude});
-          way["tourism"](around:{radius},{latitude},{longitude});
-          node["leisure"="park"](around:{radius},{latitude},{longitude});
-          way["leisure"="park"](around:{radius},{latitude},{longitude});
-          node["historic"](around:{radius},{latitude},{longitude});
-          way["historic"](around:{radius},{latitude},{longitude});
-        );
-        out body center;
-        >;
-        out skel qt;
-        """
-        
-        # Make request
-        response = requests.post(url, data={"data": query}, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        elements = data.get("elements", [])
-        
-        # Extract place names with coordinates
-        places = []
-        places_with_coords = []
-        seen_names = set()
-        
-        for element in elements:
-            tags = element.get("tags", {})
-            name = tags.get("name")
-            
-            if name and name not in seen_names:
-                places.append(name)
-                seen_names.add(name)
-                
-                # Get coordinates (handle both nodes and ways)
-                lat = element.get("lat")
-                lon = element.get("lon")
-                
-                # For ways, calculate center point
-                if lat is None or lon is None:
-                    if element.get("type") == "way" and "center" in element:
-                        lat = element["center"].get("lat")
-                        lon = element["center"].get("lon")
-                
-                if lat and lon:
-                    places_with_coords.append(f"{name}|{lat}|{lon}")
-                
-                # Stop after finding 5 places
-                if len(places) >= 5:
-                    break
-        
-        # Format response
-        if places:
-            places_list = "\n".join(places)
-            coords_list = "\n".join(places_with_coords)
-            return f"In {place_display} these are the places you can go,\n{places_list}\nCOORDS:\n{coords_list}"
-        else:
-            return f"I couldn't find specific tourist attractions in {place_display} in the database, but it may still be a great place to visit!"
-            
-    except requests.exceptions.Timeout:
-        return "Tourist places service timed out. Please try again."
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching tourist places: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error getting tourist places: {str(e)}"
+    return lookup_places(place_name).tool_output
@@ -1,74 +1,288 @@
 """
 Weather Tool - Fetches current weather information using Open-Meteo API
 """
-import requests
+import asyncio
+import httpx
+from dataclasses import dataclass
 from langchain.tools import tool
-from typing import Dict
-from .geocoding_tool import get_coordinates
+from typing import Dict, List, Optional, Union
+from .geocoding_tool import get_coordinates, aget_coordinates, GeoResult
+from ._http import SESSION, HTTP2, LIMITS, json_loads
+from .cache import PersistentTTLCache, coords_key
 
 
-@tool
-def get_weather(place_name: str) -> str:
-    """
-    Get current weather information for a given place including temperature and precipitation.
+# Weather changes slowly, so a successful reading stays valid for 10 minutes, also on disk so
+# restarted processes (and re-run test scripts) skip Open-Meteo while it is fresh.
+# Keyed by rounded coordinates (shared through Redis as wx:<lat>,<lon> when configured).
+_weather_cache = PersistentTTLCache(maxsize=4096, ttl=600, name="weather", redis_prefix="wx")
+
+# Open-Meteo API endpoint
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+
+@dataclass
+class WeatherReport:
+    """Structured result of a weather lookup"""
+    place: str
+    temperature: Optional[float] = None
+    precipitation_chance: Optional[int] = None
+    error: Optional[str] = None
     
-    This tool fetches real-time weather data including current temperature and chance of rain
-    for any location in the world. It automatically handles geocoding the place name.
+    @property
+    def success(self) -> bool:
+        return self.error is None
+    
+    @property
+    def message(self) -> str:
+        """Human readable weather sentence, or the error message"""
+        if self.error:
+            return self.error
+        return f"In {self.place} it's currently {self.temperature}°C with a chance of {self.precipitation_chance}% to rain."
+
+
+def _unknown_place(place_name: str, geo_result: GeoResult) -> WeatherReport:
+    return WeatherReport(
+        place=place_name,
+        error=f"I don't know if the place '{place_name}' exists. {geo_result['error']}"
+    )
+
+
+def _forecast_params(latitude: Union[float, str], longitude: Union[float, str]) -> Dict:
+    """Query parameters for current weather (comma-separated coordinates request several locations)"""
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "current": ["temperature_2m", "precipitation_probability"],
+        "temperature_unit": "celsius",
+        # Only the current block is needed; pin the forecast to one day so no series is padded in
+        "forecast_days": 1,
+        "timezone": "auto"
+    }
+
+
+def _cached_report(place_display: str, cached: Optional[list]) -> Optional[WeatherReport]:
+    """Rebuild a report from a cached [temperature, precipitation_chance] reading, if there is one"""
+    if cached is None:
+        return None
+    temperature, precipitation_prob = cached
+    return WeatherReport(place=place_display, temperature=temperature, precipitation_chance=precipitation_prob)
+
+
+def _store_report(cache_key: str, report: WeatherReport) -> WeatherReport:
+    """Cache the raw reading of a successful report, so formatting stays flexible"""
+    if report.success:
+        _weather_cache.set(cache_key, [report.temperature, report.precipitation_chance])
+    return report
+
+
+async def _astore_report(cache_key: str, report: WeatherReport) -> WeatherReport:
+    """Async variant of _store_report; the Redis and disk writes run off the event loop"""
+    if report.success:
+        await _weather_cache.aset(cache_key, [report.temperature, report.precipitation_chance])
+    return report
+
+
+def _report_from_forecast(place_display: str, data: Dict) -> WeatherReport:
+    """Extract weather information from an Open-Meteo response"""
+    current = data.get("current", {})
+    temperature = current.get("temperature_2m")
+    precipitation_prob = current.get("precipitation_probability", 0)
+    
+    if temperature is None:
+        return WeatherReport(
+            place=place_display,
+            error=f"Weather data is currently unavailable for {place_display}."
+        )
+    
+    return WeatherReport(
+        place=place_display,
+        temperature=temperature,
+        precipitation_chance=precipitation_prob
+    )
+
+
+def lookup_weather(place_name: str) -> WeatherReport:
+    """
+    Get the current temperature and precipitation chance for a place
     
     Args:
-        place_name: The name of the place/city to get weather for (e.g., "Bangalore", "Paris", "Tokyo")
+        place_name: The name of the place/city to get weather for
     
     Returns:
-        A formatted string with weather information or an error message.
-        Format: "In [Place] it's currently [X]°C with a chance of [Y]% to rain."
-        
-    Example:
-        get_weather("Bangalore")
-        Returns: "In Bangalore it's currently 24°C with a chance of 35% to rain."
+        WeatherReport with the weather data, or with error set if the lookup failed
     """
     try:
         # First, get coordinates for the place
         geo_result = get_coordinates.invoke({"place_name": place_name})
         
         if not geo_result["success"]:
-            return f"I don't know if the place '{place_name}' exists. {geo_result['error']}"
-        
-        latitude = geo_result["latitude"]
-        longitude = geo_result["longitude"]
-        place_display = geo_result["place"].split(",")[0]  # Get just the city name
+            return _unknown_place(place_name, geo_result)
         
-        # Open-Meteo API endpoint
-        url = "https://api.open-meteo.com/v1/forecast"
-        
-        # Query parameters for current weather
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "current": ["temperature_2m", "precipitation_probability"],
-            "temperature_unit": "celsius"
-        }
+        place_display = geo_result["short_name"]
+        cache_key = coords_key(geo_result["latitude"], geo_result["longitude"])
+        cached = _cached_report(place_display, _weather_cache.get(cache_key))
+        if cached is not None:
+            return cached
         
         # Make request
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(
+            FORECAST_URL,
+            params=_forecast_params(geo_result["latitude"], geo_result["longitude"]),
+            timeout=10
+        )
         response.raise_for_status()
         
-        data = response.json()
-        
-        # Extract weather information
-        current = data.get("current", {})
-        temperature = current.get("temperature_2m")
-        precipitation_prob = current.get("precipitation_probability", 0)
+        report = _report_from_forecast(place_display, json_loads(response.content))
+    
+    except httpx.TimeoutException:
+        return WeatherReport(place=place_name, error="Weather service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return WeatherReport(place=place_name, error=f"Error fetching weather data: {str(e)}")
+    except Exception as e:
+        return WeatherReport(place=place_name, error=f"Unexpected error getting weather: {str(e)}")
+    
+    return _store_report(cache_key, report)
+
+
+async def alookup_weather(place_name: str, geo_result: GeoResult, client: httpx.AsyncClient) -> WeatherReport:
+    """
+    Async variant of lookup_weather for callers that already geocoded the place
+    
+    Args:
+        place_name: The name of the place/city to get weather for
+        geo_result: get_coordinates result for place_name
+        client: Shared AsyncClient for the current request
+    
+    Returns:
+        WeatherReport with the weather data, or with error set if the lookup failed
+    """
+    if not geo_result["success"]:
+        return _unknown_place(place_name, geo_result)
+    
+    place_display = geo_result["short_name"]
+    cache_key = coords_key(geo_result["latitude"], geo_result["longitude"])
+    cached = _cached_report(place_display, await _weather_cache.aget(cache_key))
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await client.get(
+            FORECAST_URL,
+            params=_forecast_params(geo_result["latitude"], geo_result["longitude"]),
+            timeout=10
+        )
+        response.raise_for_status()
         
-        # Format response
-        if temperature is not None:
-            weather_info = f"In {place_display} it's currently {temperature}°C with a chance of {precipitation_prob}% to rain."
-            return weather_info
-        else:
-            return f"Weather data is currently unavailable for {place_display}."
-            
-    except requests.exceptions.Timeout:
-        return "Weather service timed out. Please try again."
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching weather data: {str(e)}"
+        report = _report_from_forecast(place_display, json_loads(response.content))
+    
+    except httpx.TimeoutException:
+        return WeatherReport(place=place_name, error="Weather service timed out. Please try again.")
+    except httpx.HTTPError as e:
+        return WeatherReport(place=place_name, error=f"Error fetching weather data: {str(e)}")
     except Exception as e:
-        return f"Unexpected error getting weather: {str(e)}"
+        return WeatherReport(place=place_name, error=f"Unexpected error getting weather: {str(e)}")
+    
+    return await _astore_report(cache_key, report)
+
+
+async def alookup_weather_batch(place_names: List[str], client: httpx.AsyncClient) -> List[WeatherReport]:
+    """
+    Weather for several places: geocodes them concurrently, then asks Open-Meteo for every
+    uncached location in a single multi-location request
+    
+    Args:
+        place_names: Names of the places/cities to get weather for
+        client: Shared AsyncClient for the current request
+    
+    Returns:
+        One WeatherReport per place, in the same order
+    """
+    geo_results = await asyncio.gather(*(aget_coordinates(name, client) for name in place_names))
+    
+    reports: List[Optional[WeatherReport]] = [None] * len(place_names)
+    pending: Dict[str, list] = {}  # cache_key -> [latitude, longitude, [(index, place_display), ...]]
+    for i, (place_name, geo_result) in enumerate(zip(place_names, geo_results)):
+        if not geo_result["success"]:
+            reports[i] = _unknown_place(place_name, geo_result)
+            continue
+        place_display = geo_result["short_name"]
+        cache_key = coords_key(geo_result["latitude"], geo_result["longitude"])
+        reports[i] = _cached_report(place_display, await _weather_cache.aget(cache_key))
+        if reports[i] is None:
+            location = pending.setdefault(cache_key, [geo_result["latitude"], geo_result["longitude"], []])
+            location[2].append((i, place_display))
+    
+    if pending:
+        error = None
+        try:
+            response = await client.get(
+                FORECAST_URL,
+                params=_forecast_params(
+                    ",".join(str(latitude) for latitude, _, _ in pending.values()),
+                    ",".join(str(longitude) for _, longitude, _ in pending.values())
+                ),
+                timeout=10
+            )
+            response.raise_for_status()
+            
+            # One location comes back as an object, several as a list in request order
+            data = json_loads(response.content)
+            locations = data if isinstance(data, list) else [data]
+            for (cache_key, (_, _, requesters)), location in zip(pending.items(), locations):
+                for i, place_display in requesters:
+                    reports[i] = await _astore_report(cache_key, _report_from_forecast(place_display, location))
+        
+        except httpx.TimeoutException:
+            error = "Weather service timed out. Please try again."
+        except httpx.HTTPError as e:
+            error = f"Error fetching weather data: {str(e)}"
+        except Exception as e:
+            error = f"Unexpected error getting weather: {str(e)}"
+        
+        for i, place_display in (row for _, _, requesters in pending.values() for row in requesters):
+            if reports[i] is None:
+                reports[i] = WeatherReport(
+                    place=place_display,
+                    error=error or f"Weather data is currently unavailable for {place_display}."
+                )
+    
+    return reports
+
+
+def get_weather_batch(place_names: List[str]) -> List[str]:
+    """
+    Blocking wrapper around alookup_weather_batch for sync callers
+    
+    Args:
+        place_names: Names of the places/cities to get weather for
+    
+    Returns:
+        One get_weather-style message per place, in the same order
+    """
+    async def run():
+        async with httpx.AsyncClient(limits=LIMITS, http2=HTTP2) as client:
+            return await alookup_weather_batch(place_names, client)
+    
+    return [report.message for report in asyncio.run(run())]
+
+
+@tool
+def get_weather(place_name: str) -> str:
+    """
+    Get current weather information for a given place including temperature and precipitation.
+    
+    This tool fetches real-time weather data including current temperature and chance of rain
+    for any location in the world. It automatically handles geocoding the place name.
+    
+    Args:
+        place_name: The name of the place/city to get weather for (e.g., "Bangalore", "Paris", "Tokyo")
+    
+    Returns:
+        A formatted string with weather information or an error message.
+        Format: "In [Place] it's currently [X]°C with a chance of [Y]% to rain."
+    
+    Example:
+        get_weather("Bangalore")
+        Returns: "In Bangalore it's currently 24°C with a chance of 35% to rain."
+    """
+    return lookup_weather(place_name).message
@@ -2,25 +2,94 @@
 Tourism Agent with LangChain Tools and Structured Output
 """
 import os
-import json
+import asyncio
+import functools
+import httpx
 import requests
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from pydantic import Field
 from dotenv import load_dotenv
 from langchain_core.language_models.llms import LLM
-from langchain_core.callbacks.manager import CallbackManagerForLLMRun
+from langchain_core.callbacks.manager import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
 from langchain.prompts import PromptTemplate
-from tools import get_weather, get_tourist_places, get_coordinates
-from schemas import TourismResponse, tourism_output_parser
+from tools import fetch_all, turn_scope
+from tools._http import HTTP2
+from schemas import TourismResponse, AttractionWithCoords, tourism_output_parser
+from sse_parser import SSE_DONE, parse_sse_line, parse_json_completion
+from mistral_client import MISTRAL_API_URL, MISTRAL_MODEL, LoopBoundClient
+
+try:
+    import spacy
+except ImportError:  # without spaCy, place names come from the regex heuristics only
+    spacy = None
 
 load_dotenv()
 
 
+# Patterns to extract place names from natural language, compiled once at import
+_PLACE_PATTERNS = [
+    re.compile(r"(?:trip to|go(?:ing)? to|visit(?:ing)?|plan.*to)\s+([A-Z][a-zA-Z\s]+?)(?:\s+plan|\s+and|\s*,|\s*$)", re.IGNORECASE),
+    re.compile(r"(?:in|at|for)\s+([A-Z][a-zA-Z\s]+?)(?:\s*,|\s*\?|\s*\.|\s+let|\s+what|\s+and|$)", re.IGNORECASE),
+    re.compile(r"([A-Z][a-zA-Z\s]+?)(?:\s+let\'s|\s+what|\s+temperature|\s+weather|\s+places)", re.IGNORECASE),
+]
+
+# Words the patterns key on; a short capitalized query containing none of them is taken as a place name
+_PATTERN_WORDS = frozenset({
+    "trip", "go", "going", "visit", "visiting", "plan", "to", "in", "at", "for",
+    "let's", "what", "temperature", "weather", "places"
+})
+
+# spaCy entity labels that name a place
+_PLACE_LABELS = frozenset({"GPE", "LOC", "FAC"})
+
+# Temperature and (when present) precipitation chance in a get_weather sentence, in one scan
+_WEATHER_PARSE = re.compile(r'(?P<temp>-?\d+\.?\d*)°C(?:\D*(?P<precip>\d+)%)?')
+
+# Intent keywords, each list folded into one alternation so a query is scanned once per intent
+_WEATHER_KW = ["weather", "temperature", "temp", "hot", "cold", "rain", "precipitation", "climate", "degrees"]
+_PLACES_KW = ["place", "places", "visit", "attraction", "tourist", "sightseeing", "trip", "plan", "go", "see", "explore"]
+_WEATHER_RE = re.compile("|".join(map(re.escape, _WEATHER_KW)), re.IGNORECASE)
+_PLACES_RE = re.compile("|".join(map(re.escape, _PLACES_KW)), re.IGNORECASE)
+
+# Keep-alive client for the _acall path, one per event loop (run() starts a new loop per call)
+_ASYNC_CLIENT = LoopBoundClient(
+    lambda: httpx.AsyncClient(
+        http2=HTTP2,
+        timeout=60,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _ner():
+    """Load the spaCy NER pipeline on first use; None if spaCy or en_core_web_sm is unavailable"""
+    if spacy is None:
+        return None
+    try:
+        # Only the entity recognizer is needed; dropping the other components makes it ~3x faster
+        return spacy.load("en_core_web_sm", disable=["tagger", "parser", "lemmatizer", "attribute_ruler"])
+    except OSError:
+        print("⚠️  WARNING: spaCy is installed but en_core_web_sm is not; using regex place extraction")
+        return None
+
+
+def _status_error(status_code: int) -> str:
+    """User-facing message for a failed API response"""
+    if status_code == 401:
+        return "Error: Invalid API key. Please check your mistral_api_key configuration."
+    elif status_code == 403:
+        return "Error: API key does not have access. Please verify your subscription."
+    return f"Error: API request failed with status {status_code}"
+
+
 class MistralLLM(LLM):
     """Custom LLM wrapper for Mistral API"""
     
-    api_key: str = os.getenv("mistral_api_key", "")
-    model: str = "openai/gpt-oss-20b"
+    # Read when the instance is built, not frozen at import time
+    api_key: str = Field(default_factory=lambda: os.getenv("mistral_api_key", ""))
+    model: str = MISTRAL_MODEL
     temperature: float = 0.7
     max_tokens: int = 1000
     
@@ -33,15 +102,8 @@ class MistralLLM(LLM):
     def _llm_type(self) -> str:
         return "mistral_gpt_oss"
     
-    def _call(
-        self,
-        prompt: str,
-        stop: List[str] | None = None,
-        run_manager: CallbackManagerForLLMRun | None = None,
-        **kwargs: Any,
-    ) -> str:
-        """Call Mistral API with SSE streaming support"""
-        url = "https://platform.qubrid.com/api/v1/qubridai/chat/completions"
+    def _request(self, prompt: str) -> tuple:
+        """Build the (headers, body) pair for a chat completion request"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -54,53 +116,93 @@ class MistralLLM(LLM):
             "max_tokens": self.max_tokens,
             "stream": False
         }
+        return headers, data
+    
+    def _call(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Call Mistral API with SSE streaming support"""
+        headers, data = self._request(prompt)
         
         try:
             if not self.api_key or self.api_key.strip() == "":
                 return "Error: API key not configured. Please set mistral_api_key environment variable."
             
-            response = requests.post(url, headers=headers, json=data, timeout=60)
-            response.raise_for_status()
-            
-            # Handle SSE streaming
-            if 'text/event-stream' in response.headers.get('Content-Type', ''):
-                full_content = ""
-                for line in response.text.split('\n'):
-                    if line.startswith('data: '):
-                        data_str = line[6:].strip()
-                        if data_str and data_str != '[DONE]':
-                            try:
-                                chunk = json.loads(data_str)
-                                if "choices" in chunk and len(chunk["choices"]) > 0:
-                                    content = chunk["choices"][0].get("delta", {}).get("content", "")
-                                    if content:
-                                        full_content += content
-                            except json.JSONDecodeError:
-                                continue
-                return full_content if full_content else "No response generated"
-            else:
-                result = response.json()
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                return "No response generated"
+            with requests.post(MISTRAL_API_URL, headers=headers, json=data, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                # Handle SSE streaming, parsing each line as it arrives instead of buffering the body;
+                # lines stay bytes (SSE is UTF-8, decoded per token by the JSON parser)
+                if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                    chunks: List[str] = []
+                    for line in response.iter_lines():
+                        content = parse_sse_line(line)
+                        if content is SSE_DONE:
+                            break
+                        if content:
+                            chunks.append(content)
+                    return "".join(chunks) if chunks else "No response generated"
+                else:
+                    return parse_json_completion(response.content) or "No response generated"
                 
         except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid API key. Please check your mistral_api_key configuration."
-            elif e.response.status_code == 403:
-                return "Error: API key does not have access. Please verify your subscription."
-            return f"Error: API request failed with status {e.response.status_code}"
+            return _status_error(e.response.status_code)
         except requests.exceptions.Timeout:
             return "Error: API request timed out. Please try again."
         except Exception as e:
             return f"Error: {str(e)}"
+    
+    async def _acall(
+        self,
+        prompt: str,
+        stop: List[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Async variant of _call on the shared keep-alive client, so it never blocks the event loop"""
+        headers, data = self._request(prompt)
+        
+        try:
+            if not self.api_key or self.api_key.strip() == "":
+                return "Error: API key not configured. Please set mistral_api_key environment variable."
+            
+            client = await _ASYNC_CLIENT.get()
+            async with client.stream("POST", MISTRAL_API_URL, headers=headers, json=data) as response:
+                response.raise_for_status()
+                
+                # Handle SSE streaming, parsing each line as it arrives
+                if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                    chunks: List[str] = []
+                    async for line in response.aiter_lines():
+                        content = parse_sse_line(line.encode())
+                        if content is SSE_DONE:
+                            break
+                        if content:
+                            chunks.append(content)
+                    return "".join(chunks) if chunks else "No response generated"
+                
+                return parse_json_completion(await response.aread()) or "No response generated"
+                
+        except httpx.HTTPStatusError as e:
+            return _status_error(e.response.status_code)
+        except httpx.TimeoutException:
+            return "Error: API request timed out. Please try again."
+        except Exception as e:
+            return f"Error: {str(e)}"
 
 
 class TourismAgentWithTools:
     """Tourism agent that uses tools and returns structured output"""
     
-    def __init__(self):
-        self.llm = MistralLLM()
+    def __init__(self, api_key: Optional[str] = None, llm: Optional[MistralLLM] = None):
+        # An injected llm (e.g. one shared across tests or batch jobs) takes precedence over api_key
+        if llm is None:
+            llm = MistralLLM(api_key=api_key) if api_key is not None else MistralLLM()
+        self.llm = llm
         self.output_parser = tourism_output_parser
         
         # Create prompt template with format instructions
@@ -128,26 +230,28 @@ Your response:""",
     
     def extract_place_name(self, query: str) -> str:
         """Extract place name from query - handles natural language and simple place names"""
-        # Enhanced patterns for more natural language
-        patterns = [
-            r"(?:trip to|go(?:ing)? to|visit(?:ing)?|plan.*to)\s+([A-Z][a-zA-Z\s]+?)(?:\s+plan|\s+and|\s*,|\s*$)",
-            r"(?:in|at|for)\s+([A-Z][a-zA-Z\s]+?)(?:\s*,|\s*\?|\s*\.|\s+let|\s+what|\s+and|$)",
-            r"([A-Z][a-zA-Z\s]+?)(?:\s+let\'s|\s+what|\s+temperature|\s+weather|\s+places)",
-        ]
+        # Fast path: the query is already a place name (the frontend usually sends just that)
+        place = query.strip()
+        if (place and place[0].isupper() and place.count(' ') <= 2 and place.replace(' ', '').isalpha()
+                and _PATTERN_WORDS.isdisjoint(place.lower().split())):
+            return place
+        
+        # Named entity recognition handles phrasing the patterns miss, when spaCy is available
+        nlp = _ner()
+        if nlp is not None:
+            for ent in nlp(query).ents:
+                if ent.label_ in _PLACE_LABELS:
+                    return ent.text.strip()
         
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in _PLACE_PATTERNS:
+            match = pattern.search(query)
             if match:
                 place = match.group(1).strip()
                 # Capitalize first letter of each word
                 return ' '.join(word.capitalize() for word in place.split())
         
-        # If query is just a place name (single or multiple capitalized words)
-        words = query.strip().split()
-        if len(words) <= 3 and all(word[0].isupper() or word.lower() in ['and', 'the'] for word in words if word):
-            return query.strip()
-        
         # Fallback: find capitalized words in the query
+        words = query.strip().split()
         for i, word in enumerate(words):
             if word and len(word) > 1 and word[0].isupper() and word.lower() not in ['i', 'hey', 'what', 'and', 'the', 'is', 'are', 'am']:
                 place_parts = [word]
@@ -161,14 +265,14 @@ Your response:""",
         return ""
     
     def determine_intent(self, query: str) -> Dict[str, bool]:
-        """Determine what information user wants"""
-        query_lower = query.lower()
-        
-        weather_kw = ["weather", "temperature", "temp", "hot", "cold", "rain", "precipitation", "climate", "degrees"]
-        places_kw = ["place", "places", "visit", "attraction", "tourist", "sightseeing", "trip", "plan", "go", "see", "explore"]
+        """
+        Determine what information user wants
         
-        needs_weather = any(kw in query_lower for kw in weather_kw)
-        needs_places = any(kw in query_lower for kw in places_kw)
+        Note: _arun does not call this yet - it always fetches both weather and places, since the
+        frontend usually sends a bare place name that matches no keyword.
+        """
+        needs_weather = _WEATHER_RE.search(query) is not None
+        needs_places = _PLACES_RE.search(query) is not None
         
         if not needs_weather and not needs_places:
             needs_places = True
@@ -186,118 +290,159 @@ Your response:""",
         Returns:
             TourismResponse with weather and places data
         """
-        try:
-            if not user_query or not user_query.strip():
-                return TourismResponse(
-                    place="Unknown",
-                    success=False,
-                    message="Please provide a query or place name.",
-                    error="Empty query"
-                )
-            
-            # Extract place name from natural language query
-            place_name = self.extract_place_name(user_query)
-            
-            if not place_name:
-                return TourismResponse(
-                    place="Unknown",
-                    success=False,
-                    message="I couldn't identify which place you're asking about. Please mention a place name.",
-                    error="No place name found in query"
-                )
+        return asyncio.run(self.arun(user_query))
+    
+    async def arun(self, user_query: str) -> TourismResponse:
+        """
+        Async variant of run for callers that already have an event loop (e.g. FastAPI handlers)
+        
+        Args:
+            user_query: Natural language query or place name
             
-            # Initialize response - always get both weather and places
-            # Get coordinates for the main location first
-            geo_result = get_coordinates.invoke({"place_name": place_name})
+        Returns:
+            TourismResponse with weather and places data
+        """
+        with turn_scope():
+            return await self._arun(user_query)
+    
+    def batch_run(self, queries: List[str], max_concurrency: int = 16) -> List[TourismResponse]:
+        """Blocking wrapper around abatch_run for sync callers"""
+        return asyncio.run(self.abatch_run(queries, max_concurrency))
+    
+    async def abatch_run(self, queries: List[str], max_concurrency: int = 16) -> List[TourismResponse]:
+        """
+        Process many queries concurrently; repeated queries are only run once
+        
+        Args:
+            queries: Natural language queries or place names
+            max_concurrency: Most queries processed at the same time
             
-            response = TourismResponse(
+        Returns:
+            One TourismResponse per query, in the same order
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(query: str) -> TourismResponse:
+            async with limit:
+                return await self.arun(query)
+        
+        unique = list(dict.fromkeys(queries))
+        results = dict(zip(unique, await asyncio.gather(*(bounded(query) for query in unique))))
+        return [results[query] for query in queries]
+    
+    async def _arun(self, user_query: str) -> TourismResponse:
+        """Body of arun, run inside the turn's geocoding memo"""
+        if not user_query or not user_query.strip():
+            return TourismResponse(
+                place="Unknown",
+                success=False,
+                message="Please provide a query or place name.",
+                error="Empty query"
+            )
+        
+        # Extract place name from natural language query; spaCy inference (and its model load on
+        # first use) is blocking, so with spaCy installed the extraction runs in a worker thread
+        if spacy is None:
+            place_name = self.extract_place_name(user_query)
+        else:
+            place_name = await asyncio.to_thread(self.extract_place_name, user_query)
+        
+        if not place_name:
+            return TourismResponse(
+                place="Unknown",
+                success=False,
+                message="I couldn't identify which place you're asking about. Please mention a place name.",
+                error="No place name found in query"
+            )
+        
+        # Initialize response - always get both weather and places
+        # One geocode, then the weather and places lookups run concurrently; that geocode also
+        # supplies the main place's coordinates, so no separate lookup is made for them
+        try:
+            geo_result, weather_report, places_report = await fetch_all(place_name)
+        except (httpx.HTTPError, ValueError, KeyError) as e:  # API failures already come back as reports
+            return TourismResponse(
                 place=place_name,
-                has_weather=True,
-                has_places=True,
-                success=True,
-                message="",
-                latitude=geo_result.get("latitude") if geo_result.get("success") else None,
-                longitude=geo_result.get("longitude") if geo_result.get("success") else None
+                success=False,
+                message="I encountered an error processing your request.",
+                error=str(e)
             )
+        
+        # Fields are collected in a plain dict and validated once, when the response is built
+        data: Dict[str, Any] = {
+            "place": place_name,
+            "has_weather": True,
+            "has_places": True,
+            "success": True,
+            "message": "",
+            "latitude": geo_result.get("latitude") if geo_result.get("success") else None,
+            "longitude": geo_result.get("longitude") if geo_result.get("success") else None
+        }
+        
+        message_parts = []
+        
+        # Get weather information (same text the get_weather tool returns)
+        weather_result = weather_report.message
+        
+        if "°C" in weather_result and "currently" in weather_result:
+            weather_match = _WEATHER_PARSE.search(weather_result)
             
-            message_parts = []
-            
-            # Get weather information
-            weather_result = get_weather.invoke({"place_name": place_name})
-            
-            if "°C" in weather_result and "currently" in weather_result:
-                temp_match = re.search(r'(\d+\.?\d*)°C', weather_result)
-                precip_match = re.search(r'(\d+)%', weather_result)
-                
-                if temp_match:
-                    response.temperature = float(temp_match.group(1))
-                if precip_match:
-                    response.precipitation_chance = int(precip_match.group(1))
-                
-                message_parts.append(weather_result)
-            elif "don't know" in weather_result.lower():
-                response.success = False
-                response.error = weather_result
-                return response
-            
-            # Get places information
-            places_result = get_tourist_places.invoke({"place_name": place_name})
+            if weather_match:
+                data["temperature"] = float(weather_match["temp"])
+                if weather_match["precip"]:
+                    data["precipitation_chance"] = int(weather_match["precip"])
             
-            if "these are the places you can go" in places_result:
-                # Split by COORDS marker if present
-                parts = places_result.split('COORDS:')
-                main_text = parts[0]
-                
-                lines = main_text.split('\n')[1:]
-                response.attractions = [line.strip() for line in lines if line.strip()]
-                
-                # Parse coordinates if available
-                if len(parts) > 1:
-                    from schemas import AttractionWithCoords
-                    coords_lines = parts[1].strip().split('\n')
-                    response.attractions_with_coords = []
-                    for coord_line in coords_lines:
-                        if '|' in coord_line:
-                            try:
-                                name, lat, lon = coord_line.split('|')
-                                response.attractions_with_coords.append(
-                                    AttractionWithCoords(
-                                        name=name.strip(),
-                                        latitude=float(lat),
-                                        longitude=float(lon)
-                                    )
-                                )
-                            except:
-                                pass
-                
-                message_parts.append(main_text.strip())
-            elif "don't know" in places_result.lower():
-                response.success = False
-                response.error = places_result
-                return response
-            elif "couldn't find" in places_result.lower():
-                response.attractions = []
-                message_parts.append(places_result)
+            message_parts.append(weather_result)
+        elif "don't know" in weather_result.lower():
+            return TourismResponse(**{**data, "success": False, "error": weather_result})
+        
+        # Get places information (same text the get_tourist_places tool returns)
+        places_result = places_report.tool_output
+        
+        if "these are the places you can go" in places_result:
+            # Split by COORDS marker if present
+            parts = places_result.split('COORDS:')
+            main_text = parts[0]
             
-            # Combine messages
-            if len(message_parts) == 2:
-                response.message = f"{message_parts[0]} And {message_parts[1]}"
-            elif len(message_parts) == 1:
-                response.message = message_parts[0]
-            else:
-                response.message = f"Information for {place_name}"
+            lines = main_text.split('\n')[1:]
+            data["attractions"] = [line.strip() for line in lines if line.strip()]
             
-            return response
+            # Parse coordinates if available (one name|lat|lon line per attraction)
+            if len(parts) > 1:
+                items = []
+                for coord_line in parts[1].splitlines():
+                    if coord_line.count('|') != 2:
+                        continue
+                    name, lat, lon = coord_line.split('|', 2)
+                    try:
+                        latitude, longitude = float(lat), float(lon)
+                    except ValueError:
+                        continue
+                    items.append(AttractionWithCoords(name=name.strip(), latitude=latitude, longitude=longitude))
+                data["attractions_with_coords"] = items
             
-        except Exception as e:
-            return TourismResponse(
-                place=place_name if 'place_name' in locals() and place_name else "Unknown",
-                success=False,
-                message="I encountered an error processing your request.",
-                error=str(e)
-            )
+            message_parts.append(main_text.strip())
+        elif "don't know" in places_result.lower():
+            return TourismResponse(**{**data, "success": False, "error": places_result})
+        elif "couldn't find" in places_result.lower():
+            data["attractions"] = []
+            message_parts.append(places_result)
+        
+        # Combine messages
+        if len(message_parts) == 2:
+            data["message"] = f"{message_parts[0]} And {message_parts[1]}"
+        elif len(message_parts) == 1:
+            data["message"] = message_parts[0]
+        else:
+            data["message"] = f"Information for {place_name}"
+        
+        return TourismResponse(**data)
 
 
-def create_tourism_agent_with_tools():
-    """Create tourism agent instance"""
-    return TourismAgentWithTools()
+@functools.lru_cache(maxsize=4)
+def create_tourism_agent_with_tools(api_key: Optional[str] = None):
+    """
+    Create tourism agent instance (api_key defaults to the mistral_api_key environment variable).
+    The agent keeps no per-query state, so one instance per key is built and shared.
+    """
+    return TourismAgentWithTools(api_key=api_key)